@@ -0,0 +1,80 @@
+"""
+Column schema throughput benchmark.
+
+Compares validation throughput of fast-path column schemas built by
+``column_schema_builder`` with plain goodboy schemas they replace, for values
+of exact expected type and for strings with type casting.
+
+Usage::
+
+    python benchmarks/column_schemas.py [--number 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import timeit
+from datetime import date, datetime
+from decimal import Decimal
+
+import goodboy as gb
+import sqlalchemy as sa
+
+COLUMNS = [
+    (sa.Integer(), gb.Int, 42, "42"),
+    (sa.Float(), gb.Float, 4.2, "4.2"),
+    (sa.Numeric(10, 2), gb.DecimalSchema, Decimal("4.20"), "4.20"),
+    (sa.Date(), gb.Date, date(2020, 1, 2), "2020-01-02"),
+    (sa.DateTime(), gb.DateTime, datetime(2020, 1, 2, 3, 4), "2020-01-02T03:04:00"),
+]
+
+
+def throughput(schema, value, typecast: bool, number: int) -> float:
+    if schema(value, typecast=typecast) is None:
+        raise AssertionError(f"{value!r}: unexpected result")
+
+    # the best of several runs is the least affected by other processes
+    elapsed = min(
+        timeit.repeat(lambda: schema(value, typecast=typecast), number=number, repeat=5)
+    )
+
+    return number / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100000)
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
+
+    from goodboy_sqlalchemy.column_schemas import column_schema_builder
+
+    print(f"{'type':<12}{'input':<10}{'goodboy/s':>14}{'fast/s':>14}{'speedup':>10}")
+
+    for sa_type, schema_class, value, string in COLUMNS:
+        sa_column = sa.Column("value", sa_type, nullable=False)
+        fast_schema = column_schema_builder.build(sa_column)
+        # same options, without the fast path
+        schema = schema_class.__new__(schema_class)
+        schema.__dict__.update(fast_schema.__dict__)
+
+        for input_name, input_value, typecast in [
+            ("exact", value, False),
+            ("string", string, True),
+        ]:
+            baseline = throughput(schema, input_value, typecast, args.number)
+            fast = throughput(fast_schema, input_value, typecast, args.number)
+
+            print(
+                f"{type(sa_type).__name__:<12}{input_name:<10}"
+                f"{baseline:>14.0f}{fast:>14.0f}{fast / baseline:>9.2f}x"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Concurrency stress benchmark.
+
+Validates payloads with a single ``Mapped`` schema shared by all threads of a
+``ThreadPoolExecutor`` (each thread uses its own session of a file SQLite
+database), checks that every result is correct and reports throughput for each
+number of threads. On free-threaded Python builds throughput is expected to
+scale with the number of threads, on builds with GIL it shows contention only.
+
+Usage::
+
+    python benchmarks/concurrency.py [--payloads 20000] [--threads 1,2,4,8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import goodboy as gb
+import sqlalchemy as sa
+import sqlalchemy.orm
+
+Base = sa.orm.declarative_base()
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String(32), nullable=False)
+    email = sa.Column(sa.String, unique=True)
+    age = sa.Column(sa.Integer)
+
+
+def payload(i: int) -> dict:
+    if i % 10 == 0:
+        return {"name": "x" * 40, "email": f"user{i}@example.com"}
+
+    if i % 10 == 1:
+        return {"name": "taken", "email": "taken@example.com"}
+
+    return {"name": f"user{i}", "email": f"user{i}@example.com", "age": str(i)}
+
+
+def expected_result(i: int):
+    if i % 10 == 0:
+        return gb.Error(
+            "value_errors",
+            nested_errors={"name": [gb.Error("string_too_long", {"value": 32})]},
+        )
+
+    if i % 10 == 1:
+        return gb.Error(
+            "value_errors", nested_errors={"email": [gb.Error("already_exists")]}
+        )
+
+    return {"name": f"user{i}", "email": f"user{i}@example.com", "age": i}
+
+
+def run(schema, Session, payloads: int, threads: int) -> float:
+    local = threading.local()
+
+    def validate(i: int):
+        if not hasattr(local, "session"):
+            local.session = Session()
+
+        try:
+            return schema(payload(i), typecast=True, context={"session": local.session})
+        except gb.SchemaError as e:
+            (error,) = e.errors
+            return error
+
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(threads) as executor:
+        results = list(executor.map(validate, range(payloads), chunksize=64))
+
+    elapsed = time.perf_counter() - started
+
+    for i, result in enumerate(results):
+        if result != expected_result(i):
+            raise AssertionError(f"payload {i}: unexpected result {result!r}")
+
+    return payloads / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--payloads", type=int, default=20000)
+    parser.add_argument("--threads", default="1,2,4,8")
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
+
+    from goodboy_sqlalchemy import Mapped
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]}, GIL {'on' if is_gil_enabled else 'off'}")
+
+    with tempfile.TemporaryDirectory() as path:
+        engine = sa.create_engine(
+            f"sqlite:///{os.path.join(path, 'benchmark.db')}",
+            connect_args={"check_same_thread": False},
+            pool_size=32,
+        )
+        Base.metadata.create_all(engine)
+
+        with engine.begin() as connection:
+            connection.execute(
+                sa.insert(User).values(name="taken", email="taken@example.com")
+            )
+
+        Session = sa.orm.sessionmaker(engine)
+        schema = Mapped(User, column_names=["name", "email", "age"])
+        schema.warmup(engine)
+
+        baseline = None
+
+        for threads in [int(t) for t in args.threads.split(",")]:
+            throughput = run(schema, Session, args.payloads, threads)
+            baseline = baseline or throughput
+            print(
+                f"{threads:>3} threads {throughput:>10.0f} payloads/s"
+                f"  x{throughput / baseline:.2f}"
+            )
+
+        engine.dispose()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Import time benchmark.
+
+Runs ``python -X importtime`` in a fresh interpreter for each scenario and reports
+the cumulative import time of the top-level modules imported by the scenario
+(modules imported by interpreter startup are excluded). Use ``--max-package-us`` to
+fail when plain ``import goodboy_sqlalchemy`` becomes slower than the threshold
+(for example, when a submodule is imported eagerly again).
+
+Usage::
+
+    python benchmarks/import_time.py [--repeat 5] [--max-package-us 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "package": "import goodboy_sqlalchemy",
+    "mapped": "import goodboy_sqlalchemy; goodboy_sqlalchemy.Mapped",
+    "sqlalchemy": "import sqlalchemy.orm",
+}
+
+
+def measure(code: str) -> dict[str, int]:
+    src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+    env = {**os.environ, "PYTHONPATH": src_path}
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    result: dict[str, int] = {}
+
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative, module = line.split("|")
+
+        if cumulative.strip().isdigit() and not module.startswith("  "):
+            result[module.strip()] = int(cumulative)
+
+    return result
+
+
+def import_time(code: str, startup_modules: set[str]) -> int:
+    times = measure(code)
+    return sum(t for m, t in times.items() if m not in startup_modules)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-package-us", type=int, default=None)
+    args = parser.parse_args()
+
+    package_times = []
+    startup_modules = set(measure("pass"))
+
+    for name, code in SCENARIOS.items():
+        totals = []
+
+        for _ in range(args.repeat):
+            totals.append(import_time(code, startup_modules))
+
+        median = int(statistics.median(totals))
+        print(f"{name:<12} {median:>10} us  ({code})")
+
+        if name == "package":
+            package_times = totals
+
+    if args.max_package_us is not None:
+        median = statistics.median(package_times)
+
+        if median > args.max_package_us:
+            print(f"package import is too slow: {median} us > {args.max_package_us} us")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,30 +1,129 @@
-from goodboy_sqlalchemy.column import Column, ColumnBuilder, ColumnBuilderError
-from goodboy_sqlalchemy.column_schemas import (
-    ColumnSchemaBuilder,
-    ColumnSchemaBuilderError,
-    column_schema_builder,
-)
-from goodboy_sqlalchemy.mapped import (
-    Mapped,
-    MappedError,
-    MappedKeyBuilder,
-    mapped_key_builder,
-)
-from goodboy_sqlalchemy.messages import DEFAULT_MESSAGES
+from __future__ import annotations
+
+from importlib import import_module
+
+# Avoid importing typing at runtime, it's the most expensive import left here.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from goodboy_sqlalchemy.batch import (
+        BatchAbortedError,
+        CompactErrorSink,
+        Deduplicator,
+        ErrorSink,
+        ListErrorSink,
+        SummaryErrorSink,
+    )
+    from goodboy_sqlalchemy.binary import Binary
+    from goodboy_sqlalchemy.column import Column, ColumnBuilder, ColumnBuilderError
+    from goodboy_sqlalchemy.column_schemas import (
+        ColumnSchemaBuilder,
+        ColumnSchemaBuilderError,
+        column_schema_builder,
+    )
+    from goodboy_sqlalchemy.concurrent_checks import ConcurrentChecks
+    from goodboy_sqlalchemy.deadline import (
+        DeadlineExceeded,
+        install_statement_timeouts,
+    )
+    from goodboy_sqlalchemy.json_value import JSONValue
+    from goodboy_sqlalchemy.loader import Loader
+    from goodboy_sqlalchemy.mapped import (
+        Mapped,
+        MappedError,
+        MappedInstanceProxy,
+        MappedKeyBuilder,
+        mapped_key_builder,
+    )
+    from goodboy_sqlalchemy.messages import DEFAULT_MESSAGES
+    from goodboy_sqlalchemy.relationship import Relationship
+    from goodboy_sqlalchemy.sharding import ShardedChecks
+    from goodboy_sqlalchemy.snapshot import SchemaSnapshot, SnapshotError
+    from goodboy_sqlalchemy.table import TableSchema, TableSchemaError
 
 __version__ = "0.2.4"
 
 __all__ = [
+    "BatchAbortedError",
+    "Binary",
     "column_schema_builder",
     "Column",
     "ColumnBuilder",
     "ColumnBuilderError",
     "ColumnSchemaBuilder",
     "ColumnSchemaBuilderError",
+    "CompactErrorSink",
+    "ConcurrentChecks",
+    "DeadlineExceeded",
+    "Deduplicator",
     "DEFAULT_MESSAGES",
+    "ErrorSink",
+    "install_statement_timeouts",
+    "JSONValue",
+    "ListErrorSink",
+    "Loader",
     "mapped_key_builder",
     "Mapped",
     "MappedError",
     "MappedInstanceProxy",
     "MappedKeyBuilder",
+    "Relationship",
+    "SchemaSnapshot",
+    "ShardedChecks",
+    "SnapshotError",
+    "SummaryErrorSink",
+    "TableSchema",
+    "TableSchemaError",
 ]
+
+# Submodules import SQLAlchemy (and goodboy_sqlalchemy.column_schemas resolves
+# dialect types), so public names are loaded on first access instead of on
+# ``import goodboy_sqlalchemy``.
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "BatchAbortedError": "goodboy_sqlalchemy.batch",
+    "Binary": "goodboy_sqlalchemy.binary",
+    "column_schema_builder": "goodboy_sqlalchemy.column_schemas",
+    "Column": "goodboy_sqlalchemy.column",
+    "ColumnBuilder": "goodboy_sqlalchemy.column",
+    "ColumnBuilderError": "goodboy_sqlalchemy.column",
+    "ColumnSchemaBuilder": "goodboy_sqlalchemy.column_schemas",
+    "ColumnSchemaBuilderError": "goodboy_sqlalchemy.column_schemas",
+    "CompactErrorSink": "goodboy_sqlalchemy.batch",
+    "ConcurrentChecks": "goodboy_sqlalchemy.concurrent_checks",
+    "DeadlineExceeded": "goodboy_sqlalchemy.deadline",
+    "Deduplicator": "goodboy_sqlalchemy.batch",
+    "DEFAULT_MESSAGES": "goodboy_sqlalchemy.messages",
+    "ErrorSink": "goodboy_sqlalchemy.batch",
+    "install_statement_timeouts": "goodboy_sqlalchemy.deadline",
+    "JSONValue": "goodboy_sqlalchemy.json_value",
+    "ListErrorSink": "goodboy_sqlalchemy.batch",
+    "Loader": "goodboy_sqlalchemy.loader",
+    "mapped_key_builder": "goodboy_sqlalchemy.mapped",
+    "Mapped": "goodboy_sqlalchemy.mapped",
+    "MappedError": "goodboy_sqlalchemy.mapped",
+    "MappedInstanceProxy": "goodboy_sqlalchemy.mapped",
+    "MappedKeyBuilder": "goodboy_sqlalchemy.mapped",
+    "Relationship": "goodboy_sqlalchemy.relationship",
+    "SchemaSnapshot": "goodboy_sqlalchemy.snapshot",
+    "ShardedChecks": "goodboy_sqlalchemy.sharding",
+    "SnapshotError": "goodboy_sqlalchemy.snapshot",
+    "SummaryErrorSink": "goodboy_sqlalchemy.batch",
+    "TableSchema": "goodboy_sqlalchemy.table",
+    "TableSchemaError": "goodboy_sqlalchemy.table",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
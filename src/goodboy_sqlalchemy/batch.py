@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import datetime
+import hashlib
+import uuid
+from abc import ABC, abstractmethod
+from array import array
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Tuple, Union
+
+import goodboy as gb
+
+from goodboy_sqlalchemy.stats import Counters
+
+if TYPE_CHECKING:
+    from goodboy_sqlalchemy.mapped import Mapped
+
+ErrorPath = Tuple[Union[str, int], ...]
+
+_NESTED_ERROR_CODES = ("key_errors", "value_errors")
+
+# Exact types only: subclasses may validate differently with the same repr
+_SCALAR_TYPES = frozenset(
+    [
+        str,
+        int,
+        float,
+        bool,
+        type(None),
+        bytes,
+        Decimal,
+        datetime.date,
+        datetime.datetime,
+        datetime.time,
+        uuid.UUID,
+    ]
+)
+
+
+class BatchAbortedError(Exception):
+    pass
+
+
+class ErrorSink(ABC):
+    """
+    Receives errors of rows validated with ``Mapped.validate_many``.
+    """
+
+    def __init__(self):
+        self.error_count = 0
+
+    def add(self, index: int, errors: list[gb.Error]) -> None:
+        self.error_count += 1
+        self._add(index, errors)
+
+    @abstractmethod
+    def _add(self, index: int, errors: list[gb.Error]) -> None: ...
+
+
+class ListErrorSink(ErrorSink):
+    """
+    Keeps all errors by row index.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.errors: dict[int, list[gb.Error]] = {}
+
+    def _add(self, index: int, errors: list[gb.Error]) -> None:
+        self.errors[index] = errors
+
+
+class SummaryErrorSink(ErrorSink):
+    """
+    Counts errors by key path and error code, keeping indices of a few sample
+    rows for each of them. Memory usage doesn't depend on number of rows.
+    """
+
+    def __init__(self, max_samples: int = 5):
+        super().__init__()
+        self.max_samples = max_samples
+        self.counts: dict[tuple[ErrorPath, str], int] = {}
+        self.samples: dict[tuple[ErrorPath, str], list[int]] = {}
+
+    def _add(self, index: int, errors: list[gb.Error]) -> None:
+        for path, code in flatten_errors(errors):
+            key = (path, code)
+            self.counts[key] = self.counts.get(key, 0) + 1
+            samples = self.samples.setdefault(key, [])
+
+            if len(samples) < self.max_samples and index not in samples:
+                samples.append(index)
+
+
+class CompactErrorSink(ErrorSink):
+    """
+    Stores each error as a pair of row index and id of (key path, error code)
+    in typed arrays, about 12 bytes per error.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.indices = array("q")
+        self.error_ids = array("I")
+        self.error_keys: list[tuple[ErrorPath, str]] = []
+        self._error_key_ids: dict[tuple[ErrorPath, str], int] = {}
+
+    def _add(self, index: int, errors: list[gb.Error]) -> None:
+        for error_key in flatten_errors(errors):
+            error_id = self._error_key_ids.get(error_key)
+
+            if error_id is None:
+                error_id = len(self.error_keys)
+                self.error_keys.append(error_key)
+                self._error_key_ids[error_key] = error_id
+
+            self.indices.append(index)
+            self.error_ids.append(error_id)
+
+    def __iter__(self) -> Iterator[tuple[int, ErrorPath, str]]:
+        for index, error_id in zip(self.indices, self.error_ids):
+            path, code = self.error_keys[error_id]
+            yield index, path, code
+
+
+class Deduplicator:
+    """
+    Validates rows of a batch with ``Mapped.validate_many``, each distinct
+    payload (see :func:`payload_digest`) once, and gives its outcome to the
+    identical payloads, counted by ``duplicate_rows`` counter of :attr:`stats`.
+
+    A duplicate of an invalid row gets the same errors. A duplicate of a valid
+    row gets errors of :meth:`Mapped.duplicate_errors` (``already_exists`` for
+    values of unique columns, as inserting both rows would fail), or a copy of
+    the result, yielded after it. Rules and column schemas must not depend on
+    anything but the payload.
+
+    Memory use grows with the number of distinct payloads of a batch.
+    """
+
+    def __init__(self, schema: Mapped):
+        self._schema = schema
+        self.stats = Counters("duplicate_rows")
+
+    def validate_many(
+        self,
+        values: Iterable[Any],
+        *,
+        errors: ErrorSink,
+        max_errors: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Iterator[tuple[int, dict]]:
+        """
+        Validate values like ``Mapped.validate_many`` does, with the same
+        arguments.
+        """
+
+        batch = _DistinctRows(self._schema, self.stats, errors, max_errors)
+        results = self._schema.validate_many(
+            batch.distinct_values(values),
+            errors=batch,
+            max_errors=max_errors,
+            **kwargs,
+        )
+
+        for distinct_index, result in results:
+            yield from batch.resolve(distinct_index, result)
+
+        yield from batch.pop_valid()
+
+
+class _DistinctRow:
+    __slots__ = ("index", "resolved", "errors", "result", "duplicates")
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.resolved = False
+        self.errors: list[gb.Error] = []
+        self.result: Optional[dict] = None
+        # indices of identical rows waiting for outcome
+        self.duplicates: list[int] = []
+
+
+class _DistinctRows(ErrorSink):
+    """
+    Error sink of distinct rows of a :class:`Deduplicator` batch, which gives
+    errors of each row to the identical rows too.
+    """
+
+    def __init__(
+        self,
+        schema: Mapped,
+        stats: Counters,
+        errors: ErrorSink,
+        max_errors: Optional[int],
+    ):
+        super().__init__()
+        self._schema = schema
+        self._stats = stats
+        self._errors = errors
+        self._max_errors = max_errors
+        # rows by index among distinct rows
+        self._rows: list[_DistinctRow] = []
+        # results of duplicates of valid rows, to be yielded
+        self._valid: list[tuple[int, dict]] = []
+
+    def distinct_values(self, values: Iterable[Any]) -> Iterator[Any]:
+        rows_by_digest: dict[bytes, _DistinctRow] = {}
+
+        for index, value in enumerate(values):
+            digest = payload_digest(value)
+            row = rows_by_digest.get(digest) if digest else None
+
+            if row is None:
+                row = _DistinctRow(index)
+                self._rows.append(row)
+
+                if digest:
+                    rows_by_digest[digest] = row
+
+                yield value
+            else:
+                self._stats.increment("duplicate_rows")
+
+                if row.resolved:
+                    self._fan_out(row, [index])
+                else:
+                    row.duplicates.append(index)
+
+    def add(self, index: int, errors: list[gb.Error]) -> None:
+        # rows are counted by the sink of the batch, with duplicates
+        self._add(index, errors)
+        self.error_count = self._errors.error_count
+
+    def _add(self, index: int, errors: list[gb.Error]) -> None:
+        row = self._rows[index]
+        row.errors = errors
+        self._add_errors(row.index, errors)
+        self._resolve(row)
+
+    def resolve(self, index: int, result: dict) -> list[tuple[int, dict]]:
+        row = self._rows[index]
+        row.errors = self._schema.duplicate_errors(result)
+
+        if not row.errors:
+            row.result = result
+
+        self._valid.append((row.index, result))
+        self._resolve(row)
+
+        return self.pop_valid()
+
+    def pop_valid(self) -> list[tuple[int, dict]]:
+        valid, self._valid = self._valid, []
+        return valid
+
+    def _resolve(self, row: _DistinctRow) -> None:
+        row.resolved = True
+        duplicates, row.duplicates = row.duplicates, []
+        self._fan_out(row, duplicates)
+
+    def _fan_out(self, row: _DistinctRow, indices: list[int]) -> None:
+        for index in indices:
+            if row.result is None:
+                self._add_errors(index, row.errors)
+            else:
+                self._valid.append((index, dict(row.result)))
+
+    def _add_errors(self, index: int, errors: list[gb.Error]) -> None:
+        self._errors.add(index, errors)
+
+        if self._max_errors is not None and self._errors.error_count > self._max_errors:
+            raise BatchAbortedError(f"more than {self._max_errors} rows are invalid")
+
+
+def flatten_errors(
+    errors: list[gb.Error], path: ErrorPath = ()
+) -> Iterator[tuple[ErrorPath, str]]:
+    """
+    Iterate over leaf errors as pairs of key path and error code.
+    """
+
+    for error in errors:
+        if error.code in _NESTED_ERROR_CODES and error.nested_errors:
+            for key, nested_errors in error.nested_errors.items():
+                yield from flatten_errors(nested_errors, path + (key,))
+        else:
+            yield path, error.code
+
+
+def payload_digest(value: Any) -> Optional[bytes]:
+    """
+    Hash canonical form of payload: dicts with string keys (in any key order),
+    lists, tuples and scalar values (strings, numbers, booleans, ``None``,
+    bytes, decimals, dates, times and UUIDs), with their types, so ``1``,
+    ``1.0`` and ``True`` differ. Returns ``None`` for payloads with values of
+    other types, which are never treated as duplicates.
+
+    >>> payload_digest({"a": 1, "b": [2]}) == payload_digest({"b": [2], "a": 1})
+    True
+    >>> payload_digest({"a": 1}) == payload_digest({"a": True})
+    False
+    >>> payload_digest({"a": object()}) is None
+    True
+    """
+
+    canonical = _canonicalize(value)
+
+    if canonical is None:
+        return None
+
+    return hashlib.blake2b(repr(canonical).encode(), digest_size=16).digest()
+
+
+def _canonicalize(value: Any) -> Optional[tuple]:
+    value_type = type(value)
+
+    if value_type in _SCALAR_TYPES:
+        return (value_type.__name__, value)
+
+    if value_type is dict:
+        if not all(type(k) is str for k in value):
+            return None
+
+        items = []
+
+        for key in sorted(value):
+            item = _canonicalize(value[key])
+
+            if item is None:
+                return None
+
+            items.append((key, item))
+
+        return ("dict", tuple(items))
+
+    if value_type is list or value_type is tuple:
+        items = []
+
+        for item_value in value:
+            item = _canonicalize(item_value)
+
+            if item is None:
+                return None
+
+            items.append(item)
+
+        return (value_type.__name__, tuple(items))
+
+    return None
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import hashlib
+import io
+from typing import Any, Callable, Optional
+
+import goodboy as gb
+from goodboy.messages import DEFAULT_MESSAGES, MessageCollectionType
+from goodboy.schema import Rule
+
+CHUNK_SIZE = 64 * 1024
+
+DigestCallback = Callable[[Any, str, dict], None]
+
+
+class Binary(gb.SchemaWithUtils):
+    """
+    Accept binary data without copying it: ``bytes``, ``bytearray`` and
+    ``memoryview`` values are returned as is, ``io.BytesIO`` as a view of its
+    buffer. Other file-like objects (with ``read`` method) are read once, from
+    current position, into a single buffer returned as ``memoryview``. All
+    results can be passed to the database driver directly.
+
+    Length of files is checked before reading them, with ``seek``/``tell`` when
+    file is seekable, otherwise reading stops as soon as the limit is exceeded.
+
+    :param allow_none: If true, value is allowed to be ``None``.
+    :param messages: Override error messages.
+    :param rules: Custom validation rules.
+    :param max_length: Max data length in bytes.
+    :param digest: Name of ``hashlib`` algorithm, digest is computed in the same
+        pass as data is read.
+    :param on_digest: Called with result value, hex digest and validation context
+        when digest is computed.
+    """
+
+    def __init__(
+        self,
+        *,
+        allow_none: bool = False,
+        messages: MessageCollectionType = DEFAULT_MESSAGES,
+        rules: list[Rule] = [],
+        max_length: Optional[int] = None,
+        digest: Optional[str] = None,
+        on_digest: Optional[DigestCallback] = None,
+    ):
+        super().__init__(allow_none=allow_none, messages=messages, rules=rules)
+
+        if on_digest is not None and digest is None:
+            raise ValueError("on_digest requires digest algorithm")
+
+        self._max_length = max_length
+        self._digest = digest
+        self._on_digest = on_digest
+
+    def _typecast(
+        self, input: Any, context: dict[str, Any] = {}
+    ) -> tuple[Any, list[gb.Error]]:
+        return input, []
+
+    def _validate(
+        self, value: Any, typecast: bool, context: dict[str, Any] = {}
+    ) -> tuple[Any, list[gb.Error]]:
+        hasher = hashlib.new(self._digest) if self._digest else None
+
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            length = value.nbytes if isinstance(value, memoryview) else len(value)
+
+            if self._max_length is not None and length > self._max_length:
+                return None, [self._too_long_error()]
+
+            if hasher is not None:
+                hasher.update(value)
+        elif isinstance(value, io.BytesIO):
+            start = value.tell()
+            buffer = value.getbuffer()[start:]
+
+            if self._max_length is not None and buffer.nbytes > self._max_length:
+                return None, [self._too_long_error()]
+
+            if hasher is not None:
+                hasher.update(buffer)
+
+            value = buffer
+        elif callable(getattr(value, "read", None)) and not isinstance(
+            value, io.TextIOBase
+        ):
+            value = self._read(value, hasher)
+
+            if value is None:
+                return None, [self._too_long_error()]
+        else:
+            return None, [self._error("unexpected_type", {"expected_type": "bytes"})]
+
+        if hasher is not None and self._on_digest is not None:
+            self._on_digest(value, hasher.hexdigest(), context)
+
+        return self._call_rules(value, typecast, context)
+
+    def _read(self, file: Any, hasher: Any) -> Optional[memoryview]:
+        length = _remaining_length(file)
+
+        if length is not None:
+            if self._max_length is not None and length > self._max_length:
+                return None
+
+            buffer = bytearray(length)
+            view = memoryview(buffer)
+            position = 0
+
+            while position < length:
+                end = min(position + CHUNK_SIZE, length)
+                chunk = view[position:end]
+
+                if hasattr(file, "readinto"):
+                    read = file.readinto(chunk)
+                else:
+                    data = file.read(chunk.nbytes)
+                    read = len(data)
+                    chunk[:read] = data
+
+                if not read:
+                    break
+
+                if hasher is not None:
+                    hasher.update(chunk[:read])
+
+                position += read
+
+            return view[:position]
+
+        buffer = bytearray()
+
+        while True:
+            data = file.read(CHUNK_SIZE)
+
+            if not data:
+                break
+
+            buffer += data
+
+            if self._max_length is not None and len(buffer) > self._max_length:
+                return None
+
+            if hasher is not None:
+                hasher.update(data)
+
+        return memoryview(buffer)
+
+    def _too_long_error(self) -> gb.Error:
+        return self._error("binary_too_long", {"value": self._max_length})
+
+
+def _remaining_length(file: Any) -> Optional[int]:
+    seekable = getattr(file, "seekable", None)
+
+    if seekable is None or not seekable():
+        return None
+
+    position = file.tell()
+    end = file.seek(0, io.SEEK_END)
+    file.seek(position)
+
+    return max(end - position, 0)
@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+import operator
+import re
+from decimal import Decimal
+from typing import Any, Callable, Optional, Tuple
+
+import goodboy as gb
+import sqlalchemy as sa
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import (
+    BinaryExpression,
+    BindParameter,
+    BooleanClauseList,
+    ClauseElement,
+    TextClause,
+)
+
+# Comparison is a pair of operator name and bound value, value is valid when
+# ``value <operator> bound`` is true.
+Comparison = Tuple[str, Any]
+
+_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "in": lambda value, bound: value in bound,
+}
+
+_SA_OPERATORS: dict[Any, str] = {
+    operators.lt: "lt",
+    operators.le: "le",
+    operators.gt: "gt",
+    operators.ge: "ge",
+    operators.eq: "eq",
+    operators.ne: "ne",
+    operators.in_op: "in",
+}
+
+_SQL_OPERATORS = {
+    "<": "lt",
+    "<=": "le",
+    ">": "gt",
+    ">=": "ge",
+    "=": "eq",
+    "<>": "ne",
+    "!=": "ne",
+}
+
+_REVERSED_OPERATORS = {"lt": "gt", "le": "ge", "gt": "lt", "ge": "le"}
+
+_LITERAL = r"-?\d+(?:\.\d+)?|'(?:[^']|'')*'"
+_NAME = r'"?(\w+)"?'
+
+_COMPARISON_RE = re.compile(
+    rf"^{_NAME}\s*(<=|>=|<>|!=|=|<|>)\s*({_LITERAL})$", re.IGNORECASE
+)
+_REVERSED_COMPARISON_RE = re.compile(
+    rf"^({_LITERAL})\s*(<=|>=|<>|!=|=|<|>)\s*{_NAME}$", re.IGNORECASE
+)
+_BETWEEN_RE = re.compile(
+    rf"^{_NAME}\s+BETWEEN\s+({_LITERAL})\s+AND\s+({_LITERAL})$", re.IGNORECASE
+)
+_IN_RE = re.compile(rf"^{_NAME}\s+IN\s*\((.*)\)$", re.IGNORECASE)
+_AND_RE = re.compile(r"\s+AND\s+", re.IGNORECASE)
+_UNSUPPORTED_RE = re.compile(r"\b(OR|NOT)\b", re.IGNORECASE)
+
+# Error codes describe failed value like goodboy numeric schemas do: value that
+# failed ``value >= 0`` check is "less than 0".
+_ERROR_CODES = {
+    "lt": "greater_or_equal_to",
+    "le": "greater_than",
+    "gt": "less_or_equal_to",
+    "ge": "less_than",
+}
+
+
+class CheckRule:
+    """
+    Schema rule enforcing comparisons of a column value extracted from table
+    ``CHECK`` constraints, so rows violating constraints are rejected before
+    flush. Rule depends on the value only (not on validation context).
+    """
+
+    context_free = True
+
+    def __init__(self, comparisons: list[Comparison]):
+        self.comparisons = comparisons
+
+    def __call__(
+        self, schema: gb.SchemaErrorMixin, value: Any, typecast: bool, context: dict
+    ) -> tuple[Any, list[gb.Error]]:
+        errors: list[gb.Error] = []
+
+        for operator_name, bound in self.comparisons:
+            if _OPERATORS[operator_name](value, bound):
+                continue
+
+            if operator_name in _ERROR_CODES:
+                errors.append(
+                    schema._error(_ERROR_CODES[operator_name], {"value": bound})
+                )
+            elif operator_name == "eq":
+                errors.append(schema._error("not_allowed", {"allowed": [bound]}))
+            elif operator_name == "in":
+                errors.append(schema._error("not_allowed", {"allowed": list(bound)}))
+            else:
+                errors.append(schema._error("not_allowed"))
+
+        return value, errors
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return self.__dict__ == other.__dict__
+
+        return super().__eq__(other)
+
+
+def check_constraint_rules(sa_column: sa.Column) -> list[CheckRule]:
+    """
+    Build rules for ``CHECK`` constraints of column table that compare the column
+    with literals: ``<``, ``<=``, ``>``, ``>=``, ``=``, ``<>``, ``BETWEEN`` and
+    ``IN``, combined with ``AND``. Other conditions combined with ``AND`` are
+    skipped, constraints with ``OR`` or ``NOT`` are skipped entirely.
+    """
+
+    table = getattr(sa_column, "table", None)
+
+    if table is None:
+        return []
+
+    python_type = _python_type(sa_column)
+
+    if python_type is None:
+        return []
+
+    result: list[CheckRule] = []
+
+    constraints = [
+        c
+        for c in list(sa_column.constraints) + list(table.constraints)
+        if isinstance(c, sa.CheckConstraint)
+    ]
+
+    for constraint in sorted(constraints, key=lambda c: str(c.sqltext)):
+
+        comparisons = [
+            comparison
+            for comparison in _constraint_comparisons(constraint.sqltext, sa_column)
+            if _matches_type(comparison, python_type)
+        ]
+
+        if comparisons:
+            result.append(CheckRule(comparisons))
+
+    return result
+
+
+def _constraint_comparisons(
+    sqltext: ClauseElement, sa_column: sa.Column
+) -> list[Comparison]:
+    if isinstance(sqltext, TextClause):
+        return _text_comparisons(sqltext.text, sa_column.name)
+
+    return _expression_comparisons(sqltext, sa_column)
+
+
+def _expression_comparisons(
+    expression: ClauseElement, sa_column: sa.Column
+) -> list[Comparison]:
+    if isinstance(expression, BooleanClauseList):
+        if expression.operator is not operators.and_:
+            return []
+
+        result: list[Comparison] = []
+
+        for clause in expression.clauses:
+            result += _expression_comparisons(clause, sa_column)
+
+        return result
+
+    if not isinstance(expression, BinaryExpression) or not _is_column(
+        expression.left, sa_column
+    ):
+        return []
+
+    if expression.operator is operators.between_op:
+        bounds = list(expression.right.clauses)
+
+        if len(bounds) == 2 and all(isinstance(b, BindParameter) for b in bounds):
+            return [("ge", bounds[0].value), ("le", bounds[1].value)]
+
+        return []
+
+    operator_name = _SA_OPERATORS.get(expression.operator)
+
+    if operator_name is None or not isinstance(expression.right, BindParameter):
+        return []
+
+    bound = expression.right.value
+
+    if operator_name == "in":
+        bound = tuple(bound)
+
+    return [(operator_name, bound)]
+
+
+def _text_comparisons(text: str, column_name: str) -> list[Comparison]:
+    text = _strip_parentheses(text)
+
+    if _UNSUPPORTED_RE.search(re.sub(_LITERAL, "", text)):
+        return []
+
+    conjuncts: list[str] = []
+
+    for part in _AND_RE.split(text):
+        # BETWEEN uses AND keyword too
+        if conjuncts and re.search(r"\sBETWEEN\s+\S+$", conjuncts[-1], re.IGNORECASE):
+            conjuncts[-1] += f" AND {part}"
+        else:
+            conjuncts.append(part)
+
+    result: list[Comparison] = []
+
+    for conjunct in conjuncts:
+        result += _text_conjunct_comparisons(_strip_parentheses(conjunct), column_name)
+
+    return result
+
+
+def _text_conjunct_comparisons(conjunct: str, column_name: str) -> list[Comparison]:
+    match = _COMPARISON_RE.match(conjunct)
+
+    if match and match.group(1) == column_name:
+        return [(_SQL_OPERATORS[match.group(2)], _parse_literal(match.group(3)))]
+
+    match = _REVERSED_COMPARISON_RE.match(conjunct)
+
+    if match and match.group(3) == column_name:
+        operator_name = _SQL_OPERATORS[match.group(2)]
+        operator_name = _REVERSED_OPERATORS.get(operator_name, operator_name)
+
+        return [(operator_name, _parse_literal(match.group(1)))]
+
+    match = _BETWEEN_RE.match(conjunct)
+
+    if match and match.group(1) == column_name:
+        return [
+            ("ge", _parse_literal(match.group(2))),
+            ("le", _parse_literal(match.group(3))),
+        ]
+
+    match = _IN_RE.match(conjunct)
+
+    if match and match.group(1) == column_name:
+        literals = [s.strip() for s in match.group(2).split(",")]
+
+        if all(re.fullmatch(_LITERAL, literal) for literal in literals):
+            return [("in", tuple(_parse_literal(s) for s in literals))]
+
+    return []
+
+
+def _strip_parentheses(text: str) -> str:
+    text = text.strip()
+
+    while text.startswith("(") and text.endswith(")"):
+        depth = 0
+
+        for i, char in enumerate(text):
+            depth += {"(": 1, ")": -1}.get(char, 0)
+
+            if depth == 0 and i < len(text) - 1:
+                # opening parenthesis is closed before the end
+                return text
+
+        text = text[1:-1].strip()
+
+    return text
+
+
+def _parse_literal(literal: str) -> Any:
+    if literal.startswith("'"):
+        return literal[1:-1].replace("''", "'")
+
+    if "." in literal:
+        return Decimal(literal)
+
+    return int(literal)
+
+
+def _is_column(element: Any, sa_column: sa.Column) -> bool:
+    return element is sa_column or (
+        isinstance(element, sa.Column)
+        and element.table is sa_column.table
+        and element.name == sa_column.name
+    )
+
+
+def _python_type(sa_column: sa.Column) -> Optional[type]:
+    try:
+        python_type = sa_column.type.python_type
+    except NotImplementedError:
+        return None
+
+    if issubclass(python_type, bool):
+        return None
+
+    if issubclass(python_type, (int, float, Decimal)):
+        return Decimal
+
+    if issubclass(python_type, str):
+        return str
+
+    return None
+
+
+def _matches_type(comparison: Comparison, python_type: type) -> bool:
+    operator_name, bound = comparison
+    bounds = bound if operator_name == "in" else [bound]
+
+    if python_type is str:
+        return all(isinstance(b, str) for b in bounds)
+
+    return all(
+        isinstance(b, (int, float, Decimal)) and not isinstance(b, bool) for b in bounds
+    )
@@ -1,14 +1,107 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Union
 
 import goodboy as gb
 import sqlalchemy as sa
 
 from goodboy_sqlalchemy.column_schemas import ColumnSchemaBuilder, column_schema_builder
+from goodboy_sqlalchemy.fast_schemas import (
+    FastDate,
+    FastDateTime,
+    FastDecimal,
+    FastFloat,
+    FastInt,
+)
+from goodboy_sqlalchemy.immutable import Immutable
+from goodboy_sqlalchemy.stats import Counters
+from goodboy_sqlalchemy.unique import has_plain_unique_constraint, index_unique_criteria
 
+# Schemas whose result depends only on the input value and typecast flag, as
+# long as all their rules are marked context-free: rules get validation context.
+_PURE_SCHEMA_TYPES = (
+    gb.Bool,
+    gb.Date,
+    gb.DateTime,
+    gb.DecimalSchema,
+    gb.Float,
+    gb.Int,
+    gb.NoneValue,
+    gb.Str,
+    FastDate,
+    FastDateTime,
+    FastDecimal,
+    FastFloat,
+    FastInt,
+)
+
+
+class ValidationCache:
+    """
+    Bounded LRU cache of validation results (values and errors), safe to use from
+    many threads.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.stats = Counters("hits", "misses")
+        self._entries: OrderedDict[Hashable, tuple[bool, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[tuple[bool, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        self.stats.increment("misses" if entry is None else "hits")
+
+        return entry
+
+    def put(self, key: Hashable, entry: tuple[bool, Any]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self):
+        return {"max_size": self.max_size}
+
+    def __setstate__(self, state):
+        self.__init__(state["max_size"])
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return self.max_size == other.max_size
+
+        return super().__eq__(other)
+
+
+class Column(gb.Key, Immutable):
+    """
+    Key for column of mapped class, immutable after construction.
+
+    :param name: Key name.
+    :param schema: Value schema.
+    :param mapped_column_name: Column property name, if it differs from key name.
+    :param required: Is key required.
+    :param default: Default key value.
+    :param has_default: Column has default value (maybe set by database).
+    :param predicate: Key is allowed only if predicate returns true.
+    :param unique: Column values must be unique.
+    :param cache_size: Size of LRU cache of validation results by input value and
+        typecast flag, for columns with low-cardinality values. Cache is used only
+        for schemas that do not depend on validation context (builtin scalar
+        schemas without rules) and only for hashable input values.
+    """
 
-class Column(gb.Key):
     def __init__(
         self,
         name: str,
@@ -20,7 +113,9 @@ class Column(gb.Key):
         has_default: bool = False,
         predicate: Optional[Callable[[dict], bool]] = None,
         unique: bool = False,
+        cache_size: int = 0,
     ):
+
         super().__init__(
             name, schema, required=required, default=default, predicate=predicate
         )
@@ -35,6 +130,53 @@ class Column(gb.Key):
         self.default = default
         self.mapped_column_name = mapped_column_name or name
         self.unique = unique
+        self.cache_size = cache_size
+
+        if cache_size and _is_pure_schema(schema):
+            self._cache: Optional[ValidationCache] = ValidationCache(cache_size)
+        else:
+            self._cache = None
+
+    @property
+    def cache_stats(self) -> Optional[Counters]:
+        """
+        Cache hit and miss counters, ``None`` if cache is not used.
+        """
+
+        if self._cache is None:
+            return None
+
+        return self._cache.stats
+
+    def validate(self, value: Any, typecast: bool, context: dict[str, Any]) -> Any:
+        if self._cache is None:
+            return super().validate(value, typecast, context)
+
+        # Type is a part of the key: 1, 1.0 and True are equal, but validated
+        # differently.
+        cache_key = (type(value), value, typecast)
+
+        try:
+            entry = self._cache.get(cache_key)
+        except TypeError:
+            return super().validate(value, typecast, context)
+
+        if entry is None:
+            try:
+                result = super().validate(value, typecast, context)
+            except gb.SchemaError as e:
+                entry = (False, e.errors)
+            else:
+                entry = (True, result)
+
+            self._cache.put(cache_key, entry)
+
+        is_valid, result = entry
+
+        if not is_valid:
+            raise gb.SchemaError(list(result))
+
+        return result
 
     def with_predicate(self, predicate: Callable[[dict], bool]) -> Column:
         return Column(
@@ -44,6 +186,7 @@ class Column(gb.Key):
             default=self.default,
             predicate=predicate,
             unique=self.unique,
+            cache_size=self.cache_size,
         )
 
     def __eq__(self, other):
@@ -58,25 +201,42 @@ class ColumnBuilderError(Exception):
 
 
 class ColumnBuilder:
-    def __init__(self, column_schema_builder: ColumnSchemaBuilder):
+    """
+    :param column_schema_builder: Builder of column value schemas.
+    :param cache_size: Validation cache size of built columns, see :class:`Column`.
+    """
+
+    def __init__(self, column_schema_builder: ColumnSchemaBuilder, cache_size: int = 0):
         self._column_schema_builder = column_schema_builder
+        self._cache_size = cache_size
+
+    def build(
+        self, sa_mapped_class: Union[type, sa.Table], column_names: list[str]
+    ) -> list[Column]:
+        """
+        Build columns of mapped class (by column property names) or of Core
+        table (by column keys).
+        """
+
+        if isinstance(sa_mapped_class, sa.Table):
+            sa_columns = sa_mapped_class.columns
+            owner = f"table {sa_mapped_class.name}"
+        else:
+            sa_columns = sa.inspect(sa_mapped_class).columns
+            owner = f"mapped class {sa_mapped_class.__name__}"
 
-    def build(self, sa_mapped_class: type, column_names: list[str]) -> list[Column]:
-        sa_mapper = sa.inspect(sa_mapped_class)
         result: list[Column] = []
 
         for column_name in column_names:
-            result.append(self._build_column(sa_mapper, column_name))
+            result.append(self._build_column(sa_columns, owner, column_name))
 
         return result
 
-    def _build_column(self, sa_mapper, column_name: str) -> Column:
-        if column_name not in sa_mapper.columns:
-            raise ColumnBuilderError(
-                f"mapped class {sa_mapper.class_.__name__} has no column {column_name}"
-            )
+    def _build_column(self, sa_columns, owner: str, column_name: str) -> Column:
+        if column_name not in sa_columns:
+            raise ColumnBuilderError(f"{owner} has no column {column_name}")
 
-        sa_column = sa_mapper.columns[column_name]
+        sa_column = sa_columns[column_name]
         schema = self._column_schema_builder.build(sa_column)
 
         has_default = bool(sa_column.default or sa_column.server_default)
@@ -87,6 +247,9 @@ class ColumnBuilder:
             default = None
 
         required = not (has_default or sa_column.nullable)
+        unique = has_plain_unique_constraint(sa_column) or bool(
+            index_unique_criteria(sa_column)
+        )
 
         return Column(
             column_name,
@@ -94,8 +257,15 @@ class ColumnBuilder:
             required=required,
             has_default=has_default,
             default=default,
-            unique=sa_column.unique or False,
+            unique=unique,
+            cache_size=self._cache_size,
         )
 
 
+def _is_pure_schema(schema: Optional[gb.Schema]) -> bool:
+    return type(schema) in _PURE_SCHEMA_TYPES and all(
+        getattr(rule, "context_free", False) for rule in getattr(schema, "_rules", [])
+    )
+
+
 column_builder = ColumnBuilder(column_schema_builder)
@@ -1,17 +1,38 @@
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Type
+from decimal import Decimal
+from typing import Any, Optional, Type, Union
 
 import goodboy as gb
 import sqlalchemy as sa
-import sqlalchemy.dialects.postgresql as sa_pg
+
+from goodboy_sqlalchemy.binary import Binary
+from goodboy_sqlalchemy.checks import check_constraint_rules
+from goodboy_sqlalchemy.fast_schemas import (
+    FastDate,
+    FastDateTime,
+    FastDecimal,
+    FastFloat,
+    FastInt,
+)
+from goodboy_sqlalchemy.json_value import JSONValue
+
+# Keys of column info read by schema factories, see
+# goodboy_sqlalchemy.snapshot.mapped_fingerprint
+SCHEMA_INFO_KEYS = (
+    "integer_bits",
+    "json_max_size",
+    "json_max_depth",
+    "json_max_keys",
+    "json_schema",
+)
 
 
 class ColumnSchemaFactory(ABC):
     @abstractmethod
-    def build(self, sa_column: sa.Column) -> gb.Schema:
-        ...
+    def build(self, sa_column: sa.Column) -> gb.Schema: ...
 
 
 class SimpleColumnSchemaFactory(ColumnSchemaFactory):
@@ -19,34 +40,142 @@ class SimpleColumnSchemaFactory(ColumnSchemaFactory):
         self._schema = schema
 
     def build(self, sa_column: sa.Column) -> gb.Schema:
-        return self._schema(allow_none=sa_column.nullable)
+        return self._schema(**_common_options(sa_column))
 
 
 class StringColumnSchemaFactory(ColumnSchemaFactory):
     def build(self, sa_column: sa.Column[sa.String]) -> gb.Str:
-        return gb.Str(allow_none=sa_column.nullable, max_length=sa_column.type.length)
-
+        return gb.Str(max_length=sa_column.type.length, **_common_options(sa_column))
+
+
+class IntegerColumnSchemaFactory(ColumnSchemaFactory):
+    """
+    Integer schema limited to the range of signed integer of given width. Values
+    of ``int`` type are checked against the range only.
+
+    Width can be set for a column in column info (``integer_bits`` key), e.g.
+    64 bits for ``Integer`` columns of SQLite tables.
+    """
+
+    def __init__(self, bits: int) -> None:
+        self._bits = bits
+
+    def build(self, sa_column: sa.Column[sa.Integer]) -> gb.Int:
+        bits = sa_column.info.get("integer_bits", self._bits)
+
+        return FastInt(
+            greater_or_equal_to=-(2 ** (bits - 1)),
+            less_or_equal_to=2 ** (bits - 1) - 1,
+            **_common_options(sa_column),
+        )
+
+
+class NumericColumnSchemaFactory(ColumnSchemaFactory):
+    """
+    Decimal schema (float schema for ``asdecimal=False``) limited to values that
+    fit column precision after rounding to column scale. Values of ``Decimal``
+    (``float``) type are checked against the limit only.
+    """
+
+    def build(self, sa_column: sa.Column[sa.Numeric]) -> gb.Schema:
+        precision = sa_column.type.precision
+        scale = sa_column.type.scale or 0
+        schema = FastDecimal if sa_column.type.asdecimal else FastFloat
+
+        if precision is None:
+            limit = None
+        else:
+            # Values are rounded half away from zero to scale digits, so 99.995
+            # doesn't fit into NUMERIC(4, 2)
+            limit = Decimal(10) ** (precision - scale) - Decimal(5) * Decimal(10) ** (
+                -scale - 1
+            )
 
-SA_TYPE_MAPPING: dict[Any, ColumnSchemaFactory] = {
-    sa.BigInteger: SimpleColumnSchemaFactory(gb.Int),  # TODO: max int
+            if not sa_column.type.asdecimal:
+                limit = float(limit)
+
+        return schema(
+            less_than=limit,
+            greater_than=None if limit is None else -limit,
+            **_common_options(sa_column),
+        )
+
+
+class JSONColumnSchemaFactory(ColumnSchemaFactory):
+    """
+    JSON document schema with limits of document size, depth and key count.
+
+    Limits and document schema can be set for a column in column info
+    (``json_max_size``, ``json_max_depth``, ``json_max_keys`` and
+    ``json_schema`` keys), otherwise factory limits are used.
+
+    :param only_objects: Accept only objects as documents.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        max_keys: Optional[int] = None,
+        only_objects: bool = False,
+    ) -> None:
+        self._max_size = max_size
+        self._max_depth = max_depth
+        self._max_keys = max_keys
+        self._only_objects = only_objects
+
+    def build(self, sa_column: sa.Column[sa.JSON]) -> JSONValue:
+        info = sa_column.info
+
+        return JSONValue(
+            max_size=info.get("json_max_size", self._max_size),
+            max_depth=info.get("json_max_depth", self._max_depth),
+            max_keys=info.get("json_max_keys", self._max_keys),
+            schema=info.get("json_schema"),
+            only_objects=self._only_objects,
+            **_common_options(sa_column),
+        )
+
+
+class BinaryColumnSchemaFactory(ColumnSchemaFactory):
+    def build(self, sa_column: sa.Column[sa.LargeBinary]) -> Binary:
+        return Binary(max_length=sa_column.type.length, **_common_options(sa_column))
+
+
+# Keys are SQLAlchemy type classes or dotted names of type classes. Dotted names
+# are used for dialect-specific types: they are resolved only if the dialect
+# module has already been imported (otherwise no column can be of that type),
+# so importing this module never loads dialect packages.
+#
+# The first matching entry is used, so subclasses go before their base classes
+# (BigInteger and SmallInteger before Integer, Float before Numeric).
+#
+# Numeric and date schemas accept values of exact expected type (``datetime``
+# objects, ``Decimal`` values of other rows) with null and bounds checks only,
+# see goodboy_sqlalchemy.fast_schemas.
+SA_TYPE_MAPPING: dict[Union[type, str], ColumnSchemaFactory] = {
+    sa.BigInteger: IntegerColumnSchemaFactory(64),
     sa.Boolean: SimpleColumnSchemaFactory(gb.Bool),
-    sa.Date: SimpleColumnSchemaFactory(gb.Date),
-    sa.DateTime: SimpleColumnSchemaFactory(gb.DateTime),
+    sa.Date: SimpleColumnSchemaFactory(FastDate),
+    sa.DateTime: SimpleColumnSchemaFactory(FastDateTime),
     # sa.Enum: TODO
-    sa.Float: SimpleColumnSchemaFactory(gb.Float),
-    sa.Integer: SimpleColumnSchemaFactory(gb.Int),  # TODO: max int
+    sa.Float: SimpleColumnSchemaFactory(FastFloat),
+    # PostgreSQL JSON and JSONB columns accept only objects, as before generic
+    # JSON columns were supported
+    "sqlalchemy.dialects.postgresql.JSON": JSONColumnSchemaFactory(only_objects=True),
+    sa.JSON: JSONColumnSchemaFactory(),
+    sa.SmallInteger: IntegerColumnSchemaFactory(16),
+    # Generic integer is 32-bit in PostgreSQL and MySQL, but 64-bit in SQLite:
+    # set ``integer_bits`` column info key to use the wider range
+    sa.Integer: IntegerColumnSchemaFactory(32),
     # sa.Interval: TODO
-    # sa.LargeBinary: TODO
-    # sa.Numeric: TODO
-    # sa.Numeric: TODO
-    sa.SmallInteger: SimpleColumnSchemaFactory(gb.Int),  # TODO: max int
+    sa.LargeBinary: BinaryColumnSchemaFactory(),
+    sa.Numeric: NumericColumnSchemaFactory(),
     sa.String: StringColumnSchemaFactory(),
     sa.Text: SimpleColumnSchemaFactory(gb.Str),
     # sa.Time: TODO
     sa.Unicode: SimpleColumnSchemaFactory(gb.Str),
     sa.UnicodeText: SimpleColumnSchemaFactory(gb.Str),
-    sa_pg.JSON: SimpleColumnSchemaFactory(gb.Dict),
-    sa_pg.JSONB: SimpleColumnSchemaFactory(gb.Dict),
 }
 
 
@@ -55,7 +184,7 @@ class ColumnSchemaBuilderError(Exception):
 
 
 class ColumnSchemaBuilder:
-    def __init__(self, sa_type_mapping: dict[Any, ColumnSchemaFactory]):
+    def __init__(self, sa_type_mapping: dict[Union[type, str], ColumnSchemaFactory]):
         self._sa_type_mapping = sa_type_mapping
 
     def build(self, sa_column: sa.Column) -> gb.Schema:
@@ -72,10 +201,36 @@ class ColumnSchemaBuilder:
         self, sa_column: sa.Column
     ) -> Optional[ColumnSchemaFactory]:
         for sa_type, column_schema_factory in self._sa_type_mapping.items():
+            if isinstance(sa_type, str):
+                sa_type = _resolve_loaded_type(sa_type)
+
+                if sa_type is None:
+                    continue
+
             if isinstance(sa_column.type, sa_type):
                 return column_schema_factory
 
         return None
 
 
+def _common_options(sa_column: sa.Column) -> dict[str, Any]:
+    options: dict[str, Any] = {"allow_none": sa_column.nullable}
+    rules = check_constraint_rules(sa_column)
+
+    if rules:
+        options["rules"] = rules
+
+    return options
+
+
+def _resolve_loaded_type(dotted_name: str) -> Optional[type]:
+    module_name, _, type_name = dotted_name.rpartition(".")
+    module = sys.modules.get(module_name)
+
+    if module is None:
+        return None
+
+    return getattr(module, type_name)
+
+
 column_schema_builder = ColumnSchemaBuilder(SA_TYPE_MAPPING)
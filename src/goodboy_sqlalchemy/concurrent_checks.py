@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import contextvars
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional
+
+import sqlalchemy as sa
+
+Query = Callable[[sa.Connection], Any]
+
+
+class ConcurrentChecks:
+    """
+    Runs independent database checks of a single payload (uniqueness of
+    different columns) concurrently on a thread pool, so validation takes the
+    longest check instead of the sum of them.
+
+    Each query is executed on its own connection checked out from the engine
+    pool, outside of the session transaction: checks see committed rows only
+    (and pending objects of the session, which are checked without queries).
+    Engine pool must have room for ``max_workers`` connections besides the ones
+    used by sessions.
+
+    :param max_workers: Thread pool size, shared by all validations.
+    :param max_concurrency: Maximum number of queries of a single validation
+        running at the same time, ``max_workers`` by default.
+    """
+
+    def __init__(self, *, max_workers: int = 4, max_concurrency: Optional[int] = None):
+        self._max_workers = max_workers
+        self._max_concurrency = max_concurrency or max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def run(self, engine: sa.Engine, queries: list[Query]) -> list[Any]:
+        """
+        Run each query with a connection of engine pool, return results in
+        order of queries. If a query fails, queries not started yet are
+        cancelled and the error is raised once started ones are finished.
+        """
+
+        if len(queries) <= 1:
+            return [_execute(engine, query) for query in queries]
+
+        executor = self._get_executor()
+        results: list[Any] = [None] * len(queries)
+        waiting = list(enumerate(queries))
+        pending: dict[Future, int] = {}
+
+        try:
+            while waiting or pending:
+                while waiting and len(pending) < self._max_concurrency:
+                    index, query = waiting.pop(0)
+                    # queries see context variables (validation deadline) of
+                    # the caller
+                    future = executor.submit(
+                        contextvars.copy_context().run, _execute, engine, query
+                    )
+                    pending[future] = index
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    results[pending.pop(future)] = future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+            wait(pending)
+
+        return results
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self._max_workers, thread_name_prefix="goodboy-sqlalchemy-check"
+                )
+
+            return self._executor
+
+
+def _execute(engine: sa.Engine, query: Query) -> Any:
+    with engine.connect() as connection:
+        return query(connection)
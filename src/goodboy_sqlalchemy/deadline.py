@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+import sqlalchemy as sa
+
+DEADLINE_CONTEXT_KEY = "deadline"
+
+# Number of SQLite virtual machine instructions between deadline checks
+SQLITE_PROGRESS_INSTRUCTIONS = 1000
+
+# Seconds a PostgreSQL statement may run past the deadline: statement timeout is
+# set again once time left dropped by more than that since it was set
+POSTGRESQL_TIMEOUT_TOLERANCE = 0.05
+
+_deadline: ContextVar[Optional[float]] = ContextVar(
+    "goodboy_sqlalchemy_deadline", default=None
+)
+
+# (deadline, previous setting, time left when set) of statement timeout set in
+# the current transaction of PostgreSQL connection, kept in connection info
+_TIMEOUT_INFO_KEY = "goodboy_sqlalchemy.statement_timeout"
+
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[float]) -> Iterator[None]:
+    """
+    Set deadline (``time.monotonic()`` value) of validation and database
+    queries it runs, nested scopes can only make the deadline earlier.
+    """
+
+    current = _deadline.get()
+
+    if deadline is None or (current is not None and current <= deadline):
+        yield
+        return
+
+    token = _deadline.set(deadline)
+
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def check_deadline() -> None:
+    """
+    Raise :class:`DeadlineExceeded` if deadline of current scope has passed.
+    """
+
+    deadline = _deadline.get()
+
+    if deadline is not None and time.monotonic() >= deadline:
+        raise DeadlineExceeded()
+
+
+def install_statement_timeouts(engine: sa.Engine) -> None:
+    """
+    Limit execution time of statements run within a deadline scope to the time
+    left: with ``statement_timeout`` setting on PostgreSQL and with progress
+    handler on SQLite. On other dialects statements are only not started after
+    the deadline. Statements interrupted after the deadline raise
+    :class:`DeadlineExceeded`.
+
+    On PostgreSQL the setting is changed for the transaction (``SET LOCAL``)
+    by the first statement of a deadline scope, and again by statements started
+    more than :data:`POSTGRESQL_TIMEOUT_TOLERANCE` seconds after it was set, so
+    a statement may run past the deadline by that much at most. The setting is
+    changed back by the first statement run outside of the scope. A statement
+    cancelled by timeout aborts the transaction. Connections in autocommit mode
+    have no transaction to change the setting for, their statements are only
+    not started after the deadline.
+    """
+
+    sa.event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    sa.event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    sa.event.listen(engine, "handle_error", _handle_error)
+    sa.event.listen(engine, "commit", _end_transaction)
+    sa.event.listen(engine, "rollback", _end_transaction)
+    sa.event.listen(engine, "rollback_savepoint", _rollback_savepoint)
+
+
+def _before_cursor_execute(
+    conn: sa.Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    deadline = _deadline.get()
+    dialect_name = conn.dialect.name
+
+    if deadline is None:
+        if dialect_name == "postgresql":
+            _restore_statement_timeout(conn)
+
+        return
+
+    remaining = deadline - time.monotonic()
+
+    if remaining <= 0:
+        raise DeadlineExceeded()
+
+    if dialect_name == "postgresql":
+        _set_statement_timeout(conn, deadline, remaining)
+    elif dialect_name == "sqlite":
+        conn.connection.dbapi_connection.set_progress_handler(
+            lambda: time.monotonic() >= deadline, SQLITE_PROGRESS_INSTRUCTIONS
+        )
+
+
+def _after_cursor_execute(
+    conn: sa.Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    if _deadline.get() is not None and conn.dialect.name == "sqlite":
+        conn.connection.dbapi_connection.set_progress_handler(None, 0)
+
+
+def _set_statement_timeout(
+    conn: sa.Connection, deadline: float, remaining: float
+) -> None:
+    timeout = conn.info.get(_TIMEOUT_INFO_KEY)
+
+    if (
+        timeout is not None
+        and timeout[0] == deadline
+        and timeout[2] - remaining <= POSTGRESQL_TIMEOUT_TOLERANCE
+    ):
+        return
+
+    # SET LOCAL outside of transaction has no effect
+    if getattr(conn.connection.dbapi_connection, "autocommit", False):
+        return
+
+    milliseconds = str(math.ceil(remaining * 1000))
+
+    if timeout is None:
+        previous_timeout = _run_setting_query(
+            conn,
+            "SELECT current_setting('statement_timeout'), "
+            "set_config('statement_timeout', :timeout, true)",
+            milliseconds,
+        )
+    else:
+        _run_setting_query(
+            conn, "SELECT set_config('statement_timeout', :timeout, true)", milliseconds
+        )
+        previous_timeout = timeout[1]
+
+    conn.info[_TIMEOUT_INFO_KEY] = (deadline, previous_timeout, remaining)
+
+
+def _restore_statement_timeout(conn: sa.Connection) -> None:
+    timeout = conn.info.pop(_TIMEOUT_INFO_KEY, None)
+
+    if timeout is not None:
+        _run_setting_query(
+            conn, "SELECT set_config('statement_timeout', :timeout, true)", timeout[1]
+        )
+
+
+def _run_setting_query(conn: sa.Connection, query: str, timeout: str) -> Any:
+    """
+    Run query with raw cursor (statement events are not fired again), return
+    the first column. Value is rendered into the query, so it doesn't depend
+    on driver parameter style.
+    """
+
+    statement = sa.text(query).bindparams(timeout=timeout)
+    compiled = statement.compile(
+        dialect=conn.dialect, compile_kwargs={"literal_binds": True}
+    )
+    cursor = conn.connection.cursor()
+
+    try:
+        cursor.execute(str(compiled))
+        return cursor.fetchone()[0]
+    finally:
+        cursor.close()
+
+
+def _end_transaction(conn: sa.Connection) -> None:
+    # settings changed with SET LOCAL end with transaction
+    if not conn.invalidated:
+        conn.info.pop(_TIMEOUT_INFO_KEY, None)
+
+
+def _rollback_savepoint(conn: sa.Connection, name: str, context: Any) -> None:
+    timeout = None if conn.invalidated else conn.info.get(_TIMEOUT_INFO_KEY)
+
+    # the setting may be rolled back or not, it is set again in a deadline
+    # scope, previous setting is restored outside of it either way
+    if timeout is not None:
+        conn.info[_TIMEOUT_INFO_KEY] = (None, timeout[1], 0.0)
+
+
+def _handle_error(exception_context: Any) -> Optional[BaseException]:
+    deadline = _deadline.get()
+
+    if deadline is None:
+        return None
+
+    connection = exception_context.connection
+
+    # failed statement aborts PostgreSQL transaction with its settings, SQLite
+    # progress handler is set on the connection
+    if (
+        connection is not None
+        and not connection.invalidated
+        and connection.dialect.name == "sqlite"
+    ):
+        connection.connection.dbapi_connection.set_progress_handler(None, 0)
+
+    if time.monotonic() >= deadline:
+        return DeadlineExceeded()
+
+    return None
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Optional
+
+import goodboy as gb
+
+
+class ExactTypeFastPath:
+    """
+    Mixin of goodboy numeric and date schemas accepting values of exact expected
+    type (not subclasses) with null and bounds checks only, skipping typecasting
+    and type checks. Other values, values out of bounds and schemas with allowed
+    values list go through the full schema, so results and errors are the same.
+    """
+
+    _exact_type: type
+    # parses strings when type casting is enabled, for date schemas
+    _parse: Optional[Callable[[str], Any]] = None
+    # attributes of goodboy schemas
+    _allowed: Optional[list]
+    _rules: list
+    _call_rules: Callable[..., tuple[Any, list[gb.Error]]]
+
+    def __call__(
+        self,
+        value: Any,
+        *,
+        typecast: bool = False,
+        context: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        if context is None:
+            context = {}
+
+        if type(value) is not self._exact_type:
+            if not (typecast and type(value) is str and self._can_parse(context)):
+                return super().__call__(value, typecast=typecast, context=context)
+
+            try:
+                value = self._parse(value)  # type: ignore[misc]
+            except ValueError:
+                return super().__call__(value, typecast=typecast, context=context)
+
+        if self._allowed is None and self._within_bounds(value):
+            if not self._rules:
+                return value
+
+            value, errors = self._call_rules(value, typecast, context)
+
+            if errors:
+                raise gb.SchemaError(errors)
+
+            return value
+
+        return super().__call__(value, typecast=typecast, context=context)
+
+    def _can_parse(self, context: dict[str, Any]) -> bool:
+        return False
+
+    def _within_bounds(self, value: Any) -> bool:
+        raise NotImplementedError
+
+
+class NumericFastPath(ExactTypeFastPath):
+    _less_than: Any
+    _less_or_equal_to: Any
+    _greater_than: Any
+    _greater_or_equal_to: Any
+
+    def _within_bounds(self, value: Any) -> bool:
+        return not (
+            (self._less_than is not None and value >= self._less_than)
+            or (self._less_or_equal_to is not None and value > self._less_or_equal_to)
+            or (self._greater_than is not None and value <= self._greater_than)
+            or (
+                self._greater_or_equal_to is not None
+                and value < self._greater_or_equal_to
+            )
+        )
+
+
+class DateFastPath(ExactTypeFastPath):
+    """
+    Also parses ISO format strings when type casting is enabled and no format is
+    set (by option or ``date_format`` context key).
+    """
+
+    _format: Optional[str]
+    _earlier_than: Any
+    _earlier_or_equal_to: Any
+    _later_than: Any
+    _later_or_equal_to: Any
+
+    def _can_parse(self, context: dict[str, Any]) -> bool:
+        return not self._format and not context.get("date_format")
+
+    def _within_bounds(self, value: Any) -> bool:
+        return not (
+            (self._earlier_than is not None and value >= self._earlier_than)
+            or (
+                self._earlier_or_equal_to is not None
+                and value > self._earlier_or_equal_to
+            )
+            or (self._later_than is not None and value <= self._later_than)
+            or (self._later_or_equal_to is not None and value < self._later_or_equal_to)
+        )
+
+
+class FastInt(NumericFastPath, gb.Int):
+    _exact_type = int
+
+
+class FastFloat(NumericFastPath, gb.Float):
+    _exact_type = float
+
+
+class FastDecimal(NumericFastPath, gb.DecimalSchema):
+    _exact_type = Decimal
+
+
+class FastDate(DateFastPath, gb.Date):
+    _exact_type = date
+    _parse = date.fromisoformat
+
+
+class FastDateTime(DateFastPath, gb.DateTime):
+    _exact_type = datetime
+    _parse = datetime.fromisoformat
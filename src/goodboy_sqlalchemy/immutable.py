@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from abc import ABCMeta
+from typing import Any
+
+
+class ImmutableMeta(ABCMeta):
+    """
+    Freezes instances once construction (including ``__init__`` of subclasses)
+    is complete.
+    """
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        instance = super().__call__(*args, **kwargs)
+        object.__setattr__(instance, "_frozen", True)
+
+        return instance
+
+
+class Immutable(metaclass=ImmutableMeta):
+    """
+    Base class of objects that cannot be changed after construction, so a single
+    instance can be shared by all threads without locking.
+    """
+
+    _frozen = False
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._frozen:
+            raise AttributeError(f"{type(self).__name__} object is immutable")
+
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if self._frozen:
+            raise AttributeError(f"{type(self).__name__} object is immutable")
+
+        super().__delattr__(name)
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from json.encoder import encode_basestring_ascii
+from typing import Any, Optional
+
+import goodboy as gb
+from goodboy.messages import DEFAULT_MESSAGES, MessageCollectionType
+from goodboy.schema import Rule
+
+
+class JSONObject(dict):
+    """
+    Validated JSON object, ``serialized_size`` is its length encoded with
+    ``json.dumps`` defaults (as SQLAlchemy JSON types encode it).
+    """
+
+    serialized_size: int
+
+
+class JSONArray(list):
+    """
+    Validated JSON array, ``serialized_size`` is its length encoded with
+    ``json.dumps`` defaults (as SQLAlchemy JSON types encode it).
+    """
+
+    serialized_size: int
+
+
+class JSONValueError(Exception):
+    def __init__(self, code: str, error_args: dict[str, Any]):
+        super().__init__(code)
+
+        self.code = code
+        self.error_args = error_args
+
+
+class JSONValue(gb.SchemaWithUtils):
+    """
+    Accept JSON documents: objects, arrays and scalar values. Document is walked
+    iteratively before any other validation, and rejected as soon as a limit is
+    exceeded. Objects and arrays are returned as :class:`JSONObject` and
+    :class:`JSONArray` carrying the serialized size computed by the walk (the
+    result of document schema is walked again), so it needn't be computed again
+    before insert.
+
+    :param allow_none: If true, value is allowed to be ``None``.
+    :param messages: Override error messages.
+    :param rules: Custom validation rules.
+    :param max_size: Max length of document encoded with ``json.dumps``
+        defaults.
+    :param max_depth: Max nesting level of objects and arrays.
+    :param max_keys: Max total number of object keys in document.
+    :param schema: Schema of document, applied when document is within limits.
+    :param only_objects: If true, document must be an object.
+    """
+
+    def __init__(
+        self,
+        *,
+        allow_none: bool = False,
+        messages: MessageCollectionType = DEFAULT_MESSAGES,
+        rules: list[Rule] = [],
+        max_size: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        max_keys: Optional[int] = None,
+        schema: Optional[gb.Schema] = None,
+        only_objects: bool = False,
+    ):
+        super().__init__(allow_none=allow_none, messages=messages, rules=rules)
+
+        self._max_size = max_size
+        self._max_depth = max_depth
+        self._max_keys = max_keys
+        self._schema = schema
+        self._only_objects = only_objects
+
+    def _typecast(
+        self, input: Any, context: dict[str, Any] = {}
+    ) -> tuple[Any, list[gb.Error]]:
+        return input, []
+
+    def _validate(
+        self, value: Any, typecast: bool, context: dict[str, Any] = {}
+    ) -> tuple[Any, list[gb.Error]]:
+        if self._only_objects and not isinstance(value, dict):
+            return None, [
+                self._error("unexpected_type", {"expected_type": gb.type_name("dict")})
+            ]
+
+        try:
+            size = self.measure(value)
+        except JSONValueError as e:
+            return None, [self._error(e.code, e.error_args)]
+
+        if self._schema is not None:
+            try:
+                value = self._schema(value, typecast=typecast, context=context)
+                size = self.measure(value)
+            except gb.SchemaError as e:
+                return None, e.errors
+            except JSONValueError as e:
+                return None, [self._error(e.code, e.error_args)]
+
+        if isinstance(value, dict):
+            value = JSONObject(value)
+            value.serialized_size = size
+        elif isinstance(value, list):
+            value = JSONArray(value)
+            value.serialized_size = size
+
+        return self._call_rules(value, typecast, context)
+
+    def measure(self, value: Any) -> int:
+        """
+        Return length of value encoded with ``json.dumps`` defaults, raise
+        :class:`JSONValueError` when value is not a JSON document or is beyond
+        schema limits.
+        """
+
+        size = 0
+        keys = 0
+        stack = [(value, 0)]
+
+        while stack:
+            item, depth = stack.pop()
+
+            if isinstance(item, str):
+                # Encoded string is at least two quotes longer, so huge strings
+                # are rejected without encoding them
+                if self._max_size is not None and size + len(item) + 2 > self._max_size:
+                    raise JSONValueError("json_too_large", {"value": self._max_size})
+
+                size += len(encode_basestring_ascii(item))
+            elif item is None or item is True:
+                size += 4
+            elif item is False:
+                size += 5
+            elif isinstance(item, (int, float)):
+                size += len(_encode_number(item))
+            elif isinstance(item, (dict, list, tuple)):
+                depth += 1
+
+                if self._max_depth is not None and depth > self._max_depth:
+                    raise JSONValueError("json_too_deep", {"value": self._max_depth})
+
+                # brackets and ", " separators
+                size += 2 + max(len(item) - 1, 0) * 2
+
+                if isinstance(item, dict):
+                    keys += len(item)
+
+                    if self._max_keys is not None and keys > self._max_keys:
+                        raise JSONValueError(
+                            "json_too_many_keys", {"value": self._max_keys}
+                        )
+
+                    for key, nested_item in item.items():
+                        if not isinstance(key, str):
+                            raise JSONValueError(
+                                "unexpected_type",
+                                {"expected_type": gb.type_name("str")},
+                            )
+
+                        # key and ": " separator
+                        size += len(encode_basestring_ascii(key)) + 2
+                        stack.append((nested_item, depth))
+                else:
+                    stack.extend((nested_item, depth) for nested_item in item)
+            else:
+                raise JSONValueError("unexpected_type", {"expected_type": "json"})
+
+            if self._max_size is not None and size > self._max_size:
+                raise JSONValueError("json_too_large", {"value": self._max_size})
+
+        return size
+
+
+def _encode_number(value: Any) -> str:
+    if isinstance(value, int):
+        return int.__repr__(value)
+
+    if value != value:
+        return "NaN"
+
+    if value in (float("inf"), float("-inf")):
+        return "Infinity" if value > 0 else "-Infinity"
+
+    return float.__repr__(value)
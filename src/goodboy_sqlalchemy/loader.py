@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+import goodboy as gb
+import sqlalchemy as sa
+import sqlalchemy.orm as sa_orm
+
+LOADER_CONTEXT_KEY = "loader"
+
+LoadCallback = Callable[[Optional[Any]], list[gb.Error]]
+
+# Owner of a load is a path of key names (and row or item indices) of the key
+# which requested it, ending with None for loads requested by schema rules.
+LoadOwner = Tuple[Any, ...]
+
+# Max number of values in one ``IN`` query
+LOAD_BATCH_SIZE = 500
+
+# Max number of memoized values per session, memo is cleared when it's exceeded
+MEMO_MAX_SIZE = 10000
+
+_MEMO_INFO_KEY = "goodboy_sqlalchemy.loader_memo"
+
+
+class Loader:
+    """
+    Batches lookups of mapped instances by column value, requested by keys and
+    rules during ``Mapped`` validation. ``Mapped`` puts loader to validation
+    context (``context["loader"]``) and resolves all lookups of a payload (or
+    of a chunk of ``Mapped.validate_many`` rows) with one ``IN`` query per
+    mapped attribute and :data:`LOAD_BATCH_SIZE` values, after keys and rules
+    are validated. Queries don't autoflush the session.
+
+    Found instances are memoized per session until the next flush or end of
+    transaction, up to :data:`MEMO_MAX_SIZE` values.
+
+    >>> def category_exists(schema, value, typecast, context):
+    ...     context["loader"].load(
+    ...         Category.id,
+    ...         value["category_id"],
+    ...         lambda category: [] if category else [schema._error("no_category")],
+    ...     )
+    ...     return value, []
+    """
+
+    def __init__(self, session: sa_orm.Session):
+        self._session = session
+        self._pending: list[tuple[LoadOwner, Any, Any, LoadCallback]] = []
+        self._owner: LoadOwner = ()
+
+    def load(self, attribute: Any, value: Any, callback: LoadCallback) -> None:
+        """
+        Request instance of mapped class with column attribute equal to value.
+
+        :param attribute: Mapped column attribute, such as ``Category.id``.
+        :param callback: Called with found instance (or ``None``) when lookups
+            are resolved, returns errors of the requesting key or rule.
+        """
+
+        self._pending.append((self._owner, attribute, value, callback))
+
+    @contextmanager
+    def requested_by(self, key: Any) -> Iterator[None]:
+        """
+        Attribute loads requested inside the block to a nested key.
+        """
+
+        owner = self._owner
+        self._owner = owner + (key,)
+
+        try:
+            yield
+        finally:
+            self._owner = owner
+
+    def resolve(self) -> list[tuple[LoadOwner, list[gb.Error]]]:
+        """
+        Run queries for all pending loads, call their callbacks and return
+        non-empty errors with owners.
+        """
+
+        pending, self._pending = self._pending, []
+        memo = _session_memo(self._session)
+        # instances (or None) by attribute and value for loads of this call, memo
+        # may be cleared meanwhile
+        loaded: dict[tuple[type, str], dict] = {}
+        missing_values: dict[tuple[type, str], tuple[Any, set]] = {}
+
+        for _, attribute, value, _ in pending:
+            attribute_key = _attribute_key(attribute)
+            attribute_loaded = loaded.setdefault(attribute_key, {})
+            attribute_memo = memo.get(attribute_key, {})
+
+            if value is None or value in attribute_loaded:
+                continue
+
+            if value in attribute_memo:
+                attribute_loaded[value] = attribute_memo[value]
+            else:
+                missing_values.setdefault(attribute_key, (attribute, set()))
+                missing_values[attribute_key][1].add(value)
+
+        for attribute_key, (attribute, values) in missing_values.items():
+            found = self._load_instances(attribute, values)
+            attribute_memo = _attribute_memo(self._session, attribute_key, len(values))
+
+            for value in values:
+                attribute_memo[value] = loaded[attribute_key][value] = found.get(value)
+
+        result: list[tuple[LoadOwner, list[gb.Error]]] = []
+
+        for owner, attribute, value, callback in pending:
+            errors = callback(loaded[_attribute_key(attribute)].get(value))
+
+            if errors:
+                result.append((owner, errors))
+
+        return result
+
+    def _load_instances(self, attribute: Any, values: set) -> dict[Any, Any]:
+        sorted_values = sorted(values, key=repr)
+        result: dict[Any, Any] = {}
+
+        for start in range(0, len(sorted_values), LOAD_BATCH_SIZE):
+            end = start + LOAD_BATCH_SIZE
+            statement = sa.select(attribute.class_).where(
+                attribute.in_(sorted_values[start:end])
+            )
+
+            with self._session.no_autoflush:
+                for instance in self._session.execute(statement).scalars():
+                    result.setdefault(getattr(instance, attribute.key), instance)
+
+        return result
+
+
+@contextmanager
+def requested_by(context: dict, key: Any) -> Iterator[None]:
+    """
+    Attribute loads to a nested key, if validation context has loader.
+    """
+
+    loader: Optional[Loader] = context.get(LOADER_CONTEXT_KEY)
+
+    if loader is None:
+        yield
+    else:
+        with loader.requested_by(key):
+            yield
+
+
+def memoize(session: sa_orm.Session, attribute: Any, instance: Any) -> None:
+    """
+    Memoize instance loaded by another query for loads by the attribute, which
+    also keeps it in session identity map until the memo is reset.
+    """
+
+    attribute_memo = _attribute_memo(session, _attribute_key(attribute), 1)
+    attribute_memo[getattr(instance, attribute.key)] = instance
+
+
+def _attribute_key(attribute: Any) -> tuple[type, str]:
+    # Attributes overload ``==``, so they are not used as dict keys directly
+    return attribute.class_, attribute.key
+
+
+def _attribute_memo(
+    session: sa_orm.Session, attribute_key: tuple[type, str], count: int
+) -> dict:
+    """
+    Get memo of attribute to add count values to, session memo is cleared first
+    if it would exceed :data:`MEMO_MAX_SIZE` values (values that don't fit at
+    all are not memoized).
+    """
+
+    memo = _session_memo(session)
+
+    if count > MEMO_MAX_SIZE:
+        return {}
+
+    if sum(len(m) for m in memo.values()) + count > MEMO_MAX_SIZE:
+        memo.clear()
+
+    return memo.setdefault(attribute_key, {})
+
+
+def _session_memo(session: sa_orm.Session) -> dict:
+    memo = session.info.get(_MEMO_INFO_KEY)
+
+    if memo is None:
+        memo = session.info[_MEMO_INFO_KEY] = {}
+
+        def reset(*args: Any) -> None:
+            session.info[_MEMO_INFO_KEY] = {}
+
+        sa.event.listen(session, "after_flush", reset)
+        sa.event.listen(session, "after_transaction_end", reset)
+
+    return memo
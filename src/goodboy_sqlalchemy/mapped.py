@@ -1,14 +1,53 @@
 from __future__ import annotations
 
-from typing import Any, Mapping, Optional
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+)
 
 import goodboy as gb
+import sqlalchemy as sa
+import sqlalchemy.exc as sa_exc
 import sqlalchemy.orm as sa_orm
+import sqlalchemy.orm.exc as sa_orm_exc
 from goodboy.schema import Rule
 
+from goodboy_sqlalchemy.batch import BatchAbortedError, ErrorSink
 from goodboy_sqlalchemy.column import ColumnBuilder, column_builder
-from goodboy_sqlalchemy.mapped_key import MappedKeyBuilder, mapped_key_builder
+from goodboy_sqlalchemy.deadline import (
+    DEADLINE_CONTEXT_KEY,
+    DeadlineExceeded,
+    check_deadline,
+    deadline_scope,
+)
+from goodboy_sqlalchemy.immutable import Immutable
+from goodboy_sqlalchemy.loader import (
+    LOADER_CONTEXT_KEY,
+    Loader,
+    LoadOwner,
+    requested_by,
+)
+from goodboy_sqlalchemy.mapped_key import (
+    MappedColumnKey,
+    MappedKey,
+    MappedKeyBuilder,
+    MappedRelationshipKey,
+    mapped_key_builder,
+)
 from goodboy_sqlalchemy.messages import DEFAULT_MESSAGES
+from goodboy_sqlalchemy.stats import Counters
+from goodboy_sqlalchemy.unique import composite_unique_columns
+
+if TYPE_CHECKING:
+    from goodboy_sqlalchemy.concurrent_checks import ConcurrentChecks
+    from goodboy_sqlalchemy.sharding import ShardedChecks
+    from goodboy_sqlalchemy.snapshot import SchemaSnapshot
 
 
 class MappedInstanceProxyKeyError(Exception):
@@ -21,7 +60,9 @@ class MappedInstanceProxyKeyError(Exception):
 
 
 class MappedInstanceProxy(Mapping[str, Any]):
-    def __init__(self, mapped_instance, key_names: list[str], override_values: dict):
+    def __init__(
+        self, mapped_instance, key_names: Sequence[str], override_values: dict
+    ):
         self._mapped_instance = mapped_instance
         self._key_names = key_names
         self._override_values = override_values
@@ -64,31 +105,193 @@ class MappedError(Exception):
     pass
 
 
-class Mapped(gb.Schema, gb.SchemaErrorMixin, gb.SchemaRulesMixin):
+class Mapped(gb.Schema, gb.SchemaErrorMixin, gb.SchemaRulesMixin, Immutable):
+    """
+    Schema of mapped class instance data.
+
+    Schema is immutable after construction (key and rule sequences are copied to
+    tuples, built keys and columns are immutable), so a single instance can be
+    shared by all threads. Custom keys (``gb.Key`` instances) and rules are used
+    as given, they must not be changed once the schema is built. Each thread
+    must use its own session.
+
+    Variants of a schema (for create, update and patch payloads) are derived with
+    :meth:`partial`, :meth:`only`, :meth:`exclude` and :meth:`extend`, sharing
+    built keys, column schemas and compiled statements of the schema.
+
+    Validation time is bounded by ``deadline`` context key (``time.monotonic()``
+    value): it is checked between keys, and exceeded deadline fails validation
+    with ``timeout`` error. Running database statements are interrupted after
+    the deadline on engines set up with
+    :func:`goodboy_sqlalchemy.deadline.install_statement_timeouts`.
+
+    With ``concurrent_checks`` database checks of a payload run after its keys
+    are validated, concurrently (see :class:`ConcurrentChecks`), unless
+    ``fail_fast`` is set.
+
+    With ``report_conflicts`` uniqueness checks select the conflicting row, so
+    ``already_exists`` errors have its primary key in ``pk`` argument (see
+    :meth:`MappedColumnKey.conflict_errors`).
+
+    With ``check_references`` values of foreign key columns are checked for
+    existence of the referenced rows (``does_not_exist`` error), by validation
+    of single payloads and by :meth:`validate_many` alike.
+    """
+
     def __init__(
         self,
         sa_mapped_class: type,
-        keys: list[gb.Key] = [],
-        column_names: list[str] = [],
+        keys: Sequence[gb.Key] = (),
+        column_names: Sequence[str] = (),
         column_builder: ColumnBuilder = column_builder,
         mapped_key_builder: MappedKeyBuilder = mapped_key_builder,
         messages: gb.MessageCollectionType = DEFAULT_MESSAGES,
-        rules: list[Rule] = [],
+        rules: Sequence[Rule] = (),
+        snapshot: Optional[SchemaSnapshot] = None,
+        optimistic_unique: bool = False,
+        defer_db_checks: bool = False,
+        fail_fast: bool = False,
+        sharded_checks: Optional[ShardedChecks] = None,
+        concurrent_checks: Optional[ConcurrentChecks] = None,
+        report_conflicts: bool = False,
+        check_references: bool = False,
     ):
         super().__init__()
 
         self._sa_mapped_class = sa_mapped_class
         self._messages = messages
-        self._rules = rules
+        self._rules = tuple(rules)
+        self._defer_db_checks = defer_db_checks
+        self._fail_fast = fail_fast
+        self._partial = False
+        self._mapped_key_builder = mapped_key_builder
+        self._check_unique = not optimistic_unique
+        self._sharded_checks = sharded_checks
+        self._concurrent_checks = concurrent_checks
+        self._report_conflicts = report_conflicts
+        self._check_references = check_references
+        self._stats = _new_stats()
+
+        if snapshot is not None:
+            mapped_snapshot = snapshot.get(sa_mapped_class)
+            columns = mapped_snapshot.get_columns(column_names)
+        else:
+            mapped_snapshot = None
+            columns = column_builder.build(sa_mapped_class, column_names)
+
+        self._mapped_snapshot = mapped_snapshot
+        self._keys = tuple(keys) + tuple(columns)
+        self._mapped_keys = tuple(self._build_mapped_keys(self._keys))
+        self._mapped_key_names = tuple(mk.name for mk in self._mapped_keys)
+
+    @property
+    def sa_mapped_class(self) -> type:
+        return self._sa_mapped_class
+
+    @property
+    def stats(self) -> Counters:
+        """
+        Validation counters. Database checks are counted (and skipped for invalid
+        payloads) only for schemas created with ``defer_db_checks=True``.
+        """
+
+        return self._stats
 
-        self._keys = keys + column_builder.build(sa_mapped_class, column_names)
-        self._mapped_keys = mapped_key_builder.build(
-            sa_mapped_class, self._keys, messages
+    def partial(self) -> Mapped:
+        """
+        Derive schema of partial payloads: missing keys are neither required nor
+        filled with default values, like when validating an existing instance.
+        """
+
+        return self._derive(self._keys, self._mapped_keys, partial=True)
+
+    def only(self, *names: str) -> Mapped:
+        """
+        Derive schema with given keys only.
+        """
+
+        self._check_key_names(names)
+
+        return self._derive_filtered(lambda name: name in names)
+
+    def exclude(self, *names: str) -> Mapped:
+        """
+        Derive schema without given keys.
+        """
+
+        self._check_key_names(names)
+
+        return self._derive_filtered(lambda name: name not in names)
+
+    def extend(self, keys: Sequence[gb.Key]) -> Mapped:
+        """
+        Derive schema with additional keys, keys with names of existing keys
+        replace them. Only the new keys are built.
+        """
+
+        new_keys = {key.name: key for key in keys}
+        new_mapped_keys = dict(
+            zip(new_keys, self._build_mapped_keys(tuple(new_keys.values())))
         )
-        self._mapped_key_names = [mk.name for mk in self._mapped_keys]
 
-    def __call__(self, value, *, typecast=False, context: dict = {}):
-        if not context.get("session"):
+        result_keys = [new_keys.pop(key.name, key) for key in self._keys]
+        result_keys += new_keys.values()
+
+        result_mapped_keys = [
+            new_mapped_keys.pop(mk.name, mk) for mk in self._mapped_keys
+        ]
+        result_mapped_keys += new_mapped_keys.values()
+
+        return self._derive(result_keys, result_mapped_keys)
+
+    def _build_mapped_keys(self, keys: Sequence[gb.Key]) -> list[MappedKey]:
+        return self._mapped_key_builder.build(
+            self._sa_mapped_class,
+            list(keys),
+            self._messages,
+            self._mapped_snapshot,
+            check_unique=self._check_unique,
+            sharded_checks=self._sharded_checks,
+            report_conflicts=self._report_conflicts,
+            check_references=self._check_references,
+        )
+
+    def _check_key_names(self, names: Sequence[str]) -> None:
+        unknown_names = [n for n in names if n not in self._mapped_key_names]
+
+        if unknown_names:
+            raise MappedError(f"schema has no keys {', '.join(unknown_names)}")
+
+    def _derive_filtered(self, predicate) -> Mapped:
+        return self._derive(
+            [key for key in self._keys if predicate(key.name)],
+            [mk for mk in self._mapped_keys if predicate(mk.name)],
+        )
+
+    def _derive(
+        self,
+        keys: Sequence[gb.Key],
+        mapped_keys: Sequence[MappedKey],
+        *,
+        partial: Optional[bool] = None,
+    ) -> Mapped:
+        # Mapped is immutable, so derived schema is constructed from a copy of
+        # attributes instead of __init__, which would introspect mapped class
+        # and build every key again.
+        derived = object.__new__(type(self))
+        derived.__dict__.update(
+            self.__dict__,
+            _keys=tuple(keys),
+            _mapped_keys=tuple(mapped_keys),
+            _mapped_key_names=tuple(mk.name for mk in mapped_keys),
+            _partial=self._partial if partial is None else partial,
+            _stats=_new_stats(),
+        )
+
+        return derived
+
+    def __call__(self, value, *, typecast=False, context: Optional[dict] = None):
+        if context is None or not context.get("session"):
             raise MappedError(
                 "session instance is required in Mapped validation context"
             )
@@ -102,14 +305,370 @@ class Mapped(gb.Schema, gb.SchemaErrorMixin, gb.SchemaRulesMixin):
 
         session: sa_orm.Session = context["session"]
         instance: Any = context.get("mapped_instance")
+        loader = Loader(session)
+        context = {**context, LOADER_CONTEXT_KEY: loader}
 
-        value, errors = self._validate(value, typecast, context, session, instance)
+        with self._deadline_scope(context):
+            value, errors = self._validate(value, typecast, context, session, instance)
+            self._resolve_loads(loader, errors)
 
         if errors:
             raise gb.SchemaError(errors)
 
         return value
 
+    def revalidate(
+        self,
+        previous_value: dict,
+        previous_result: dict,
+        delta: dict,
+        *,
+        typecast=False,
+        context: Optional[dict] = None,
+    ):
+        """
+        Validate payload that differs from already validated one by ``delta``
+        (new values of changed keys), return the same result as validation of
+        the whole payload would.
+
+        Only changed keys are validated (with their database checks), results of
+        other keys given in ``previous_value`` are reused from
+        ``previous_result``. Predicates are evaluated again for all keys, and
+        default values are applied again to missing keys. Rules run again on the
+        new result, except for rules with ``depends_on`` attribute (collection of
+        result key names) that depend on none of the changed result keys, so
+        rules must accept their own results as input.
+
+        :param previous_value: Payload validated by this schema.
+        :param previous_result: Result of successful validation of the payload.
+        :param delta: Changed keys with their new input values.
+        """
+
+        if context is None or not context.get("session"):
+            raise MappedError(
+                "session instance is required in Mapped validation context"
+            )
+
+        if not isinstance(delta, dict):
+            error = self._error(
+                "unexpected_type", {"expected_type": gb.type_name("dict")}
+            )
+
+            raise gb.SchemaError([error])
+
+        # results of default values are not reused: keys may be missing from
+        # the result now, if their predicates no longer hold
+        reuse = {
+            mk.result_key_name: previous_result[mk.result_key_name]
+            for mk in self._mapped_keys
+            if mk.name in previous_value
+            and mk.name not in delta
+            and mk.result_key_name in previous_result
+        }
+        value = {**previous_value, **delta}
+
+        session: sa_orm.Session = context["session"]
+        instance: Any = context.get("mapped_instance")
+        loader = Loader(session)
+        context = {**context, LOADER_CONTEXT_KEY: loader}
+
+        with self._deadline_scope(context):
+            value, errors = self._validate(
+                value, typecast, context, session, instance, reuse=reuse
+            )
+            self._resolve_loads(loader, errors)
+
+        if errors:
+            raise gb.SchemaError(errors)
+
+        return value
+
+    def validate_many(
+        self,
+        values: Iterable[Any],
+        *,
+        typecast=False,
+        context: Optional[dict] = None,
+        errors: ErrorSink,
+        max_errors: Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[tuple[int, dict]]:
+        """
+        Validate values of many new rows, yield pairs of row index and result for
+        valid rows, pass errors of invalid rows to error sink.
+
+        Rows are validated in chunks: database checks of a chunk run for rows
+        that passed other checks, with one query per column and check. Unique
+        values are checked against values of all previous rows.
+
+        To validate identical payloads once, see
+        :class:`goodboy_sqlalchemy.batch.Deduplicator`.
+
+        :param errors: Error sink, see :mod:`goodboy_sqlalchemy.batch`.
+        :param max_errors: Raise :class:`BatchAbortedError` as soon as more rows
+            than that are invalid.
+        :param chunk_size: Number of rows checked in database at once.
+        """
+
+        if context is None or not context.get("session"):
+            raise MappedError(
+                "session instance is required in Mapped validation context"
+            )
+
+        if context.get("mapped_instance") is not None:
+            raise MappedError(
+                "validate_many is not supported for existing mapped instances"
+            )
+
+        session: sa_orm.Session = context["session"]
+        loader = Loader(session)
+        context = {**context, LOADER_CONTEXT_KEY: loader}
+        chunk: list[tuple[int, dict]] = []
+        seen: dict = {}
+
+        for index, value in enumerate(values):
+            if not isinstance(value, dict):
+                error = self._error(
+                    "unexpected_type", {"expected_type": gb.type_name("dict")}
+                )
+                self._add_batch_errors(errors, max_errors, index, [error])
+                continue
+
+            # deadline is not set while the caller consumes results
+            with self._deadline_scope(context), loader.requested_by(index):
+                result, row_errors = self._validate(
+                    value, typecast, context, session, check_db=False
+                )
+
+            if row_errors:
+                self._add_batch_errors(errors, max_errors, index, row_errors)
+                continue
+
+            chunk.append((index, result))
+
+            if len(chunk) >= chunk_size:
+                yield from self._check_chunk(
+                    chunk, session, context, loader, errors, max_errors, seen
+                )
+                chunk = []
+
+        if chunk:
+            yield from self._check_chunk(
+                chunk, session, context, loader, errors, max_errors, seen
+            )
+
+    def _check_chunk(
+        self,
+        chunk: list[tuple[int, dict]],
+        session: sa_orm.Session,
+        context: dict,
+        loader: Loader,
+        errors: ErrorSink,
+        max_errors: Optional[int],
+        seen: dict,
+    ) -> list[tuple[int, dict]]:
+        with self._deadline_scope(context):
+            chunk_errors = self._check_many(
+                [result for _, result in chunk], session, seen
+            )
+            chunk_indices = {index: i for i, (index, _) in enumerate(chunk)}
+
+            for owner, load_errors in loader.resolve():
+                # loads of rows that failed before database checks are ignored
+                if owner[0] in chunk_indices:
+                    self._merge_rule_errors(
+                        self._nest_load_errors(owner[1:], load_errors),
+                        chunk_errors.setdefault(chunk_indices[owner[0]], []),
+                    )
+
+        valid = []
+
+        for chunk_index, (index, result) in enumerate(chunk):
+            if chunk_index in chunk_errors:
+                self._add_batch_errors(
+                    errors, max_errors, index, chunk_errors[chunk_index]
+                )
+            else:
+                valid.append((index, result))
+
+        return valid
+
+    def duplicate_errors(self, result: dict) -> list[gb.Error]:
+        """
+        Get errors of a new row identical to a valid row of the same batch with
+        given result: values of unique columns conflict with each other.
+        """
+
+        errors = {}
+
+        for mapped_key in self._mapped_keys:
+            name = mapped_key.result_key_name
+
+            if name in result:
+                key_errors = mapped_key.duplicate_errors(result[name])
+
+                if key_errors:
+                    errors[mapped_key.name] = key_errors
+
+        if errors:
+            return [self._error("value_errors", nested_errors=errors)]
+
+        return []
+
+    def _add_batch_errors(
+        self,
+        errors: ErrorSink,
+        max_errors: Optional[int],
+        index: int,
+        row_errors: list[gb.Error],
+    ) -> None:
+        errors.add(index, row_errors)
+
+        if max_errors is not None and errors.error_count > max_errors:
+            raise BatchAbortedError(f"more than {max_errors} rows are invalid")
+
+    def warmup(self, engine: sa.Engine) -> None:
+        """
+        Compile database check statements for engine dialect into the engine
+        compiled cache, so the first validation does not pay statement
+        compilation latency. No statements are executed.
+        """
+
+        with engine.connect() as connection:
+            for mapped_key in self._mapped_keys:
+                if isinstance(mapped_key, MappedColumnKey):
+                    mapped_key.warmup(connection)
+
+    def insert(self, value, *, typecast=False, context: Optional[dict] = None) -> Any:
+        """
+        Validate value and insert it as a new row of the mapped class, return
+        primary key of the inserted row.
+
+        Intended for schemas created with ``optimistic_unique=True``: instead of
+        querying every unique column before insert, the row is inserted with
+        ``ON CONFLICT DO NOTHING RETURNING`` (PostgreSQL and SQLite) or inside a
+        savepoint (other dialects). Only when the insert conflicts, unique
+        columns are queried to report ``already_exists`` errors the same way
+        validation does. Conflicts under constraints of several columns are
+        reported with ``already_exists`` error of the whole value, other
+        integrity errors are raised.
+
+        Only values of column keys are inserted, values of other keys (not
+        mapped to columns, such as password confirmation) are only validated.
+        Schemas with relationship keys are not supported.
+        """
+
+        context = context or {}
+
+        if context.get("mapped_instance") is not None:
+            raise MappedError("insert is not supported for existing mapped instances")
+
+        if any(isinstance(mk, MappedRelationshipKey) for mk in self._mapped_keys):
+            raise MappedError("insert is not supported for schemas with relationships")
+
+        with self._deadline_scope(context):
+            return self._insert(value, typecast, context)
+
+    def _insert(self, value: Any, typecast: bool, context: dict) -> Any:
+        result = self(value, typecast=typecast, context=context)
+        session: sa_orm.Session = context["session"]
+
+        column_keys = [
+            mk
+            for mk in self._mapped_keys
+            if isinstance(mk, MappedColumnKey) and mk.result_key_name in result
+        ]
+        values = {mk.result_key_name: result[mk.result_key_name] for mk in column_keys}
+
+        sa_pk_columns = sa.inspect(self._sa_mapped_class).primary_key
+        dialect_name = session.get_bind(self._sa_mapped_class).dialect.name
+
+        if dialect_name in ("postgresql", "sqlite"):
+            if dialect_name == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+
+            statement = (
+                insert(self._sa_mapped_class)
+                .values(values)
+                .on_conflict_do_nothing()
+                .returning(*sa_pk_columns)
+            )
+            row = session.execute(statement).first()
+
+            if row is not None:
+                return row[0]
+        else:
+            statement = sa.insert(self._sa_mapped_class).values(values)
+
+            try:
+                with session.begin_nested():
+                    return session.execute(statement).inserted_primary_key[0]
+            except sa_exc.IntegrityError:
+                errors = self._unique_errors(column_keys, values, session)
+
+                if not errors:
+                    if not self._composite_conflict_exists(values, session):
+                        raise
+
+                    errors = [self._error("already_exists")]
+
+                raise gb.SchemaError(errors)
+
+        errors = self._unique_errors(column_keys, values, session)
+
+        if not errors:
+            errors = [self._error("already_exists")]
+
+        raise gb.SchemaError(errors)
+
+    def _unique_errors(
+        self,
+        column_keys: list[MappedColumnKey],
+        values: dict,
+        session: sa_orm.Session,
+    ) -> list[gb.Error]:
+        value_errors = {}
+
+        for mk in column_keys:
+            if mk.unique:
+                errors = mk.conflict_errors(values[mk.result_key_name], session)
+
+                if errors:
+                    value_errors[mk.name] = errors
+
+        if not value_errors:
+            return []
+
+        return [self._error("value_errors", nested_errors=value_errors)]
+
+    def _composite_conflict_exists(self, values: dict, session: sa_orm.Session) -> bool:
+        """
+        Check if a stored row conflicts with values under a unique constraint or
+        unique index of several columns.
+        """
+
+        sa_mapper = sa.inspect(self._sa_mapped_class)
+
+        for sa_columns in composite_unique_columns(sa_mapper.local_table):
+            try:
+                names = [sa_mapper.get_property_by_column(c).key for c in sa_columns]
+            except sa_orm_exc.UnmappedColumnError:
+                continue
+
+            # rows with nulls do not conflict
+            if any(values.get(name) is None for name in names):
+                continue
+
+            clause = sa.and_(*[c == values[name] for c, name in zip(sa_columns, names)])
+
+            with session.no_autoflush:
+                if session.execute(sa.select(sa.exists().where(clause))).scalar():
+                    return True
+
+        return False
+
     def _validate(
         self,
         value: dict,
@@ -117,58 +676,363 @@ class Mapped(gb.Schema, gb.SchemaErrorMixin, gb.SchemaRulesMixin):
         context: dict,
         session: sa_orm.Session,
         instance: Optional[Any] = None,
+        *,
+        check_db: bool = True,
+        reuse: Optional[dict] = None,
     ):
+        """
+        Validate value by mapped keys and rules.
+
+        By default each key runs its database checks right after its value is
+        validated. With ``defer_db_checks`` database checks run only after all
+        keys are validated without errors, and rules run only when both passed,
+        so invalid payloads cost no queries. With ``fail_fast`` validation stops
+        at the first failed key. With concurrent checks database checks run
+        after all keys are validated, without waiting for each other.
+
+        Results in ``reuse`` (by result key name) are taken as is instead of
+        validating values of their keys, see :meth:`revalidate`.
+        """
+
+        self._stats.increment("validations")
+
+        concurrent_checks = (
+            self._concurrent_checks if check_db and not self._fail_fast else None
+        )
+        defer_db_checks = (
+            self._defer_db_checks or not check_db or concurrent_checks is not None
+        )
+        instance = context.get("mapped_instance")
+
+        result, key_errors, value_errors, db_checks = self._validate_keys(
+            value, typecast, context, session, instance, defer_db_checks, reuse
+        )
+
+        if check_db and self._defer_db_checks:
+            db_checks = self._run_deferred_db_checks(
+                value,
+                db_checks,
+                bool(key_errors or value_errors),
+                context,
+                session,
+                instance,
+                value_errors,
+                run=concurrent_checks is None,
+                reuse=reuse,
+            )
+
+        if concurrent_checks is not None and db_checks:
+            self._check_concurrently(
+                concurrent_checks,
+                db_checks,
+                context,
+                session,
+                instance,
+                value_errors,
+            )
+
+        errors: list[gb.Error] = []
+
+        if key_errors:
+            errors.append(self._error("key_errors", nested_errors=key_errors))
+
+        if value_errors:
+            errors.append(self._error("value_errors", nested_errors=value_errors))
+
+        if errors and (self._defer_db_checks or self._fail_fast):
+            if self._rules:
+                self._stats.increment("rules_skipped")
+
+            return result, errors
+
+        check_deadline()
+
+        with requested_by(context, None):
+            if reuse is None:
+                result, rule_errors = self._call_rules(result.copy(), typecast, context)
+            else:
+                result, rule_errors = self._call_changed_rules(
+                    result.copy(), reuse, typecast, context
+                )
+
+        self._merge_rule_errors(rule_errors, errors)
+
+        return result, errors
+
+    def _validate_keys(
+        self,
+        value: dict,
+        typecast: bool,
+        context: dict,
+        session: sa_orm.Session,
+        instance: Optional[Any],
+        defer_db_checks: bool,
+        reuse: Optional[dict],
+    ) -> tuple[dict, dict, dict, list[tuple[MappedKey, Any]]]:
+        """
+        Validate values by mapped keys, return result, key errors, value errors
+        and deferred database checks (pairs of mapped key and its result).
+        """
+
         result: dict = {}
 
-        key_errors = {}
-        value_errors = {}
+        key_errors: dict = {}
+        value_errors: dict = {}
 
         unknown_keys = list(value.keys())
+        db_checks: list[tuple[MappedKey, Any]] = []
 
-        instance = context.get("mapped_instance")
         instance_proxy = MappedInstanceProxy(instance, self._mapped_key_names, value)
 
         for mapped_key in self._mapped_keys:
+            if self._fail_fast and (key_errors or value_errors):
+                break
+
+            check_deadline()
+
             if not mapped_key.predicate_result(instance_proxy):
                 continue
 
-            if mapped_key.name in unknown_keys:
-                unknown_keys.remove(mapped_key.name)
+            if mapped_key.name not in unknown_keys:
+                self._add_missing_key(mapped_key, instance, result, key_errors)
+                continue
+
+            unknown_keys.remove(mapped_key.name)
 
-                try:
-                    key_value = mapped_key.validate(
+            if reuse is not None and mapped_key.result_key_name in reuse:
+                result[mapped_key.result_key_name] = reuse[mapped_key.result_key_name]
+                continue
+
+            validate = (
+                mapped_key.validate_value if defer_db_checks else mapped_key.validate
+            )
+
+            try:
+                with requested_by(context, mapped_key.name):
+                    key_value = validate(
                         value[mapped_key.name],
                         typecast,
                         context,
                         session,
                         instance,
                     )
+            except gb.SchemaError as e:
+                value_errors[mapped_key.name] = e.errors
+            else:
+                result[mapped_key.result_key_name] = key_value
+
+                if defer_db_checks and mapped_key.has_db_checks:
+                    db_checks.append((mapped_key, key_value))
+
+        if not (self._fail_fast and (key_errors or value_errors)):
+            self._add_unknown_keys(unknown_keys, key_errors)
+
+        return result, key_errors, value_errors, db_checks
+
+    def _add_missing_key(
+        self,
+        mapped_key: MappedKey,
+        instance: Optional[Any],
+        result: dict,
+        key_errors: dict,
+    ) -> None:
+        if instance is not None or self._partial:
+            return
+
+        if mapped_key.required:
+            key_errors[mapped_key.name] = [self._error("required_key")]
+        elif mapped_key.default is not None:
+            result[mapped_key.result_key_name] = mapped_key.default
+
+    def _add_unknown_keys(self, unknown_keys: list[str], key_errors: dict) -> None:
+        for key_name in unknown_keys:
+            key_errors[key_name] = [self._error("unknown_key")]
+
+            if self._fail_fast:
+                break
+
+    def _run_deferred_db_checks(
+        self,
+        value: dict,
+        db_checks: list[tuple[MappedKey, Any]],
+        failed: bool,
+        context: dict,
+        session: sa_orm.Session,
+        instance: Optional[Any],
+        value_errors: dict,
+        *,
+        run: bool,
+        reuse: Optional[dict],
+    ) -> list[tuple[MappedKey, Any]]:
+        """
+        Run database checks deferred with ``defer_db_checks``, unless validation
+        already failed, and count them. With ``run=False`` checks are only
+        counted and returned, to be run concurrently.
+        """
+
+        skipped_db_checks = sum(
+            1
+            for mk in self._mapped_keys
+            if mk.has_db_checks
+            and mk.name in value
+            and (reuse is None or mk.result_key_name not in reuse)
+            and all(mk is not checked_mk for checked_mk, _ in db_checks)
+        )
+
+        if failed:
+            skipped_db_checks += len(db_checks)
+            db_checks = []
+
+        if not run:
+            self._stats.increment("db_checks", len(db_checks))
+        else:
+            for index, (mapped_key, key_value) in enumerate(db_checks):
+                check_deadline()
+                self._stats.increment("db_checks")
+
+                try:
+                    mapped_key.check_value(key_value, context, session, instance)
                 except gb.SchemaError as e:
                     value_errors[mapped_key.name] = e.errors
+
+                    if self._fail_fast:
+                        skipped_db_checks += len(db_checks) - index - 1
+                        break
+
+        if skipped_db_checks:
+            self._stats.increment("db_checks_skipped", skipped_db_checks)
+
+        return db_checks
+
+    def _check_concurrently(
+        self,
+        concurrent_checks: ConcurrentChecks,
+        db_checks: list[tuple[MappedKey, Any]],
+        context: dict,
+        session: sa_orm.Session,
+        instance: Optional[Any],
+        value_errors: dict,
+    ) -> None:
+        """
+        Run database checks of keys with concurrent checks, keys that do not
+        support them are checked with session first.
+        """
+
+        check_deadline()
+
+        check_errors: dict[str, list[gb.Error]] = {}
+        queries = []
+
+        for mapped_key, key_value in db_checks:
+            try:
+                query = mapped_key.concurrent_check(
+                    key_value, context, session, instance
+                )
+
+                if query is None:
+                    mapped_key.check_value(key_value, context, session, instance)
                 else:
-                    result[mapped_key.result_key_name] = key_value
-            elif instance is None:
-                if mapped_key.required:
-                    key_errors[mapped_key.name] = [self._error("required_key")]
-                elif mapped_key.default is not None:
-                    result[mapped_key.result_key_name] = mapped_key.default
+                    queries.append((mapped_key, query))
+            except gb.SchemaError as e:
+                check_errors[mapped_key.name] = e.errors
 
-        errors: list[gb.Error] = []
+        engine = session.get_bind(self._sa_mapped_class).engine
+        results = concurrent_checks.run(engine, [query for _, query in queries])
 
-        for key_name in unknown_keys:
-            key_errors[key_name] = [self._error("unknown_key")]
+        for (mapped_key, _), errors in zip(queries, results):
+            if errors:
+                check_errors[mapped_key.name] = errors
 
-        if key_errors:
-            errors.append(self._error("key_errors", nested_errors=key_errors))
+        # errors are added in order of keys, like with sequential checks
+        for mapped_key, _ in db_checks:
+            if mapped_key.name in check_errors:
+                value_errors[mapped_key.name] = check_errors[mapped_key.name]
 
-        if value_errors:
-            errors.append(self._error("value_errors", nested_errors=value_errors))
+    @contextmanager
+    def _deadline_scope(self, context: dict) -> Iterator[None]:
+        """
+        Set deadline of ``deadline`` context key (``time.monotonic()`` value),
+        fail with ``timeout`` error when it is exceeded.
+        """
 
-        result, rule_errors = self._call_rules(result.copy(), typecast, context)
+        try:
+            with deadline_scope(context.get(DEADLINE_CONTEXT_KEY)):
+                yield
+        except DeadlineExceeded:
+            raise gb.SchemaError([self._error("timeout")]) from None
 
-        self._merge_rule_errors(rule_errors, errors)
+    def _resolve_loads(self, loader: Loader, errors: list[gb.Error]) -> None:
+        """
+        Resolve loads requested by keys and rules and merge their errors, unless
+        validation failed and database checks are skipped for invalid payloads.
+        """
 
-        return result, errors
+        if errors and (self._defer_db_checks or self._fail_fast):
+            return
+
+        for owner, load_errors in loader.resolve():
+            self._merge_rule_errors(self._nest_load_errors(owner, load_errors), errors)
+
+    def _nest_load_errors(
+        self, owner: LoadOwner, errors: list[gb.Error]
+    ) -> list[gb.Error]:
+        for key in reversed(owner):
+            # None stands for rules, their errors are not nested
+            if key is not None:
+                errors = [self._error("value_errors", nested_errors={key: errors})]
+
+        return errors
+
+    def _call_changed_rules(
+        self, value: dict, reuse: dict, typecast: bool, context: dict
+    ) -> tuple[dict, list[gb.Error]]:
+        changed_keys = {
+            k
+            for k in value.keys() | reuse.keys()
+            if k not in value or k not in reuse or value[k] is not reuse[k]
+        }
+        result_errors: list[gb.Error] = []
+
+        for rule in self._rules:
+            depends_on = getattr(rule, "depends_on", None)
+
+            if depends_on is not None and changed_keys.isdisjoint(depends_on):
+                continue
+
+            value, errors = rule(self, value, typecast, context)
+            result_errors += errors
+
+        return value, result_errors
+
+    def _check_many(
+        self,
+        results: list[dict],
+        session: sa_orm.Session,
+        seen: Optional[dict] = None,
+    ) -> dict[int, list[gb.Error]]:
+        """
+        Run database checks for results of many new rows validated with
+        ``check_db=False``, with one query per column and check.
+
+        :param seen: Unique values of previous chunks of the batch, see
+            :meth:`ColumnChecks.duplicates`.
+        """
+
+        value_errors: dict[int, dict] = {}
+
+        for mapped_key in self._mapped_keys:
+            name = mapped_key.result_key_name
+            values = {i: r[name] for i, r in enumerate(results) if name in r}
+
+            key_errors = mapped_key.check_many(values, session, seen)
+
+            for index, errors in key_errors.items():
+                value_errors.setdefault(index, {})[mapped_key.name] = errors
+
+        return {
+            index: [self._error("value_errors", nested_errors=errors)]
+            for index, errors in value_errors.items()
+        }
 
     def _merge_rule_errors(self, rule_errors: list[gb.Error], to: list[gb.Error]):
         for rule_error in rule_errors:
@@ -182,3 +1046,7 @@ class Mapped(gb.Schema, gb.SchemaErrorMixin, gb.SchemaRulesMixin):
                     break
             else:
                 to.append(rule_error)
+
+
+def _new_stats() -> Counters:
+    return Counters("validations", "db_checks", "db_checks_skipped", "rules_skipped")
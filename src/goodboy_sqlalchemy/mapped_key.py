@@ -1,17 +1,36 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod, abstractproperty
-from typing import Any, Mapping, Optional
+from abc import abstractmethod, abstractproperty
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, Optional
 
 import goodboy as gb
 import sqlalchemy as sa
 import sqlalchemy.orm as sa_orm
+import sqlalchemy.orm.exc as sa_orm_exc
 
 from goodboy_sqlalchemy.column import Column
+from goodboy_sqlalchemy.immutable import Immutable
+from goodboy_sqlalchemy.loader import memoize, requested_by
 from goodboy_sqlalchemy.messages import DEFAULT_MESSAGES
+from goodboy_sqlalchemy.pending import AttributeKey, pending_index, track
+from goodboy_sqlalchemy.relationship import Relationship
+from goodboy_sqlalchemy.unique import (
+    ColumnChecks,
+    UniqueCriterion,
+    column_unique_criteria,
+    compile_cached,
+)
 
+if TYPE_CHECKING:
+    from goodboy_sqlalchemy.sharding import ShardedChecks
+    from goodboy_sqlalchemy.snapshot import MappedSnapshot
+
+
+class MappedKey(Immutable):
+    """
+    Key of ``Mapped`` schema, immutable after construction.
+    """
 
-class MappedKey(ABC):
     @abstractproperty
     def name(self): ...
 
@@ -40,6 +59,79 @@ class MappedKey(ABC):
         instance: Optional[Any] = None,
     ): ...
 
+    def validate_value(
+        self,
+        value,
+        typecast: bool,
+        context: dict,
+        session: sa_orm.Session,
+        instance: Optional[Any] = None,
+    ):
+        """
+        Validate value without database checks, keys with database checks
+        override it.
+        """
+
+        return self.validate(value, typecast, context, session, instance)
+
+    @property
+    def has_db_checks(self) -> bool:
+        return False
+
+    def check_value(
+        self,
+        value,
+        context: dict,
+        session: sa_orm.Session,
+        instance: Optional[Any] = None,
+    ) -> None:
+        """
+        Run database checks for value validated with :meth:`validate_value`,
+        raise ``SchemaError`` if checks failed.
+        """
+
+    def concurrent_check(
+        self,
+        value,
+        context: dict,
+        session: sa_orm.Session,
+        instance: Optional[Any] = None,
+    ) -> Optional[Callable[[sa.Connection], list[gb.Error]]]:
+        """
+        Prepare database checks of value to run concurrently with a connection
+        of their own: return query returning errors, or ``None`` if checks must
+        run with session by :meth:`check_value`. Raise ``SchemaError`` if value
+        fails checks that need no queries.
+        """
+
+        return None
+
+    def check_many(
+        self,
+        values: dict[int, Any],
+        session: sa_orm.Session,
+        seen: Optional[dict] = None,
+    ) -> dict[int, list[gb.Error]]:
+        """
+        Run database checks for values of many new rows validated with
+        :meth:`validate_value`, indexed by row number. Returns errors by row
+        number.
+
+        :param seen: Unique values of previous chunks of the batch, see
+            :meth:`ColumnChecks.duplicates`.
+        """
+
+        return {}
+
+    def duplicate_errors(self, value) -> list[gb.Error]:
+        """
+        Get errors of value of a new row that duplicates another new row of the
+        same batch, in addition to errors of that row: values of unique columns
+        conflict with each other.
+        """
+
+        return []
+
 
 class MappedColumnKey(MappedKey):
     def __init__(
@@ -50,6 +142,12 @@ class MappedColumnKey(MappedKey):
         sa_pk_column_property_name: str,
         column: Column,
         messages: gb.MessageCollectionType = DEFAULT_MESSAGES,
+        *,
+        check_unique: bool = True,
+        unique_criteria: Optional[list[UniqueCriterion]] = None,
+        sharded_checks: Optional[ShardedChecks] = None,
+        report_conflicts: bool = False,
+        check_references: bool = False,
     ):
         self._sa_mapped_class = sa_mapped_class
         self._sa_column = sa_column
@@ -57,6 +155,34 @@ class MappedColumnKey(MappedKey):
         self._sa_pk_column_property_name = sa_pk_column_property_name
         self._column = column
         self._messages = messages
+        self._check_unique = check_unique
+        self._unique_criteria = unique_criteria or [UniqueCriterion(sa_column)]
+        self._sharded_checks = sharded_checks
+        self._report_conflicts = report_conflicts
+        self._check_references = check_references
+        self._sa_attribute_name = (
+            _mapped_attribute_name(sa_mapped_class, sa_column)
+            if report_conflicts
+            else None
+        )
+        # Statements and tracking of pending values are built for unique columns
+        # only (statements are also used to map conflicts of optimistic inserts),
+        # other columns cost nothing extra to construct
+        self._db_checks = ColumnChecks(
+            sa_column,
+            self._unique_criteria if column.unique else [],
+            sa_pk_column,
+            references=check_references,
+        )
+
+        if self._column.unique:
+            self._pending_attribute_key = self._track_pending_values()
+            self._conflict_statements = (
+                self._build_conflict_statements() if report_conflicts else {}
+            )
+        else:
+            self._pending_attribute_key = None
+            self._conflict_statements = {}
 
     @property
     def name(self):
@@ -78,6 +204,10 @@ class MappedColumnKey(MappedKey):
     def default(self) -> Any:
         return self._column.default
 
+    @property
+    def unique(self) -> bool:
+        return self._column.unique
+
     def predicate_result(self, prev_values: Mapping[str, Any]) -> bool:
         return self._column.predicate_result(prev_values)
 
@@ -89,32 +219,481 @@ class MappedColumnKey(MappedKey):
         session: sa_orm.Session,
         instance: Optional[Any] = None,
     ):
-        value = self._column.validate(value, typecast, context)
+        value = self.validate_value(value, typecast, context, session, instance)
+        self.check_value(value, context, session, instance)
 
-        if self._column.unique:
-            query = sa_orm.Query(self._sa_mapped_class).filter(self._sa_column == value)
+        return value
 
-            if instance:
-                instance_pk = getattr(instance, self._sa_pk_column_property_name)
-                query = query.filter(self._sa_pk_column != instance_pk)
+    def validate_value(
+        self,
+        value,
+        typecast: bool,
+        context: dict,
+        session: sa_orm.Session,
+        instance: Optional[Any] = None,
+    ):
+        return self._column.validate(value, typecast, context)
 
-            exists = session.query(query.exists()).scalar()
+    @property
+    def has_db_checks(self) -> bool:
+        return self._unique_checked or self._db_checks.has_references
 
-            if exists:
-                raise gb.SchemaError([self._error("already_exists")])
+    @property
+    def _unique_checked(self) -> bool:
+        return self._column.unique and self._check_unique
 
-        return value
+    def check_value(
+        self,
+        value,
+        context: dict,
+        session: sa_orm.Session,
+        instance: Optional[Any] = None,
+    ) -> None:
+        errors: list[gb.Error] = []
+
+        if self._unique_checked:
+            errors += self.conflict_errors(value, session, instance)
+
+        if self._db_checks.has_references and value is not None:
+            with session.no_autoflush:
+                referenced_values = self._in_shards(
+                    session, [value], self._db_checks.referenced_values
+                )
+
+            errors += self._reference_errors(value, referenced_values)
+
+        if errors:
+            raise gb.SchemaError(errors)
+
+    def concurrent_check(
+        self,
+        value,
+        context: dict,
+        session: sa_orm.Session,
+        instance: Optional[Any] = None,
+    ) -> Optional[Callable[[sa.Connection], list[gb.Error]]]:
+        # sharded checks are already run concurrently, with session connections
+        if not self.has_db_checks or self._sharded_checks is not None:
+            return None
+
+        check_unique = self._unique_checked
+
+        if check_unique and self._pending_value_exists(value, session, instance):
+            raise gb.SchemaError([self._error("already_exists")])
+
+        # row with stale value is the only one the query could find
+        if check_unique and self._stale_values([value], session):
+            check_unique = False
+
+        check_references = self._db_checks.has_references and value is not None
+        dialect_name = session.get_bind(self._sa_mapped_class).dialect.name
+
+        # instance attributes are read here, session is not thread-safe
+        if not check_unique:
+            statement, params = None, {}
+        elif self._report_conflicts:
+            statement, params = self._conflict_query(dialect_name, value, instance)
+        else:
+            statement, params = self._exists_query(dialect_name, value, instance)
+
+        def query(connection: sa.Connection) -> list[gb.Error]:
+            errors = []
+
+            if not check_unique:
+                pass
+            elif self._report_conflicts:
+                row = connection.execute(statement, params).first()
+
+                if row is not None:
+                    errors.append(self._error("already_exists", {"pk": row[0]}))
+            elif connection.execute(statement, params).scalar():
+                errors.append(self._error("already_exists"))
+
+            if check_references:
+                referenced_values = self._db_checks.referenced_values(
+                    connection, dialect_name, [value]
+                )
+                errors += self._reference_errors(value, referenced_values)
+
+            return errors
+
+        return query
+
+    def check_many(
+        self,
+        values: dict[int, Any],
+        session: sa_orm.Session,
+        seen: Optional[dict] = None,
+    ) -> dict[int, list[gb.Error]]:
+        """
+        Check column values with one query per check: uniqueness (values are also
+        checked against each other and against ``seen`` values of previous
+        chunks) and existence of rows referenced by foreign keys.
+        """
+
+        distinct_values = _distinct_not_none(values.values())
+        existing_values: set = set()
+        duplicates: set[int] = set()
+        referenced_values: set = set()
+
+        if self._unique_checked:
+            existing_values = self.existing_values(distinct_values, session)
+            duplicates = self._batch_duplicates(values, session, seen)
+
+        if self._db_checks.has_references:
+            with session.no_autoflush:
+                referenced_values = self._in_shards(
+                    session, distinct_values, self._db_checks.referenced_values
+                )
+
+        failed_checks = self._db_checks.failed_checks(
+            values, existing_values, duplicates, referenced_values
+        )
+
+        return {
+            index: [self._error(code) for code in codes]
+            for index, codes in failed_checks.items()
+        }
+
+    def duplicate_errors(self, value) -> list[gb.Error]:
+        if self._unique_checked and value is not None:
+            return [self._error("already_exists")]
+
+        return []
+
+    def existing_values(self, values: list[Any], session: sa_orm.Session) -> set:
+        """
+        Find values already stored in unique column, with single query unless
+        column is covered by functional unique index, or set to pending objects
+        of session.
+        """
+
+        values = _distinct_not_none(values)
+
+        with session.no_autoflush:
+            result = self._in_shards(session, values, self._db_checks.existing_values)
+
+        result -= self._stale_values(result, session)
+
+        return result | {v for v in values if self._pending_value_exists(v, session)}
+
+    def value_exists(
+        self, value, session: sa_orm.Session, instance: Optional[Any] = None
+    ) -> bool:
+        """
+        Check if value is set to another pending or modified object of session
+        or stored in database, unless the row is modified or deleted in session.
+        Session is not flushed.
+        """
+
+        if self._pending_value_exists(value, session, instance):
+            return True
+
+        with session.no_autoflush:
+            exists = self._in_shards(
+                session,
+                [value],
+                lambda executor, dialect_name, _: self._value_exists(
+                    executor, dialect_name, value, instance
+                ),
+                stop=bool,
+            )
+
+        return exists and not self._stale_values([value], session)
+
+    def conflict_errors(
+        self, value, session: sa_orm.Session, instance: Optional[Any] = None
+    ) -> list[gb.Error]:
+        """
+        Return ``already_exists`` error if value exists (see :meth:`value_exists`).
+
+        With ``report_conflicts`` the error of a value stored in database has
+        primary key of the conflicting row in ``pk`` argument. The row is loaded
+        into the session by the same query and memoized like rows found by
+        :class:`Loader` (until the next flush or end of transaction), so
+        ``session.get()`` of the conflicting row needs no more queries.
+        """
+
+        if not self._report_conflicts:
+            if self.value_exists(value, session, instance):
+                return [self._error("already_exists")]
+
+            return []
+
+        if self._pending_value_exists(value, session, instance):
+            return [self._error("already_exists")]
+
+        with session.no_autoflush:
+            conflict = self._in_shards(
+                session,
+                [value],
+                lambda executor, dialect_name, _: self._find_conflict(
+                    executor, dialect_name, value, instance
+                ),
+                stop=bool,
+            )
+
+        if not conflict or self._stale_values([value], session):
+            return []
+
+        return [self._error("already_exists", {"pk": conflict[0]})]
+
+    def _batch_duplicates(
+        self,
+        values: dict[int, Any],
+        session: sa_orm.Session,
+        seen: Optional[dict] = None,
+    ) -> set[int]:
+        """
+        Find values conflicting with previous values of the batch, values
+        covered by functional unique index are compared by results of the index
+        expression computed by database.
+        """
+
+        distinct_values = _distinct_not_none(values.values())
+
+        def normalize(executor: Any) -> list[dict[Any, Any]]:
+            return self._db_checks.normalize(executor, distinct_values)
+
+        if self._db_checks.plain or not distinct_values:
+            normalized_values = normalize(None)
+        elif self._sharded_checks is None:
+            normalized_values = normalize(
+                session.connection(bind_arguments={"mapper": self._sa_mapped_class})
+            )
+        else:
+            # Expression results don't depend on stored rows, any shard will do
+            shard_ids = self._sharded_checks.choose_shards(
+                self._sa_column, distinct_values
+            )
+            results = self._sharded_checks.run(session, shard_ids[:1], normalize)
+            normalized_values = results[0] if results else []
+
+        return self._db_checks.duplicates(values, normalized_values, seen)
+
+    def _reference_errors(self, value, referenced_values: set) -> list[gb.Error]:
+        failed_checks = self._db_checks.failed_checks(
+            {0: value}, set(), set(), referenced_values
+        )
+
+        return [self._error(code) for code in failed_checks.get(0, [])]
+
+    def _track_pending_values(self) -> Optional[AttributeKey]:
+        # Values of pending objects are compared as is, so only columns checked
+        # by plain equality are tracked
+        if not self._unique_checked or not self._db_checks.unconditional:
+            return None
+
+        return track(self._sa_mapped_class, self._sa_column)
+
+    def _pending_value_exists(
+        self, value, session: sa_orm.Session, instance: Optional[Any] = None
+    ) -> bool:
+        if self._pending_attribute_key is None or value is None:
+            return False
+
+        return pending_index(session).contains(
+            self._pending_attribute_key, value, instance
+        )
+
+    def _stale_values(self, values: Iterable[Any], session: sa_orm.Session) -> set:
+        """
+        Get values found in database that are overridden by modified or deleted
+        objects of session, see :meth:`PendingIndex.stale_values`.
+        """
+
+        if self._pending_attribute_key is None:
+            return set()
+
+        return pending_index(session).stale_values(
+            self._pending_attribute_key, values, session
+        )
+
+    def _in_shards(
+        self,
+        session: sa_orm.Session,
+        values: list[Any],
+        query: Callable[[Any, str, list[Any]], Any],
+        stop: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Run query with session, or with connection of each shard the values may
+        be stored in and combine results (sets are joined, of other results the
+        first true one is returned).
+        """
+
+        if self._sharded_checks is None:
+            dialect_name = session.get_bind(self._sa_mapped_class).dialect.name
+            return query(session, dialect_name, values)
+
+        shard_ids = self._sharded_checks.choose_shards(self._sa_column, values)
+        results = self._sharded_checks.run(
+            session,
+            shard_ids,
+            lambda connection: query(connection, connection.dialect.name, values),
+            stop,
+        )
+
+        if stop is None:
+            return set().union(*results)
+
+        return next((r for r in results if r), False)
+
+    def _value_exists(
+        self,
+        executor: Any,
+        dialect_name: str,
+        value,
+        instance: Optional[Any] = None,
+    ) -> bool:
+        statement, params = self._exists_query(dialect_name, value, instance)
+
+        return bool(executor.execute(statement, params).scalar())
+
+    def _exists_query(
+        self, dialect_name: str, value, instance: Optional[Any] = None
+    ) -> tuple[sa.Select, dict[str, Any]]:
+        return self._db_checks.exists_query(
+            dialect_name, value, bool(instance), self._instance_pk(instance)
+        )
+
+    def _find_conflict(
+        self,
+        executor: Any,
+        dialect_name: str,
+        value,
+        instance: Optional[Any] = None,
+    ) -> Optional[tuple[Any]]:
+        """
+        Find row with the value, return tuple with its primary key.
+        """
+
+        if isinstance(executor, sa_orm.Session):
+            statement, params = self._conflict_query(
+                dialect_name, value, instance, entity=True
+            )
+            conflicting = executor.scalars(statement, params).first()
+
+            if conflicting is None:
+                return None
+
+            if self._sa_attribute_name is not None:
+                memoize(
+                    executor,
+                    getattr(self._sa_mapped_class, self._sa_attribute_name),
+                    conflicting,
+                )
+
+            return (getattr(conflicting, self._sa_pk_column_property_name),)
+
+        statement, params = self._conflict_query(dialect_name, value, instance)
+        row = executor.execute(statement, params).first()
+
+        return None if row is None else (row[0],)
+
+    def _conflict_query(
+        self,
+        dialect_name: str,
+        value,
+        instance: Optional[Any] = None,
+        *,
+        entity: bool = False,
+    ) -> tuple[sa.Select, dict[str, Any]]:
+        """
+        Get statement selecting primary key (or instance with ``entity``) of row
+        with the value.
+        """
+
+        statements = self._conflict_statements.get(
+            dialect_name, self._conflict_statements[None]
+        )
+        statement, excluding_statement = statements[2:] if entity else statements[:2]
+        params = self._db_checks.params(
+            value, bool(instance), self._instance_pk(instance)
+        )
+
+        return excluding_statement if instance else statement, params
+
+    def _instance_pk(self, instance: Optional[Any]) -> Any:
+        if not instance:
+            return None
+
+        return getattr(instance, self._sa_pk_column_property_name)
+
+    def warmup(self, connection: sa.Connection) -> None:
+        """
+        Compile statements of database checks for connection dialect and store
+        them in the engine compiled cache, so the first validation does not pay
+        statement compilation latency. No statements are executed.
+        """
+
+        self._db_checks.warmup(connection)
+
+        if self._conflict_statements:
+            conflict_statements = self._conflict_statements.get(
+                connection.dialect.name, self._conflict_statements[None]
+            )
+            param_names = [
+                self._db_checks.params(None),
+                self._db_checks.params(None, True),
+            ]
+
+            for statement, params in zip(conflict_statements, param_names * 2):
+                compile_cached(connection, statement, params)
+
+    def _build_conflict_statements(
+        self,
+    ) -> dict[Optional[str], tuple[sa.Select, sa.Select, sa.Select, sa.Select]]:
+        result = {}
+
+        for dialect_name in self._db_checks.dialect_names:
+            clause, excluding_clause = self._db_checks.unique_clauses(dialect_name)
+
+            result[dialect_name] = (
+                sa.select(self._sa_pk_column).where(clause).limit(1),
+                sa.select(self._sa_pk_column).where(excluding_clause).limit(1),
+                sa.select(self._sa_mapped_class).where(clause).limit(1),
+                sa.select(self._sa_mapped_class).where(excluding_clause).limit(1),
+            )
+
+        return result
 
     def _error(self, code: str, args: dict = {}, nested_errors: dict = {}):
         return gb.Error(code, args, nested_errors, self._messages.get_message(code))
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            # Statements and checks are built from other attributes and never
+            # equal
+            return _without_statements(self.__dict__) == _without_statements(
+                other.__dict__
+            )
 
         return super().__eq__(other)
 
 
+def _without_statements(d: dict) -> dict:
+    return {
+        k: v
+        for k, v in d.items()
+        if not k.endswith("_statements") and k != "_db_checks"
+    }
+
+
+def _mapped_attribute_name(sa_mapped_class: type, sa_column: Any) -> Optional[str]:
+    if isinstance(sa_column, sa_orm.QueryableAttribute):
+        return sa_column.key
+
+    try:
+        return sa.inspect(sa_mapped_class).get_property_by_column(sa_column).key
+    except sa_orm_exc.UnmappedColumnError:
+        return None
+
+
+def _distinct_not_none(values) -> list[Any]:
+    return list(dict.fromkeys(v for v in values if v is not None))
+
+
 class MappedPropertyKey(MappedKey):
     def __init__(self, key: gb.Key):
         self._key = key
@@ -159,6 +738,175 @@ class MappedPropertyKey(MappedKey):
         return super().__eq__(other)
 
 
+class MappedRelationshipKey(MappedKey):
+    def __init__(
+        self,
+        relationship: Relationship,
+        messages: gb.MessageCollectionType = DEFAULT_MESSAGES,
+    ):
+        self._relationship = relationship
+        self._messages = messages
+
+    @property
+    def name(self):
+        return self._relationship.name
+
+    @property
+    def result_key_name(self):
+        return self._relationship.mapped_relationship_name
+
+    @property
+    def required(self):
+        return self._relationship.required
+
+    @property
+    def has_default(self) -> bool:
+        return False
+
+    @property
+    def default(self) -> Any:
+        return None
+
+    def predicate_result(self, prev_values: Mapping[str, Any]) -> bool:
+        return self._relationship.predicate_result(prev_values)
+
+    def validate(
+        self,
+        value,
+        typecast: bool,
+        context: dict,
+        session: sa_orm.Session,
+        instance: Optional[Any] = None,
+    ):
+        return self._validate_items(value, typecast, context, session, True)
+
+    def validate_value(
+        self,
+        value,
+        typecast: bool,
+        context: dict,
+        session: sa_orm.Session,
+        instance: Optional[Any] = None,
+    ):
+        return self._validate_items(value, typecast, context, session, False)
+
+    @property
+    def has_db_checks(self) -> bool:
+        return True
+
+    def check_value(
+        self,
+        value,
+        context: dict,
+        session: sa_orm.Session,
+        instance: Optional[Any] = None,
+    ) -> None:
+        errors = self._relationship.schema._check_many(value, session)
+
+        if errors:
+            raise gb.SchemaError([self._error("value_errors", nested_errors=errors)])
+
+    def duplicate_errors(self, value) -> list[gb.Error]:
+        schema = self._relationship.schema
+        nested_errors = {}
+
+        for item_index, item in enumerate(value):
+            item_errors = schema.duplicate_errors(item)
+
+            if item_errors:
+                nested_errors[item_index] = item_errors
+
+        if nested_errors:
+            return [self._error("value_errors", nested_errors=nested_errors)]
+
+        return []
+
+    def _validate_items(
+        self,
+        value,
+        typecast: bool,
+        context: dict,
+        session: sa_orm.Session,
+        check_db: bool,
+    ) -> list[dict]:
+        if not isinstance(value, list):
+            error_args = {"expected_type": gb.type_name("list")}
+            raise gb.SchemaError([self._error("unexpected_type", error_args)])
+
+        schema = self._relationship.schema
+
+        # Children are validated as new rows, not as the parent instance
+        item_context = {k: v for k, v in context.items() if k != "mapped_instance"}
+
+        results: list[dict] = []
+        errors: dict[int, list[gb.Error]] = {}
+
+        for index, item in enumerate(value):
+            if not isinstance(item, dict):
+                error_args = {"expected_type": gb.type_name("dict")}
+                errors[index] = [self._error("unexpected_type", error_args)]
+                results.append({})
+                continue
+
+            with requested_by(item_context, index):
+                item_result, item_errors = schema._validate(
+                    item, typecast, item_context, session, check_db=False
+                )
+
+            results.append(item_result)
+
+            if item_errors:
+                errors[index] = item_errors
+
+        if check_db:
+            for index, check_errors in schema._check_many(results, session).items():
+                schema._merge_rule_errors(check_errors, errors.setdefault(index, []))
+
+        if errors:
+            raise gb.SchemaError([self._error("value_errors", nested_errors=errors)])
+
+        return results
+
+    def check_many(
+        self,
+        values: dict[int, Any],
+        session: sa_orm.Session,
+        seen: Optional[dict] = None,
+    ) -> dict[int, list[gb.Error]]:
+        """
+        Check children of all rows at once.
+        """
+
+        items: list[dict] = []
+        positions: list[tuple[int, int]] = []
+
+        for index, value in values.items():
+            for item_index, item in enumerate(value):
+                items.append(item)
+                positions.append((index, item_index))
+
+        schema = self._relationship.schema
+        nested_errors: dict[int, dict] = {}
+
+        for position, errors in schema._check_many(items, session, seen).items():
+            index, item_index = positions[position]
+            nested_errors.setdefault(index, {})[item_index] = errors
+
+        return {
+            index: [self._error("value_errors", nested_errors=errors)]
+            for index, errors in nested_errors.items()
+        }
+
+    def _error(self, code: str, args: dict = {}, nested_errors: dict = {}):
+        return gb.Error(code, args, nested_errors, self._messages.get_message(code))
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return self.__dict__ == other.__dict__
+
+        return super().__eq__(other)
+
+
 class MappedKeyBuilderError(Exception):
     pass
 
@@ -169,32 +917,82 @@ class MappedKeyBuilder:
         sa_mapped_class: type,
         keys: list[gb.Key],
         messages: gb.MessageCollectionType = DEFAULT_MESSAGES,
+        snapshot: Optional[MappedSnapshot] = None,
+        check_unique: bool = True,
+        sharded_checks: Optional[ShardedChecks] = None,
+        report_conflicts: bool = False,
+        check_references: bool = False,
     ) -> list[MappedKey]:
         result: list[MappedKey] = []
 
         for key in keys:
-            result.append(self._build_mapped_key(sa_mapped_class, key, messages))
+            result.append(
+                self._build_mapped_key(
+                    sa_mapped_class,
+                    key,
+                    messages,
+                    snapshot,
+                    check_unique,
+                    sharded_checks,
+                    report_conflicts,
+                    check_references,
+                )
+            )
 
         return result
 
     def _build_mapped_key(
-        self, sa_mapped_class: type, key: gb.Key, messages: gb.MessageCollectionType
+        self,
+        sa_mapped_class: type,
+        key: gb.Key,
+        messages: gb.MessageCollectionType,
+        snapshot: Optional[MappedSnapshot] = None,
+        check_unique: bool = True,
+        sharded_checks: Optional[ShardedChecks] = None,
+        report_conflicts: bool = False,
+        check_references: bool = False,
     ) -> MappedKey:
-        if isinstance(key, Column):
+        if isinstance(key, Relationship):
+            self._check_sa_relationship(sa_mapped_class, key)
+            return MappedRelationshipKey(key, messages)
+
+        if not isinstance(key, Column):
+            return MappedPropertyKey(key)
+
+        # Unique criteria are only used by keys of unique columns
+        unique_criteria = None
+
+        if snapshot and key.mapped_column_name in snapshot.column_keys:
+            sa_column = snapshot.get_sa_column(sa_mapped_class, key.mapped_column_name)
+            pk_column = snapshot.get_pk_sa_column(sa_mapped_class)
+            pk_property_name = snapshot.pk_property_name
+
+            if key.unique:
+                unique_criteria = snapshot.get_unique_criteria(
+                    key.mapped_column_name, sa_column
+                )
+        else:
+            sa_column = self._get_sa_column(sa_mapped_class, key.mapped_column_name)
             pk_column, pk_property_name = self._get_pk_sa_column_and_property_name(
                 sa_mapped_class
             )
 
-            return MappedColumnKey(
-                sa_mapped_class,
-                self._get_sa_column(sa_mapped_class, key.mapped_column_name),
-                pk_column,
-                pk_property_name,
-                key,
-                messages,
-            )
-        else:
-            return MappedPropertyKey(key)
+            if key.unique:
+                unique_criteria = column_unique_criteria(sa_column)
+
+        return MappedColumnKey(
+            sa_mapped_class,
+            sa_column,
+            pk_column,
+            pk_property_name,
+            key,
+            messages,
+            check_unique=check_unique,
+            unique_criteria=unique_criteria,
+            sharded_checks=sharded_checks,
+            report_conflicts=report_conflicts,
+            check_references=check_references,
+        )
 
     def _get_sa_column(self, sa_mapped_class: type, column_name: str) -> sa.Column:
         sa_mapper = sa.inspect(sa_mapped_class)
@@ -206,6 +1004,30 @@ class MappedKeyBuilder:
 
         return sa_mapper.columns[column_name]
 
+    def _check_sa_relationship(self, sa_mapped_class: type, key: Relationship):
+        sa_mapper = sa.inspect(sa_mapped_class)
+        name = key.mapped_relationship_name
+
+        if name not in sa_mapper.relationships:
+            raise MappedKeyBuilderError(
+                f"mapped class {sa_mapped_class.__name__} has no relationship {name}"
+            )
+
+        sa_relationship = sa_mapper.relationships[name]
+
+        if not sa_relationship.uselist:
+            raise MappedKeyBuilderError(
+                f"relationship {name} of mapped class {sa_mapped_class.__name__} "
+                "is not a collection"
+            )
+
+        if sa_relationship.mapper.class_ is not key.schema.sa_mapped_class:
+            raise MappedKeyBuilderError(
+                f"relationship {name} of mapped class {sa_mapped_class.__name__} "
+                f"targets {sa_relationship.mapper.class_.__name__}, not "
+                f"{key.schema.sa_mapped_class.__name__}"
+            )
+
     def _get_pk_sa_column_and_property_name(
         self, sa_mapped_class: type
     ) -> tuple[sa.Column, str]:
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Iterable, Optional, Tuple
+
+import sqlalchemy as sa
+import sqlalchemy.orm as sa_orm
+import sqlalchemy.orm.exc as sa_orm_exc
+
+# Tracked attribute is identified by mapped class and attribute key, attributes
+# overload ``==``, so they are not used as dict keys directly.
+AttributeKey = Tuple[type, str]
+
+_INDEX_INFO_KEY = "goodboy_sqlalchemy.pending_index"
+
+_NO_VALUE = sa_orm.attributes.NO_VALUE
+
+# Sets are replaced instead of updated, so they are read without locking
+_tracked: dict[type, frozenset[str]] = {}
+_tracked_lock = threading.Lock()
+
+
+class PendingIndex:
+    """
+    Index of tracked attribute values of session objects that are not flushed
+    yet: pending objects and modified persistent objects. Built once from
+    ``session.new`` and ``session.dirty`` and maintained with session and
+    attribute events, so a lookup takes constant time. Flushed objects are
+    removed as they are flushed.
+
+    Committed values overridden by modified objects are indexed too, as stale
+    values: database rows still have them until the session is flushed.
+    """
+
+    def __init__(self, session: sa_orm.Session):
+        self._values = _ValueIndex()
+        self._stale_values = _ValueIndex()
+        # indexed persistent objects by id, removed once they are flushed
+        self._persistent: dict[int, Any] = {}
+
+        for obj in list(session.new) + list(session.dirty):
+            self.add(obj)
+
+    def contains(
+        self, attribute_key: AttributeKey, value: Any, excluding: Any = None
+    ) -> bool:
+        """
+        Check if any indexed object other than ``excluding`` has the value.
+        """
+
+        return self._values.contains(attribute_key, value, excluding)
+
+    def stale_values(
+        self,
+        attribute_key: AttributeKey,
+        values: Iterable[Any],
+        session: sa_orm.Session,
+    ) -> set:
+        """
+        Get values of unique attribute that are stored in database, but are
+        overridden by modified or deleted objects of session. Deleted objects
+        are not indexed (session has no event for them before flush), so they
+        are looked up here, only pass values found in database.
+        """
+
+        values = list(values)
+        result = {v for v in values if self._stale_values.contains(attribute_key, v)}
+        sa_mapped_class, key = attribute_key
+
+        for obj in session.deleted:
+            if isinstance(obj, sa_mapped_class):
+                value = _committed_value(sa.inspect(obj), key, _NO_VALUE)
+
+                if value in values:
+                    result.add(value)
+
+        return result
+
+    def add(self, obj: Any) -> None:
+        self.remove(obj)
+
+        state_dict = sa.inspect(obj).dict
+
+        for attribute_key in _tracked_attribute_keys(type(obj)):
+            if attribute_key[1] in state_dict:
+                self.set_value(obj, attribute_key, state_dict[attribute_key[1]])
+
+    def set_value(
+        self,
+        obj: Any,
+        attribute_key: AttributeKey,
+        value: Any,
+        previous_value: Any = _NO_VALUE,
+    ) -> None:
+        self._values.set_value(obj, attribute_key, value)
+
+        state = sa.inspect(obj)
+        stale_value = None
+
+        if state.key is not None:
+            self._persistent[id(obj)] = obj
+            committed_value = _committed_value(state, attribute_key[1], previous_value)
+
+            if committed_value is not _NO_VALUE and committed_value != value:
+                stale_value = committed_value
+
+        self._stale_values.set_value(obj, attribute_key, stale_value)
+
+    def remove(self, obj: Any) -> None:
+        self._values.remove(obj)
+        self._stale_values.remove(obj)
+        self._persistent.pop(id(obj), None)
+
+    def remove_flushed(self) -> None:
+        """
+        Remove persistent objects with no unflushed changes, pending objects are
+        removed as they become persistent.
+        """
+
+        for obj in list(self._persistent.values()):
+            if not sa.inspect(obj).modified:
+                self.remove(obj)
+
+
+class _ValueIndex:
+    """
+    Objects by attribute key and value.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[AttributeKey, dict[Any, dict[int, Any]]] = {}
+        self._objects: dict[int, dict[AttributeKey, Any]] = {}
+
+    def contains(
+        self, attribute_key: AttributeKey, value: Any, excluding: Any = None
+    ) -> bool:
+        try:
+            objects = self._values.get(attribute_key, {}).get(value)
+        except TypeError:
+            return False
+
+        return bool(objects) and any(obj is not excluding for obj in objects.values())
+
+    def set_value(self, obj: Any, attribute_key: AttributeKey, value: Any) -> None:
+        object_values = self._objects.setdefault(id(obj), {})
+        self._discard(obj, attribute_key, object_values.pop(attribute_key, None))
+
+        if value is None:
+            return
+
+        try:
+            objects = self._values.setdefault(attribute_key, {}).setdefault(value, {})
+        except TypeError:
+            return
+
+        objects[id(obj)] = obj
+        object_values[attribute_key] = value
+
+    def remove(self, obj: Any) -> None:
+        for attribute_key, value in self._objects.pop(id(obj), {}).items():
+            self._discard(obj, attribute_key, value)
+
+    def _discard(self, obj: Any, attribute_key: AttributeKey, value: Any) -> None:
+        if value is None:
+            return
+
+        objects = self._values[attribute_key][value]
+        objects.pop(id(obj), None)
+
+        if not objects:
+            del self._values[attribute_key][value]
+
+
+def track(sa_mapped_class: type, sa_column: Any) -> Optional[AttributeKey]:
+    """
+    Start tracking values of mapped attribute of the column in pending indices,
+    return attribute key or ``None`` if the column is not mapped.
+    """
+
+    if isinstance(sa_column, sa_orm.QueryableAttribute):
+        key = sa_column.key
+    else:
+        try:
+            key = sa.inspect(sa_mapped_class).get_property_by_column(sa_column).key
+        except sa_orm_exc.UnmappedColumnError:
+            return None
+
+    with _tracked_lock:
+        # listeners propagate to subclasses, so values of attribute tracked for
+        # a base class are indexed by its key
+        for base in sa_mapped_class.__mro__:
+            if key in _tracked.get(base, frozenset()):
+                return (base, key)
+
+        attribute_key = (sa_mapped_class, key)
+        keys = _tracked.get(sa_mapped_class, frozenset())
+
+        def on_set(target: Any, value: Any, previous_value: Any, *args: Any) -> None:
+            index = _existing_pending_index(sa_orm.object_session(target))
+
+            if index is not None:
+                index.set_value(target, attribute_key, value, previous_value)
+
+        sa.event.listen(getattr(sa_mapped_class, key), "set", on_set, propagate=True)
+        _tracked[sa_mapped_class] = keys | {key}
+
+    return attribute_key
+
+
+def pending_index(session: sa_orm.Session) -> PendingIndex:
+    """
+    Get pending index of session, create it on first use.
+    """
+
+    index = _existing_pending_index(session)
+
+    if index is not None:
+        return index
+
+    index = session.info[_INDEX_INFO_KEY] = PendingIndex(session)
+
+    def on_pending(session: sa_orm.Session, obj: Any) -> None:
+        _index(session).add(obj)
+
+    def on_removed(session: sa_orm.Session, obj: Any) -> None:
+        _index(session).remove(obj)
+
+    def on_flushed(session: sa_orm.Session, *args: Any) -> None:
+        # flushed values are found by database queries
+        _index(session).remove_flushed()
+
+    def on_rolled_back(session: sa_orm.Session, *args: Any) -> None:
+        # changes of persistent objects are expired with no events
+        session.info[_INDEX_INFO_KEY] = PendingIndex(session)
+
+    sa.event.listen(session, "transient_to_pending", on_pending)
+    sa.event.listen(session, "pending_to_transient", on_removed)
+    sa.event.listen(session, "pending_to_persistent", on_removed)
+    sa.event.listen(session, "persistent_to_deleted", on_removed)
+    sa.event.listen(session, "after_flush_postexec", on_flushed)
+    sa.event.listen(session, "after_soft_rollback", on_rolled_back)
+
+    return index
+
+
+def _index(session: sa_orm.Session) -> PendingIndex:
+    return session.info[_INDEX_INFO_KEY]
+
+
+def _existing_pending_index(
+    session: Optional[sa_orm.Session],
+) -> Optional[PendingIndex]:
+    if session is None:
+        return None
+
+    return session.info.get(_INDEX_INFO_KEY)
+
+
+def _committed_value(state: Any, key: str, current_value: Any) -> Any:
+    # committed value is saved on the first change of loaded attribute
+    return state.committed_state.get(key, state.dict.get(key, current_value))
+
+
+def _tracked_attribute_keys(cls: type) -> list[AttributeKey]:
+    return [
+        (base, key)
+        for base in cls.__mro__
+        if base in _tracked
+        for key in _tracked[base]
+    ]
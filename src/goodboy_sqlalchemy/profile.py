@@ -0,0 +1,274 @@
+"""
+Schema construction profiler.
+
+Imports a module defining ``Mapped`` schemas and reports time spent building
+each of them, by phase, memory allocated by each schema and the slowest mapped
+classes::
+
+    python -m goodboy_sqlalchemy.profile myapp.schemas [--json] [--top 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import importlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, TextIO
+
+import sqlalchemy as sa
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Time of each phase excludes time of nested phases
+PHASES = (
+    "inspection",
+    "factory_resolution",
+    "schemas",
+    "columns",
+    "keys",
+    "other",
+)
+
+
+class SchemaProfile:
+    """
+    Construction profile of a single ``Mapped`` schema.
+
+    :param model: Name of the mapped class.
+    :param location: File and line the schema is constructed at.
+    """
+
+    def __init__(self, model: str, location: str):
+        self.model = model
+        self.location = location
+        self.seconds = 0.0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.memory = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "model": self.model,
+            "location": self.location,
+            "seconds": self.seconds,
+            "phases": dict(self.phases),
+            "memory": self.memory,
+        }
+
+
+class Profiler:
+    """
+    Records construction profiles of ``Mapped`` schemas built inside
+    :meth:`profiling` block, by wrapping schema construction and builder
+    methods. Memory of a schema is the size of blocks allocated while it is
+    constructed and not freed by the end of construction, traced with
+    :mod:`tracemalloc`.
+    """
+
+    def __init__(self) -> None:
+        self.profiles: list[SchemaProfile] = []
+        self._current: Optional[SchemaProfile] = None
+        # time spent in nested timed calls, per running timed call
+        self._nested_seconds: list[float] = []
+
+    @contextmanager
+    def profiling(self) -> Iterator[Profiler]:
+        from goodboy_sqlalchemy.column import ColumnBuilder
+        from goodboy_sqlalchemy.column_schemas import ColumnSchemaBuilder
+        from goodboy_sqlalchemy.mapped import Mapped
+        from goodboy_sqlalchemy.mapped_key import MappedKeyBuilder
+
+        patches: list[tuple[Any, str, Callable[[Callable], Callable]]] = [
+            (sa, "inspect", lambda f: self._timed(f, "inspection")),
+            (
+                ColumnSchemaBuilder,
+                "_find_column_schema_factory",
+                lambda f: self._timed(f, "factory_resolution"),
+            ),
+            (ColumnSchemaBuilder, "build", lambda f: self._timed(f, "schemas")),
+            (ColumnBuilder, "build", lambda f: self._timed(f, "columns")),
+            (MappedKeyBuilder, "build", lambda f: self._timed(f, "keys")),
+            (Mapped, "__init__", self._profiled_init),
+        ]
+        originals = [
+            (target, name, target.__dict__[name]) for target, name, _ in patches
+        ]
+        start_tracing = not tracemalloc.is_tracing()
+
+        if start_tracing:
+            tracemalloc.start()
+
+        try:
+            for (target, name, wrap), (_, _, original) in zip(patches, originals):
+                setattr(target, name, wrap(original))
+
+            yield self
+        finally:
+            for target, name, original in originals:
+                setattr(target, name, original)
+
+            if start_tracing:
+                tracemalloc.stop()
+
+    def slowest_models(self, top: Optional[int] = None) -> list[dict[str, Any]]:
+        """
+        Get total construction time, memory and number of schemas per mapped
+        class, the slowest first.
+        """
+
+        models: dict[str, dict[str, Any]] = {}
+
+        for profile in self.profiles:
+            model = models.setdefault(
+                profile.model,
+                {"model": profile.model, "schemas": 0, "seconds": 0.0, "memory": 0},
+            )
+            model["schemas"] += 1
+            model["seconds"] += profile.seconds
+            model["memory"] += profile.memory
+
+        result = sorted(models.values(), key=lambda m: m["seconds"], reverse=True)
+
+        return result[:top]
+
+    def slowest_schemas(self, top: Optional[int] = None) -> list[SchemaProfile]:
+        return sorted(self.profiles, key=lambda p: p.seconds, reverse=True)[:top]
+
+    def report(self, top: Optional[int] = None) -> dict[str, Any]:
+        """
+        Get totals of all schemas, and profiles of the slowest schemas and
+        mapped classes.
+        """
+
+        return {
+            "seconds": sum(p.seconds for p in self.profiles),
+            "memory": sum(p.memory for p in self.profiles),
+            "schemas": [p.as_dict() for p in self.slowest_schemas(top)],
+            "models": self.slowest_models(top),
+        }
+
+    def _timed(self, function: Callable, phase: str) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            self._nested_seconds.append(0.0)
+            started = time.perf_counter()
+
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._record(phase, time.perf_counter() - started, self._current)
+
+        return wrapper
+
+    def _profiled_init(self, function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(schema: Any, sa_mapped_class: type, *args: Any, **kwargs: Any):
+            profile = SchemaProfile(
+                getattr(sa_mapped_class, "__name__", repr(sa_mapped_class)),
+                _construction_site(),
+            )
+            parent, self._current = self._current, profile
+            self._nested_seconds.append(0.0)
+            memory = tracemalloc.get_traced_memory()[0]
+            started = time.perf_counter()
+
+            try:
+                function(schema, sa_mapped_class, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                profile.memory = tracemalloc.get_traced_memory()[0] - memory
+                profile.seconds = elapsed
+                self._record("other", elapsed, profile)
+                self._current = parent
+                self.profiles.append(profile)
+
+        return wrapper
+
+    def _record(
+        self, phase: str, elapsed: float, profile: Optional[SchemaProfile]
+    ) -> None:
+        nested_seconds = self._nested_seconds.pop()
+
+        if self._nested_seconds:
+            self._nested_seconds[-1] += elapsed
+
+        # builders may be used outside of schema construction too
+        if profile is not None:
+            profile.phases[phase] += elapsed - nested_seconds
+
+
+def _construction_site() -> str:
+    frame = sys._getframe(2)
+
+    # skip schema metaclass and other frames of the package
+    while frame.f_back is not None and (
+        os.path.dirname(os.path.abspath(frame.f_code.co_filename)) == _PACKAGE_DIR
+    ):
+        frame = frame.f_back
+
+    return f"{os.path.relpath(frame.f_code.co_filename)}:{frame.f_lineno}"
+
+
+def format_table(profiler: Profiler, top: Optional[int] = None) -> str:
+    lines = [
+        f"{'model':<24}{'ms':>10}"
+        + "".join(f"{phase:>20}" for phase in PHASES)
+        + f"{'KiB':>10}  location"
+    ]
+
+    for p in profiler.slowest_schemas(top):
+        lines.append(
+            f"{p.model:<24}{p.seconds * 1000:>10.2f}"
+            + "".join(f"{p.phases[phase] * 1000:>20.2f}" for phase in PHASES)
+            + f"{p.memory / 1024:>10.1f}  {p.location}"
+        )
+
+    lines += ["", f"{'slowest models':<24}{'ms':>10}{'schemas':>10}{'KiB':>10}"]
+
+    for model in profiler.slowest_models(top):
+        lines.append(
+            f"{model['model']:<24}{model['seconds'] * 1000:>10.2f}"
+            f"{model['schemas']:>10}{model['memory'] / 1024:>10.1f}"
+        )
+
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None, stdout: Optional[TextIO] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m goodboy_sqlalchemy.profile",
+        description="Profile construction of Mapped schemas defined by a module.",
+    )
+    parser.add_argument("module", help="module to import, such as myapp.schemas")
+    parser.add_argument("--json", action="store_true", help="print JSON report")
+    parser.add_argument(
+        "--top", type=int, help="number of the slowest schemas and models to show"
+    )
+    args = parser.parse_args(argv)
+
+    # like ``python -m``, modules are imported from the working directory
+    if "" not in sys.path and os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+
+    stdout = stdout or sys.stdout
+    profiler = Profiler()
+
+    with profiler.profiling():
+        importlib.import_module(args.module)
+
+    if args.json:
+        json.dump(profiler.report(args.top), stdout, indent=2)
+        stdout.write("\n")
+    else:
+        stdout.write(format_table(profiler, args.top) + "\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
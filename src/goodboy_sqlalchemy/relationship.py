@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional
+
+import goodboy as gb
+
+if TYPE_CHECKING:
+    from goodboy_sqlalchemy.mapped import Mapped
+
+
+class Relationship(gb.Key):
+    """
+    Key for collection relationship of mapped class (``relationship()`` with
+    ``uselist=True``), its value is a list of nested payloads, each validated by
+    child ``Mapped`` schema as a new child row.
+
+    Database checks of children (unique and foreign key columns) are batched:
+    one query per column across the whole collection.
+
+    :param name: Key name.
+    :param schema: Child schema, its mapped class must be the relationship target.
+    :param mapped_relationship_name: Relationship property name, if it differs
+        from key name.
+    :param required: Is key required.
+    :param predicate: Key is allowed only if predicate returns true.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        schema: Mapped,
+        *,
+        mapped_relationship_name: Optional[str] = None,
+        required: Optional[bool] = None,
+        predicate: Optional[Callable[[Mapping[str, Any]], bool]] = None,
+    ):
+        super().__init__(name, schema, required=required, predicate=predicate)
+
+        self.schema = schema
+        self.mapped_relationship_name = mapped_relationship_name or name
+
+    def with_predicate(
+        self, predicate: Callable[[Mapping[str, Any]], bool]
+    ) -> Relationship:
+        return Relationship(
+            self.name,
+            self.schema,
+            mapped_relationship_name=self.mapped_relationship_name,
+            required=self.required,
+            predicate=predicate,
+        )
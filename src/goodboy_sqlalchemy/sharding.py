@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import contextvars
+import functools
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Optional
+
+import sqlalchemy as sa
+import sqlalchemy.orm as sa_orm
+
+ShardChooser = Callable[[sa.Column, Any], Iterable[Any]]
+
+
+class ShardedChecks:
+    """
+    Runs database checks of mapped keys in shards of ``ShardedSession``
+    concurrently, on a thread pool: value is unique only if no shard has it.
+
+    When session is in a transaction, queries are executed on its connections
+    of each shard (so checks see rows flushed in the transaction), and must be
+    finished before session can be used again: existence checks stop as soon
+    as one shard reports a hit only by cancelling queries not started yet, so
+    only with ``max_workers`` below the number of shards. Otherwise queries are
+    executed on connections of their own, and existence checks return as soon
+    as one shard reports a hit, while queries started on other shards finish
+    in background.
+
+    Shard connections must be usable from pool threads (for SQLite it means
+    ``check_same_thread=False``).
+
+    :param shard_ids: Identifiers of all shards.
+    :param shard_chooser: Callable returning shards a column value may be stored
+        in, all shards by default.
+    :param max_workers: Thread pool size, number of shards by default.
+    """
+
+    def __init__(
+        self,
+        shard_ids: Iterable[Any],
+        *,
+        shard_chooser: Optional[ShardChooser] = None,
+        max_workers: Optional[int] = None,
+    ):
+        self._shard_ids = list(shard_ids)
+        self._shard_chooser = shard_chooser
+        self._max_workers = max_workers or len(self._shard_ids)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def choose_shards(self, sa_column: sa.Column, values: Iterable[Any]) -> list[Any]:
+        if self._shard_chooser is None:
+            return list(self._shard_ids)
+
+        result: list[Any] = []
+
+        for value in values:
+            for shard_id in self._shard_chooser(sa_column, value):
+                if shard_id not in result:
+                    result.append(shard_id)
+
+        return result
+
+    def run(
+        self,
+        session: sa_orm.Session,
+        shard_ids: list[Any],
+        query: Callable[[sa.Connection], Any],
+        stop: Optional[Callable[[Any], bool]] = None,
+    ) -> list[Any]:
+        """
+        Run query with connection of each shard, return results of completed
+        queries. If ``stop`` returns true for a result, remaining queries are
+        not waited for (see above).
+        """
+
+        if not shard_ids:
+            return []
+
+        in_transaction = session.in_transaction()
+
+        if in_transaction:
+            queries = [
+                functools.partial(
+                    query, session.connection(bind_arguments={"shard_id": shard_id})
+                )
+                for shard_id in shard_ids
+            ]
+        else:
+            queries = [
+                functools.partial(
+                    _query_own_connection, query, session.get_bind(shard_id=shard_id)
+                )
+                for shard_id in shard_ids
+            ]
+
+        if len(queries) == 1:
+            return [queries[0]()]
+
+        executor = self._get_executor()
+        # queries see context variables (validation deadline) of the caller
+        pending: set[Future] = {
+            executor.submit(contextvars.copy_context().run, q) for q in queries
+        }
+        results: list[Any] = []
+
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    results.append(future.result())
+
+                if stop is not None and any(stop(r) for r in results):
+                    break
+        finally:
+            for future in pending:
+                future.cancel()
+
+            # Session connections cannot be left in use by pool threads
+            if in_transaction:
+                wait(pending)
+
+        return results
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self._max_workers, thread_name_prefix="goodboy-sqlalchemy-shard"
+                )
+
+            return self._executor
+
+
+def _query_own_connection(query: Callable[[sa.Connection], Any], engine: Any) -> Any:
+    with engine.connect() as connection:
+        return query(connection)
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import pickle
+import weakref
+from typing import Any, Optional
+
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy.column import Column, ColumnBuilder, column_builder
+from goodboy_sqlalchemy.column_schemas import (
+    SCHEMA_INFO_KEYS,
+    ColumnSchemaBuilderError,
+)
+from goodboy_sqlalchemy.mapped_key import mapped_key_builder
+from goodboy_sqlalchemy.messages import DEFAULT_MESSAGES
+from goodboy_sqlalchemy.unique import (
+    UniqueCriterion,
+    column_unique_criteria,
+    index_unique_criteria,
+)
+
+SNAPSHOT_FORMAT_VERSION = 2
+
+# Shared objects are stored by reference: otherwise each pickled schema would
+# carry its own copy of the default message collection.
+_PERSISTENT_OBJECTS: dict[str, Any] = {
+    "DEFAULT_MESSAGES": DEFAULT_MESSAGES,
+}
+
+# Fingerprints are computed once per mapped class: mapped tables are not
+# expected to change once schemas are built.
+_fingerprints: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+class SnapshotError(Exception):
+    pass
+
+
+class MappedSnapshot:
+    """
+    Columns built for a mapped class, together with everything ``Mapped`` needs
+    to use them without inspecting the mapper: column keys in the mapped table,
+    primary key information and names of columns covered by functional or
+    partial unique indexes (unique criteria of other columns need no index
+    lookups).
+    """
+
+    def __init__(
+        self,
+        fingerprint: str,
+        pk_property_name: str,
+        pk_column_key: str,
+        columns: dict[str, Column],
+        column_keys: dict[str, str],
+        index_unique_column_names: frozenset[str] = frozenset(),
+    ):
+        self.fingerprint = fingerprint
+        self.pk_property_name = pk_property_name
+        self.pk_column_key = pk_column_key
+        self.columns = columns
+        self.column_keys = column_keys
+        self.index_unique_column_names = index_unique_column_names
+
+    @classmethod
+    def build(
+        cls,
+        sa_mapped_class: type,
+        column_names: Optional[list[str]] = None,
+        column_builder: ColumnBuilder = column_builder,
+    ) -> MappedSnapshot:
+        sa_mapper = sa.inspect(sa_mapped_class)
+
+        if column_names is None:
+            column_names = list(sa_mapper.columns.keys())
+            skip_unmapped_types = True
+        else:
+            skip_unmapped_types = False
+
+        columns: dict[str, Column] = {}
+        column_keys: dict[str, str] = {}
+        index_unique_column_names: set[str] = set()
+
+        for column_name in column_names:
+            try:
+                (column,) = column_builder.build(sa_mapped_class, [column_name])
+            except ColumnSchemaBuilderError:
+                if skip_unmapped_types:
+                    continue
+
+                raise
+
+            sa_column = sa_mapper.columns[column_name]
+            columns[column_name] = column
+            column_keys[column_name] = sa_column.key
+
+            if column.unique and index_unique_criteria(sa_column):
+                index_unique_column_names.add(column_name)
+
+        (
+            pk_column,
+            pk_property_name,
+        ) = mapped_key_builder._get_pk_sa_column_and_property_name(sa_mapped_class)
+
+        return cls(
+            mapped_fingerprint(sa_mapped_class),
+            pk_property_name,
+            pk_column.key,
+            columns,
+            column_keys,
+            frozenset(index_unique_column_names),
+        )
+
+    def get_columns(self, column_names: list[str]) -> list[Column]:
+        result: list[Column] = []
+
+        for column_name in column_names:
+            if column_name not in self.columns:
+                raise SnapshotError(f"snapshot has no column {column_name}")
+
+            result.append(self.columns[column_name])
+
+        return result
+
+    def get_sa_column(self, sa_mapped_class: type, column_name: str) -> sa.Column:
+        return _mapped_table(sa_mapped_class).c[self.column_keys[column_name]]
+
+    def get_pk_sa_column(self, sa_mapped_class: type) -> sa.Column:
+        return _mapped_table(sa_mapped_class).c[self.pk_column_key]
+
+    def get_unique_criteria(
+        self, column_name: str, sa_column: sa.Column
+    ) -> list[UniqueCriterion]:
+        if column_name in self.index_unique_column_names:
+            return column_unique_criteria(sa_column)
+
+        return [UniqueCriterion(sa_column)]
+
+
+class SchemaSnapshot:
+    """
+    Collection of mapped class snapshots.
+
+    Snapshots are meant to be built and dumped to a file at build time, and
+    loaded on process start, so ``Mapped`` schemas are constructed without
+    running column and key builders::
+
+        snapshot = SchemaSnapshot()
+        snapshot.add(User)
+        snapshot.dump("schemas.snapshot")
+
+        snapshot = SchemaSnapshot.load("schemas.snapshot")
+        user_schema = Mapped(User, column_names=["name"], snapshot=snapshot)
+
+    Each mapped class snapshot is verified against the fingerprint of the mapped
+    table before use, so stale snapshots are rejected with
+    :class:`SnapshotError`.
+
+    Snapshot files are pickles: load only files you have built yourself.
+    """
+
+    def __init__(self, mapped_snapshots: Optional[dict[str, MappedSnapshot]] = None):
+        self._mapped_snapshots = dict(mapped_snapshots or {})
+
+    def add(
+        self,
+        sa_mapped_class: type,
+        column_names: Optional[list[str]] = None,
+        column_builder: ColumnBuilder = column_builder,
+    ) -> None:
+        self._mapped_snapshots[_class_path(sa_mapped_class)] = MappedSnapshot.build(
+            sa_mapped_class, column_names, column_builder
+        )
+
+    def get(self, sa_mapped_class: type) -> MappedSnapshot:
+        class_path = _class_path(sa_mapped_class)
+
+        if class_path not in self._mapped_snapshots:
+            raise SnapshotError(f"snapshot has no mapped class {class_path}")
+
+        mapped_snapshot = self._mapped_snapshots[class_path]
+
+        if mapped_snapshot.fingerprint != mapped_fingerprint(sa_mapped_class):
+            raise SnapshotError(f"snapshot of mapped class {class_path} is stale")
+
+        return mapped_snapshot
+
+    def dumps(self) -> bytes:
+        data = {
+            "version": SNAPSHOT_FORMAT_VERSION,
+            "mapped_snapshots": self._mapped_snapshots,
+        }
+
+        buffer = io.BytesIO()
+        _SnapshotPickler(buffer, pickle.HIGHEST_PROTOCOL).dump(data)
+
+        return buffer.getvalue()
+
+    def dump(self, file: str) -> None:
+        with open(file, "wb") as f:
+            f.write(self.dumps())
+
+    @classmethod
+    def loads(cls, data: bytes) -> SchemaSnapshot:
+        try:
+            loaded = _SnapshotUnpickler(io.BytesIO(data)).load()
+        except (pickle.UnpicklingError, EOFError) as e:
+            raise SnapshotError(f"invalid snapshot: {e}")
+
+        if loaded.get("version") != SNAPSHOT_FORMAT_VERSION:
+            raise SnapshotError("unsupported snapshot format version")
+
+        return cls(loaded["mapped_snapshots"])
+
+    @classmethod
+    def load(cls, file: str) -> SchemaSnapshot:
+        with open(file, "rb") as f:
+            return cls.loads(f.read())
+
+
+def mapped_fingerprint(sa_mapped_class: type) -> str:
+    """
+    Fingerprint of the mapped table definition: everything column schemas and
+    mapped keys are derived from, including column info read by schema
+    factories. Computed once per mapped class.
+    """
+
+    fingerprint = _fingerprints.get(sa_mapped_class)
+
+    if fingerprint is None:
+        fingerprint = _fingerprints[sa_mapped_class] = _table_fingerprint(
+            _mapped_table(sa_mapped_class)
+        )
+
+    return fingerprint
+
+
+def _table_fingerprint(table: sa.Table) -> str:
+    parts: list[Any] = [table.fullname]
+
+    for sa_column in table.columns:
+        if sa_column.default is not None and sa_column.default.is_scalar:
+            default = repr(sa_column.default.arg)
+        else:
+            default = type(sa_column.default).__name__
+
+        parts.append(
+            (
+                sa_column.key,
+                sa_column.name,
+                repr(sa_column.type),
+                sa_column.nullable,
+                sa_column.primary_key,
+                sa_column.unique,
+                default,
+                sa_column.server_default is not None,
+                [
+                    (key, _info_fingerprint(sa_column.info[key]))
+                    for key in SCHEMA_INFO_KEYS
+                    if key in sa_column.info
+                ],
+            )
+        )
+
+    for sa_index in sorted(table.indexes, key=lambda i: str(i.name)):
+        parts.append(
+            (
+                sa_index.name,
+                sa_index.unique,
+                [str(e) for e in sa_index.expressions],
+                sorted(f"{k}={v}" for k, v in sa_index.dialect_kwargs.items()),
+            )
+        )
+
+    constraints = list(table.constraints)
+
+    for sa_column in table.columns:
+        constraints += sa_column.constraints
+
+    parts.append(
+        sorted(str(c.sqltext) for c in constraints if isinstance(c, sa.CheckConstraint))
+    )
+
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+def _info_fingerprint(value: Any) -> str:
+    # Nested schemas have no stable repr, their pickles are compared instead
+    try:
+        return hashlib.sha1(pickle.dumps(value, protocol=4)).hexdigest()
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return repr(value)
+
+
+def _mapped_table(sa_mapped_class: type) -> sa.Table:
+    table = getattr(sa_mapped_class, "__table__", None)
+
+    if table is None:
+        table = sa.inspect(sa_mapped_class).local_table
+
+    return table
+
+
+def _class_path(sa_mapped_class: type) -> str:
+    return f"{sa_mapped_class.__module__}.{sa_mapped_class.__qualname__}"
+
+
+class _SnapshotPickler(pickle.Pickler):
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        for name, persistent_object in _PERSISTENT_OBJECTS.items():
+            if obj is persistent_object:
+                return name
+
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid: Any) -> Any:
+        if pid not in _PERSISTENT_OBJECTS:
+            raise pickle.UnpicklingError(f"unknown persistent object {pid!r}")
+
+        return _PERSISTENT_OBJECTS[pid]
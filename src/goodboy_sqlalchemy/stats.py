@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import threading
+
+
+class Counters:
+    """
+    Named counters, safe to increment from many threads.
+
+    >>> counters = Counters("hits", "misses")
+    >>> counters.increment("hits")
+    >>> counters.increment("misses", 2)
+    >>> counters.as_dict()
+    {'hits': 1, 'misses': 2}
+    """
+
+    def __init__(self, *names: str):
+        self._names = names
+        self._values = dict.fromkeys(names, 0)
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._values[name] += value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values = dict.fromkeys(self._names, 0)
+
+    def as_dict(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._values)
+
+    def __getitem__(self, name: str) -> int:
+        return self._values[name]
+
+    def __repr__(self) -> str:
+        return f"Counters({self.as_dict()!r})"
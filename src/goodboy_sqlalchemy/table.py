@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+import goodboy as gb
+import sqlalchemy as sa
+from goodboy.schema import Rule
+
+from goodboy_sqlalchemy.batch import BatchAbortedError, ErrorSink
+from goodboy_sqlalchemy.column import Column, ColumnBuilder, column_builder
+from goodboy_sqlalchemy.immutable import Immutable
+from goodboy_sqlalchemy.messages import DEFAULT_MESSAGES
+from goodboy_sqlalchemy.unique import ColumnChecks, column_unique_criteria
+
+CONNECTION_CONTEXT_KEY = "connection"
+
+
+class TableSchemaError(Exception):
+    pass
+
+
+class TableColumnChecks(Immutable):
+    """
+    Database checks of values of a table column (see :class:`ColumnChecks`)
+    reported with errors of the key.
+    """
+
+    def __init__(
+        self,
+        sa_column: sa.Column,
+        key_name: str,
+        unique: bool,
+        messages: gb.MessageCollectionType = DEFAULT_MESSAGES,
+    ):
+        self.key_name = key_name
+        self.column_key = sa_column.key
+        self._messages = messages
+        self._db_checks = ColumnChecks(
+            sa_column, column_unique_criteria(sa_column) if unique else []
+        )
+
+    @property
+    def has_checks(self) -> bool:
+        return self._db_checks.unique or self._db_checks.has_references
+
+    def check_many(
+        self,
+        values: dict[int, Any],
+        connection: sa.Connection,
+        seen: Optional[dict] = None,
+    ) -> dict[int, list[gb.Error]]:
+        """
+        Check column values indexed by row number (values are also checked for
+        uniqueness against each other), return errors by row number.
+
+        :param seen: Normalized unique values of previous chunks of the batch,
+            see :meth:`ColumnChecks.duplicates`.
+        """
+
+        distinct_values = list(
+            dict.fromkeys(v for v in values.values() if v is not None)
+        )
+        dialect_name = connection.dialect.name
+        existing_values: set = set()
+        duplicates: set[int] = set()
+
+        if self._db_checks.unique:
+            existing_values = self._db_checks.existing_values(
+                connection, dialect_name, distinct_values
+            )
+            # Values covered by functional unique index are compared by results
+            # of the index expression
+            duplicates = self._db_checks.duplicates(
+                values, self._db_checks.normalize(connection, distinct_values), seen
+            )
+
+        referenced_values = self._db_checks.referenced_values(
+            connection, dialect_name, distinct_values
+        )
+        failed_checks = self._db_checks.failed_checks(
+            values, existing_values, duplicates, referenced_values
+        )
+
+        return {
+            index: [self._error(code) for code in codes]
+            for index, codes in failed_checks.items()
+        }
+
+    def _error(self, code: str, args: dict = {}, nested_errors: dict = {}):
+        return gb.Error(code, args, nested_errors, self._messages.get_message(code))
+
+
+class TableSchema(gb.Schema, gb.SchemaErrorMixin, gb.SchemaRulesMixin, Immutable):
+    """
+    Schema of rows of SQLAlchemy Core table, counterpart of ``Mapped`` for
+    ingest without ORM. Columns are built the same way, results are parameter
+    dicts by column keys, ready for ``connection.execute(table.insert(), rows)``:
+    missing optional keys are filled with default values, or with ``None`` for
+    columns without any default (columns with database or callable defaults
+    are left out).
+
+    Database checks (uniqueness and existence of referenced rows) run with
+    connection of ``connection`` context key, only for rows without other
+    errors.
+
+    :param table: Validated table.
+    :param keys: Additional keys, :class:`Column` keys of table columns get
+        database checks.
+    :param column_names: Keys of table columns to build keys for.
+    """
+
+    def __init__(
+        self,
+        table: sa.Table,
+        keys: Sequence[gb.Key] = (),
+        column_names: Sequence[str] = (),
+        column_builder: ColumnBuilder = column_builder,
+        messages: gb.MessageCollectionType = DEFAULT_MESSAGES,
+        rules: Sequence[Rule] = (),
+    ):
+        super().__init__()
+
+        self._table = table
+        self._messages = messages
+        self._rules = tuple(rules)
+        self._keys = tuple(keys) + tuple(
+            column_builder.build(table, list(column_names))
+        )
+        self._column_checks = tuple(self._build_column_checks())
+
+    @property
+    def table(self) -> sa.Table:
+        return self._table
+
+    def __call__(self, value, *, typecast=False, context: Optional[dict] = None):
+        connection = self._get_connection(context)
+
+        if not isinstance(value, dict):
+            error = self._error(
+                "unexpected_type", {"expected_type": gb.type_name("dict")}
+            )
+
+            raise gb.SchemaError([error])
+
+        result, errors = self._validate(value, typecast, context or {})
+
+        if not errors:
+            errors = self._check_many([result], connection).get(0, [])
+
+        if errors:
+            raise gb.SchemaError(errors)
+
+        return result
+
+    def validate_many(
+        self,
+        values: Iterable[Any],
+        *,
+        typecast=False,
+        context: Optional[dict] = None,
+        errors: ErrorSink,
+        max_errors: Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[tuple[int, dict]]:
+        """
+        Validate many rows like ``Mapped.validate_many``: yield pairs of row
+        index and parameters of valid rows, pass errors of invalid rows to error
+        sink. Database checks run with one query per column and check for each
+        chunk of rows, values of unique columns are checked against values of
+        all previous rows.
+        """
+
+        connection = self._get_connection(context)
+        context = context or {}
+        chunk: list[tuple[int, dict]] = []
+        seen: dict = {}
+
+        for index, value in enumerate(values):
+            if not isinstance(value, dict):
+                error = self._error(
+                    "unexpected_type", {"expected_type": gb.type_name("dict")}
+                )
+                self._add_batch_errors(errors, max_errors, index, [error])
+                continue
+
+            result, row_errors = self._validate(value, typecast, context)
+
+            if row_errors:
+                self._add_batch_errors(errors, max_errors, index, row_errors)
+                continue
+
+            chunk.append((index, result))
+
+            if len(chunk) >= chunk_size:
+                yield from self._check_chunk(
+                    chunk, connection, errors, max_errors, seen
+                )
+                chunk = []
+
+        if chunk:
+            yield from self._check_chunk(chunk, connection, errors, max_errors, seen)
+
+    def _get_connection(self, context: Optional[dict]) -> sa.Connection:
+        if context is None or not context.get(CONNECTION_CONTEXT_KEY):
+            raise TableSchemaError(
+                "connection is required in TableSchema validation context"
+            )
+
+        return context[CONNECTION_CONTEXT_KEY]
+
+    def _validate(self, value: dict, typecast: bool, context: dict):
+        result: dict = {}
+        key_errors = {}
+        value_errors = {}
+        unknown_keys = list(value.keys())
+
+        for key in self._keys:
+            if not key.predicate_result(value):
+                continue
+
+            result_key_name = _result_key_name(key)
+
+            if key.name in unknown_keys:
+                unknown_keys.remove(key.name)
+
+                try:
+                    result[result_key_name] = key.validate(
+                        value[key.name], typecast, context
+                    )
+                except gb.SchemaError as e:
+                    value_errors[key.name] = e.errors
+            elif key.required:
+                key_errors[key.name] = [self._error("required_key")]
+            elif key.default is not None:
+                result[result_key_name] = key.default
+            elif isinstance(key, Column) and not key.has_default:
+                # rows of executemany must have the same keys
+                result[result_key_name] = None
+
+        for key_name in unknown_keys:
+            key_errors[key_name] = [self._error("unknown_key")]
+
+        errors: list[gb.Error] = []
+
+        if key_errors:
+            errors.append(self._error("key_errors", nested_errors=key_errors))
+
+        if value_errors:
+            errors.append(self._error("value_errors", nested_errors=value_errors))
+
+        if errors:
+            return result, errors
+
+        return self._call_rules(result.copy(), typecast, context)
+
+    def _check_chunk(
+        self,
+        chunk: list[tuple[int, dict]],
+        connection: sa.Connection,
+        errors: ErrorSink,
+        max_errors: Optional[int],
+        seen: dict,
+    ) -> Iterator[tuple[int, dict]]:
+        chunk_errors = self._check_many(
+            [result for _, result in chunk], connection, seen
+        )
+
+        for chunk_index, (index, result) in enumerate(chunk):
+            if chunk_index in chunk_errors:
+                self._add_batch_errors(
+                    errors, max_errors, index, chunk_errors[chunk_index]
+                )
+            else:
+                yield index, result
+
+    def _check_many(
+        self,
+        results: list[dict],
+        connection: sa.Connection,
+        seen: Optional[dict] = None,
+    ) -> dict[int, list[gb.Error]]:
+        value_errors: dict[int, dict] = {}
+
+        for column_checks in self._column_checks:
+            name = column_checks.column_key
+            values = {i: r[name] for i, r in enumerate(results) if name in r}
+            column_errors = column_checks.check_many(values, connection, seen)
+
+            for index, errors in column_errors.items():
+                value_errors.setdefault(index, {})[column_checks.key_name] = errors
+
+        return {
+            index: [self._error("value_errors", nested_errors=errors)]
+            for index, errors in value_errors.items()
+        }
+
+    def _add_batch_errors(
+        self,
+        errors: ErrorSink,
+        max_errors: Optional[int],
+        index: int,
+        row_errors: list[gb.Error],
+    ) -> None:
+        errors.add(index, row_errors)
+
+        if max_errors is not None and errors.error_count > max_errors:
+            raise BatchAbortedError(f"more than {max_errors} rows are invalid")
+
+    def _build_column_checks(self) -> Iterator[TableColumnChecks]:
+        for key in self._keys:
+            if not isinstance(key, Column):
+                continue
+
+            if key.mapped_column_name not in self._table.columns:
+                raise TableSchemaError(
+                    f"table {self._table.name} has no column {key.mapped_column_name}"
+                )
+
+            column_checks = TableColumnChecks(
+                self._table.columns[key.mapped_column_name],
+                key.name,
+                key.unique,
+                self._messages,
+            )
+
+            if column_checks.has_checks:
+                yield column_checks
+
+
+def _result_key_name(key: gb.Key) -> str:
+    if isinstance(key, Column):
+        return key.mapped_column_name
+
+    return key.name
@@ -0,0 +1,621 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional
+
+import sqlalchemy as sa
+from sqlalchemy.sql import compiler, visitors
+from sqlalchemy.sql.elements import ColumnElement
+
+from goodboy_sqlalchemy.immutable import Immutable
+
+_WHERE_KWARG_SUFFIX = "_where"
+
+_VALUE_PARAM = "unique_value"
+_INSTANCE_PK_PARAM = "unique_instance_pk"
+_VALUES_PARAM = "unique_values"
+
+# Values normalized by a single query, SQLite limits compound selects to 500
+_NORMALIZE_BATCH_SIZE = 250
+
+
+class UniqueCriterion:
+    """
+    Condition matching rows that conflict with a column value under a unique
+    constraint or a unique index.
+
+    Plain criterion compares column with the value. Index criterion repeats the
+    index definition: index expression is compared with the same expression
+    applied to the value (``lower(email) = lower(:value)``), and partial index
+    predicate is added for the dialect it's defined for, so the database can
+    answer the query using the index.
+
+    Partial index predicate is applied to existing rows only: the validated row
+    is assumed to be covered by the index.
+
+    :param sa_column: Validated column.
+    :param sa_expression: Unique index expression over ``sa_column``.
+    :param sa_where: Partial index predicates by dialect name.
+    """
+
+    def __init__(
+        self,
+        sa_column: Any,
+        sa_expression: Optional[ColumnElement] = None,
+        sa_where: Optional[dict[str, ColumnElement]] = None,
+    ):
+        self._sa_column = sa_column
+        self._sa_expression = sa_expression
+        self._sa_where = sa_where or {}
+
+    @property
+    def plain(self) -> bool:
+        """
+        Criterion compares column itself, so it can be used with ``IN`` operator
+        and for selecting conflicting values.
+        """
+
+        return self._sa_expression is None
+
+    @property
+    def unconditional(self) -> bool:
+        """
+        Criterion matches rows with equal column value, regardless of other
+        columns and dialect.
+        """
+
+        return self._sa_expression is None and not self._sa_where
+
+    @property
+    def dialect_names(self) -> list[str]:
+        """
+        Names of dialects the criterion has dialect-specific clause for.
+        """
+
+        return list(self._sa_where)
+
+    def clause(
+        self, sa_value: ColumnElement, dialect_name: Optional[str] = None
+    ) -> ColumnElement:
+        """
+        Build criterion clause for value expression (usually a bind parameter).
+        Plain criteria also accept expanding bind parameter for list of values.
+        """
+
+        if self._sa_expression is None and getattr(sa_value, "expanding", False):
+            clause = self._sa_column.in_(sa_value)
+        elif self._sa_expression is None:
+            clause = self._sa_column == sa_value
+        else:
+            value_expression = _replace_column(
+                self._sa_expression, self._sa_column, sa_value
+            )
+            clause = self._sa_expression == value_expression
+
+        if dialect_name in self._sa_where:
+            clause = sa.and_(clause, self._sa_where[dialect_name])
+
+        return clause
+
+    def normalize(self, executor: Any, values: list[Any]) -> dict[Any, Any]:
+        """
+        Get results of index expression for values, computed by the database
+        (values themselves for plain criteria), so values conflicting with each
+        other are found by comparing the results.
+        """
+
+        if self._sa_expression is None:
+            return {value: value for value in values}
+
+        result: dict[Any, Any] = {}
+
+        for start in range(0, len(values), _NORMALIZE_BATCH_SIZE):
+            end = start + _NORMALIZE_BATCH_SIZE
+            batch = values[start:end]
+            selects = [
+                sa.select(
+                    sa.literal(position).label("position"),
+                    _replace_column(
+                        self._sa_expression,
+                        self._sa_column,
+                        sa.literal(value, self._sa_column.type),
+                    ).label("result"),
+                )
+                for position, value in enumerate(batch)
+            ]
+            statement = selects[0] if len(selects) == 1 else sa.union_all(*selects)
+
+            for position, expression_result in executor.execute(statement):
+                result[batch[position]] = expression_result
+
+        return result
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return self.__dict__ == other.__dict__
+
+        return super().__eq__(other)
+
+
+class ColumnChecks(Immutable):
+    """
+    Database checks of values of a column, shared by ``Mapped`` and
+    ``TableSchema``: uniqueness under unique criteria and existence of rows
+    referenced by foreign keys. Statements are built once, queries run with an
+    executor, ``Session`` or ``Connection``.
+
+    Values of many rows are checked with one query per check, unless column is
+    covered by functional unique index.
+
+    :param sa_column: Checked column.
+    :param unique_criteria: Criteria of uniqueness checks, values are not
+        checked for uniqueness if empty.
+    :param sa_pk_column: Primary key column, required for statements excluding
+        a row.
+    :param references: Check existence of rows referenced by foreign keys.
+    """
+
+    def __init__(
+        self,
+        sa_column: Any,
+        unique_criteria: list[UniqueCriterion],
+        sa_pk_column: Optional[Any] = None,
+        *,
+        references: bool = True,
+    ):
+        self._sa_column = sa_column
+        self._unique_criteria = unique_criteria
+        self._sa_pk_column = sa_pk_column
+        self._exists_statements = {
+            dialect_name: self._build_exists_statements(dialect_name)
+            for dialect_name in self.dialect_names
+            if unique_criteria
+        }
+        self._referenced_values_statements = [
+            sa.select(fk.column).where(
+                fk.column.in_(sa.bindparam(_VALUES_PARAM, expanding=True))
+            )
+            for fk in sorted(sa_column.foreign_keys, key=lambda fk: fk.target_fullname)
+            if references
+        ]
+
+    @property
+    def unique(self) -> bool:
+        return bool(self._unique_criteria)
+
+    @property
+    def has_references(self) -> bool:
+        return bool(self._referenced_values_statements)
+
+    @property
+    def plain(self) -> bool:
+        """
+        Values are compared as is, no queries are needed to compare values with
+        each other.
+        """
+
+        return all(c.plain for c in self._unique_criteria)
+
+    @property
+    def unconditional(self) -> bool:
+        return all(c.unconditional for c in self._unique_criteria)
+
+    @property
+    def dialect_names(self) -> list[Optional[str]]:
+        """
+        Names of dialects with statements of their own, ``None`` for others.
+        """
+
+        dialect_names: list[Optional[str]] = [None]
+
+        for criterion in self._unique_criteria:
+            dialect_names += criterion.dialect_names
+
+        return dialect_names
+
+    def unique_clauses(
+        self, dialect_name: Optional[str]
+    ) -> tuple[ColumnElement, ColumnElement]:
+        """
+        Get clauses matching rows with the value, and such rows except the row
+        with primary key of instance parameter.
+        """
+
+        clause = self._unique_clause(dialect_name)
+        sa_instance_pk = sa.bindparam(_INSTANCE_PK_PARAM)
+
+        return clause, sa.and_(clause, self._sa_pk_column != sa_instance_pk)
+
+    def params(
+        self, value, excluding: bool = False, instance_pk: Any = None
+    ) -> dict[str, Any]:
+        """
+        Get parameters of statements built with :meth:`unique_clauses`.
+        """
+
+        if excluding:
+            return {_VALUE_PARAM: value, _INSTANCE_PK_PARAM: instance_pk}
+
+        return {_VALUE_PARAM: value}
+
+    def exists_query(
+        self,
+        dialect_name: str,
+        value,
+        excluding: bool = False,
+        instance_pk: Any = None,
+    ) -> tuple[sa.Select, dict[str, Any]]:
+        """
+        Get statement checking if value exists (in other row than the one with
+        ``instance_pk`` if ``excluding``) and its parameters.
+        """
+
+        statements = self._get_exists_statements(dialect_name)
+
+        return statements[int(excluding)], self.params(value, excluding, instance_pk)
+
+    def value_exists(
+        self,
+        executor: Any,
+        dialect_name: str,
+        value,
+        excluding: bool = False,
+        instance_pk: Any = None,
+    ) -> bool:
+        statement, params = self.exists_query(
+            dialect_name, value, excluding, instance_pk
+        )
+
+        return bool(executor.execute(statement, params).scalar())
+
+    def existing_values(
+        self, executor: Any, dialect_name: str, values: list[Any]
+    ) -> set:
+        """
+        Find distinct not null values already stored in the column, with single
+        query unless column is covered by functional unique index.
+        """
+
+        if not values:
+            return set()
+
+        statement = self._get_exists_statements(dialect_name)[2]
+
+        if statement is None:
+            return {
+                value
+                for value in values
+                if self.value_exists(executor, dialect_name, value)
+            }
+
+        return set(executor.execute(statement, {_VALUES_PARAM: values}).scalars())
+
+    def normalize(self, executor: Any, values: list[Any]) -> list[dict[Any, Any]]:
+        """
+        Normalize distinct not null values by each criterion, see
+        :meth:`UniqueCriterion.normalize`. Executor is not used if column is
+        :attr:`plain`.
+        """
+
+        return [c.normalize(executor, values) for c in self._unique_criteria]
+
+    def duplicates(
+        self,
+        values: dict[int, Any],
+        normalized_values: list[dict[Any, Any]],
+        seen: Optional[dict] = None,
+    ) -> set[int]:
+        """
+        Find indices of values conflicting with previous values of the batch,
+        see :func:`batch_duplicates`.
+
+        :param seen: Normalized values of previous chunks of the batch by column
+            checks, updated with the values.
+        """
+
+        if seen is None:
+            return batch_duplicates(values, normalized_values)
+
+        criteria_seen = seen.setdefault(self, [set() for _ in normalized_values])
+
+        return batch_duplicates(values, normalized_values, criteria_seen)
+
+    def referenced_values(
+        self, executor: Any, dialect_name: str, values: list[Any]
+    ) -> set[tuple[int, Any]]:
+        """
+        Find distinct not null values referencing existing rows, return pairs
+        of foreign key index and value.
+        """
+
+        result: set[tuple[int, Any]] = set()
+
+        for fk_index, statement in enumerate(self._referenced_values_statements):
+            if not values:
+                break
+
+            for value in executor.execute(statement, {_VALUES_PARAM: values}).scalars():
+                result.add((fk_index, value))
+
+        return result
+
+    def failed_checks(
+        self,
+        values: dict[int, Any],
+        existing_values: set,
+        duplicates: set[int],
+        referenced_values: set[tuple[int, Any]],
+    ) -> dict[int, list[str]]:
+        """
+        Get codes of errors of values indexed by row number, given results of
+        checks.
+        """
+
+        result: dict[int, list[str]] = {}
+
+        for index, value in values.items():
+            if value is None:
+                continue
+
+            if self.unique and (value in existing_values or index in duplicates):
+                result.setdefault(index, []).append("already_exists")
+
+            for fk_index in range(len(self._referenced_values_statements)):
+                if (fk_index, value) not in referenced_values:
+                    result.setdefault(index, []).append("does_not_exist")
+
+        return result
+
+    def warmup(self, connection: sa.Connection) -> None:
+        """
+        Compile statements for connection dialect, see :func:`compile_cached`.
+        """
+
+        if self._exists_statements:
+            statement, excluding_statement, values_statement = (
+                self._get_exists_statements(connection.dialect.name)
+            )
+            compile_cached(connection, statement, self.params(None))
+
+            if excluding_statement is not None:
+                compile_cached(connection, excluding_statement, self.params(None, True))
+
+            if values_statement is not None:
+                compile_cached(connection, values_statement, [_VALUES_PARAM])
+
+        for statement in self._referenced_values_statements:
+            compile_cached(connection, statement, [_VALUES_PARAM])
+
+    def _get_exists_statements(
+        self, dialect_name: Optional[str]
+    ) -> tuple[sa.Select, Optional[sa.Select], Optional[sa.Select]]:
+        if dialect_name in self._exists_statements:
+            return self._exists_statements[dialect_name]
+
+        return self._exists_statements[None]
+
+    def _unique_clause(self, dialect_name: Optional[str]) -> ColumnElement:
+        sa_value = sa.bindparam(_VALUE_PARAM)
+
+        return sa.or_(
+            *[c.clause(sa_value, dialect_name) for c in self._unique_criteria]
+        )
+
+    def _build_exists_statements(
+        self, dialect_name: Optional[str]
+    ) -> tuple[sa.Select, Optional[sa.Select], Optional[sa.Select]]:
+        if self._sa_pk_column is None:
+            clause = self._unique_clause(dialect_name)
+            excluding_statement = None
+        else:
+            clause, excluding_clause = self.unique_clauses(dialect_name)
+            excluding_statement = sa.select(sa.exists().where(excluding_clause))
+
+        if self.plain:
+            sa_values = sa.bindparam(_VALUES_PARAM, expanding=True)
+            values_clause = sa.or_(
+                *[c.clause(sa_values, dialect_name) for c in self._unique_criteria]
+            )
+            values_statement = sa.select(self._sa_column).where(values_clause)
+        else:
+            values_statement = None
+
+        return (
+            sa.select(sa.exists().where(clause)),
+            excluding_statement,
+            values_statement,
+        )
+
+
+def column_unique_criteria(sa_column: sa.Column) -> list[UniqueCriterion]:
+    """
+    Get criteria of unique constraints and unique indexes over the column: plain
+    criterion if values are unique by themselves (or no index covers the
+    column), and criteria of functional and partial unique indexes.
+    """
+
+    criteria = index_unique_criteria(sa_column)
+
+    if not criteria or has_plain_unique_constraint(sa_column):
+        criteria.insert(0, UniqueCriterion(sa_column))
+
+    return criteria
+
+
+def compile_cached(
+    connection: sa.Connection, statement: sa.Select, param_names: Iterable[str]
+) -> None:
+    """
+    Compile statement for connection dialect and store it in the engine compiled
+    cache, so ``Connection.execute()`` of the statement with parameters of these
+    names finds it there. The statement is not executed.
+    """
+
+    execution_options = connection.get_execution_options()
+    statement._compile_w_cache(
+        connection.dialect,
+        compiled_cache=execution_options.get(
+            "compiled_cache", connection.engine._compiled_cache
+        ),
+        column_keys=sorted(param_names),
+        schema_translate_map=execution_options.get("schema_translate_map"),
+        linting=connection.dialect.compiler_linting | compiler.WARN_LINTING,
+    )
+
+
+def has_plain_unique_constraint(sa_column: sa.Column) -> bool:
+    """
+    Check if column values are unique by themselves: column is defined as unique,
+    or it's the only column of a unique constraint or a non-partial unique index.
+    """
+
+    if sa_column.unique:
+        return True
+
+    table = sa_column.table
+
+    for constraint in table.constraints:
+        if isinstance(constraint, sa.UniqueConstraint) and _is_only_column(
+            sa_column, list(constraint.columns)
+        ):
+            return True
+
+    for sa_index in table.indexes:
+        if (
+            sa_index.unique
+            and _is_only_column(sa_column, sa_index.expressions)
+            and not _index_where(sa_index)
+        ):
+            return True
+
+    return False
+
+
+def composite_unique_columns(table: sa.Table) -> list[list[sa.Column]]:
+    """
+    Get columns of unique constraints and non-partial unique indexes over
+    several plain columns.
+    """
+
+    result = [
+        list(constraint.columns)
+        for constraint in table.constraints
+        if isinstance(constraint, sa.UniqueConstraint) and len(constraint.columns) > 1
+    ]
+
+    for sa_index in sorted(table.indexes, key=lambda i: str(i.name)):
+        if (
+            sa_index.unique
+            and len(sa_index.expressions) > 1
+            and all(isinstance(e, sa.Column) for e in sa_index.expressions)
+            and not _index_where(sa_index)
+        ):
+            result.append(list(sa_index.expressions))
+
+    return result
+
+
+def index_unique_criteria(sa_column: sa.Column) -> list[UniqueCriterion]:
+    """
+    Build criteria for unique indexes over a single column that cannot be
+    checked by plain comparison: functional indexes and partial indexes.
+    """
+
+    result: list[UniqueCriterion] = []
+
+    for sa_index in sorted(sa_column.table.indexes, key=lambda i: str(i.name)):
+        if not sa_index.unique or len(sa_index.expressions) != 1:
+            continue
+
+        (sa_expression,) = sa_index.expressions
+
+        referenced_columns = _referenced_columns(sa_expression)
+
+        if not _is_only_column(sa_column, referenced_columns):
+            continue
+
+        sa_where = _index_where(sa_index)
+
+        if sa_expression is sa_column:
+            if not sa_where:
+                continue
+
+            sa_expression = None
+
+        result.append(UniqueCriterion(sa_column, sa_expression, sa_where))
+
+    return result
+
+
+def _index_where(sa_index: sa.Index) -> dict[str, ColumnElement]:
+    result: dict[str, ColumnElement] = {}
+
+    # Iterating dialect kwargs does not load dialects, unlike accessing them by
+    # key, so no dialect is imported just to check for partial indexes.
+    for kwarg_name, value in sa_index.dialect_kwargs.items():
+        if kwarg_name.endswith(_WHERE_KWARG_SUFFIX) and value is not None:
+            dialect_name = kwarg_name[: -len(_WHERE_KWARG_SUFFIX)]
+            result[dialect_name] = sa.text(value) if isinstance(value, str) else value
+
+    return result
+
+
+def _is_only_column(sa_column: sa.Column, expressions: list[Any]) -> bool:
+    return len(expressions) == 1 and expressions[0] is sa_column
+
+
+def _referenced_columns(sa_expression: ColumnElement) -> list[sa.Column]:
+    result: list[sa.Column] = []
+
+    for element in visitors.iterate(sa_expression):
+        if isinstance(element, sa.Column) and all(c is not element for c in result):
+            result.append(element)
+
+    return result
+
+
+def _replace_column(
+    sa_expression: ColumnElement, sa_column: sa.Column, replacement: ColumnElement
+) -> ColumnElement:
+    def replace(element):
+        if element is sa_column:
+            return replacement
+
+        return None
+
+    return visitors.replacement_traverse(sa_expression, {}, replace)
+
+
+def batch_duplicates(
+    values: dict[int, Any],
+    normalized_values: list[dict[Any, Any]],
+    seen: Optional[list[set]] = None,
+) -> set[int]:
+    """
+    Find indices of values conflicting with a previous value of the batch under
+    any criterion, given values normalized by each criterion.
+
+    :param seen: Normalized values of previous chunks of the batch by criterion,
+        updated with the values.
+    """
+
+    result: set[int] = set()
+
+    if seen is None:
+        seen = [set() for _ in normalized_values]
+
+    for index, value in values.items():
+        if value is None:
+            continue
+
+        for criterion_seen, criterion_values in zip(seen, normalized_values):
+            normalized_value = criterion_values.get(value)
+
+            if normalized_value is None:
+                continue
+
+            if normalized_value in criterion_seen:
+                result.add(index)
+
+            criterion_seen.add(normalized_value)
+
+    return result
@@ -1,5 +1,7 @@
+import pickle
+
 import pytest
-from goodboy import Error, Int, type_name
+from goodboy import Bool, Error, Int, Str, type_name
 
 from goodboy_sqlalchemy.column import Column
 from tests.conftest import assert_errors
@@ -41,3 +43,73 @@ def test_column_cannot_be_required_and_has_default():
 
     with pytest.raises(ValueError):
         Column("dummy", Int(), required=True, has_default=True)
+
+
+def test_caches_validation_results():
+    column = Column("dummy", Bool(), cache_size=2)
+
+    assert column.validate("true", True, {}) is True
+    assert column.validate("true", True, {}) is True
+    assert column.validate(True, False, {}) is True
+
+    with assert_errors(
+        [Error("unexpected_type", {"expected_type": type_name("bool")})]
+    ):
+        column.validate("true", False, {})
+
+    with assert_errors(
+        [Error("unexpected_type", {"expected_type": type_name("bool")})]
+    ):
+        column.validate("true", False, {})
+
+    assert column.cache_stats.as_dict() == {"hits": 2, "misses": 3}
+
+
+def test_cache_key_includes_value_type():
+    column = Column("dummy", Int(), cache_size=10)
+
+    assert column.validate(1, False, {}) == 1
+
+    with assert_errors([Error("unexpected_type", {"expected_type": type_name("int")})]):
+        column.validate(1.0, False, {})
+
+
+def test_cache_evicts_least_recently_used():
+    column = Column("dummy", Int(), cache_size=2)
+
+    column.validate(1, False, {})
+    column.validate(2, False, {})
+    column.validate(1, False, {})
+    column.validate(3, False, {})
+    column.validate(1, False, {})
+    column.validate(2, False, {})
+
+    assert column.cache_stats.as_dict() == {"hits": 2, "misses": 4}
+
+
+def test_cache_skips_unhashable_values():
+    column = Column("dummy", Int(), cache_size=2)
+
+    with assert_errors([Error("unexpected_type", {"expected_type": type_name("int")})]):
+        column.validate([], False, {})
+
+    assert column.cache_stats.as_dict() == {"hits": 0, "misses": 0}
+
+
+def test_cache_disabled_for_schemas_with_rules():
+    def rule(schema, value, typecast, context):
+        return value, []
+
+    assert Column("dummy", Str(rules=[rule]), cache_size=2).cache_stats is None
+    assert Column("dummy", cache_size=2).cache_stats is None
+    assert Column("dummy", Str()).cache_stats is None
+
+
+def test_column_with_cache_can_be_pickled():
+    column = Column("dummy", Int(), cache_size=2)
+    column.validate(1, False, {})
+
+    loaded = pickle.loads(pickle.dumps(column))
+
+    assert loaded.validate(1, False, {}) == 1
+    assert loaded.cache_stats.as_dict() == {"hits": 0, "misses": 1}
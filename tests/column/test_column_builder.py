@@ -67,3 +67,17 @@ def test_handles_server_default_value(column_builder: ColumnBuilder):
 def test_raises_error_when_column_not_found(column_builder: ColumnBuilder):
     with pytest.raises(ColumnBuilderError):
         column_builder.build(Dummy, ["unknown_field"])
+
+
+def test_builds_table_columns(column_builder: ColumnBuilder):
+    assert column_builder.build(
+        Dummy.__table__, ["field_1", "field_5_in_database"]
+    ) == [
+        Column("field_1", gb.Str(), required=True, unique=True),
+        Column(
+            "field_5_in_database", gb.Str(allow_none=True), required=False, unique=False
+        ),
+    ]
+
+    with pytest.raises(ColumnBuilderError):
+        column_builder.build(Dummy.__table__, ["field_5"])
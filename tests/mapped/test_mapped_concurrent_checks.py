@@ -0,0 +1,184 @@
+import threading
+
+import goodboy as gb
+import pytest
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy.concurrent_checks import ConcurrentChecks
+from goodboy_sqlalchemy.mapped import Mapped
+from tests.conftest import assert_dict_value_errors
+
+Base = sa.orm.declarative_base()
+
+
+class Dummy(Base):
+    __tablename__ = "dummies"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    code = sa.Column(sa.String, unique=True)
+    email = sa.Column(sa.String, unique=True)
+    name = sa.Column(sa.String)
+    parent_id = sa.Column(sa.ForeignKey("dummies.id"))
+
+
+@pytest.fixture()
+def engine(tmp_path):
+    # checks use connections of their own, which do not share in-memory database
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    Base.metadata.create_all(engine)
+
+    with sa.orm.Session(engine) as session:
+        session.add(Dummy(id=1, code="a", email="a@example.com", name="A"))
+        session.commit()
+
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def session(engine):
+    with sa.orm.Session(engine) as session:
+        yield session
+
+
+@pytest.fixture()
+def context(session):
+    return {"session": session}
+
+
+@pytest.fixture()
+def concurrent_checks():
+    concurrent_checks = ConcurrentChecks(max_workers=2)
+    yield concurrent_checks
+    concurrent_checks.shutdown()
+
+
+@pytest.fixture()
+def schema(concurrent_checks):
+    return Mapped(
+        Dummy,
+        column_names=["code", "email", "name"],
+        concurrent_checks=concurrent_checks,
+    )
+
+
+@pytest.fixture()
+def check_threads(engine):
+    result = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if "EXISTS" in statement:
+            result.append(threading.current_thread().name)
+
+    sa.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield result
+    sa.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_reports_errors_of_all_keys(schema, context):
+    assert schema(
+        {"code": "b", "email": "b@example.com", "name": "B"}, context=context
+    ) == {"code": "b", "email": "b@example.com", "name": "B"}
+
+    # keys failed validation do not prevent checks of other keys
+    with assert_dict_value_errors(
+        {
+            "code": [gb.Error("already_exists")],
+            "email": [gb.Error("already_exists")],
+            "name": [
+                gb.Error("unexpected_type", {"expected_type": gb.type_name("str")})
+            ],
+        }
+    ):
+        schema({"code": "a", "email": "a@example.com", "name": 1}, context=context)
+
+
+def test_checks_references_concurrently(concurrent_checks, context):
+    schema = Mapped(
+        Dummy,
+        column_names=["code", "parent_id"],
+        concurrent_checks=concurrent_checks,
+        check_references=True,
+    )
+
+    with assert_dict_value_errors(
+        {
+            "code": [gb.Error("already_exists")],
+            "parent_id": [gb.Error("does_not_exist")],
+        }
+    ):
+        schema({"code": "a", "parent_id": 2}, context=context)
+
+    assert schema({"code": "b", "parent_id": 1}, context=context) == {
+        "code": "b",
+        "parent_id": 1,
+    }
+
+
+def test_runs_checks_concurrently(schema, context, engine):
+    # both queries have to be running at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if "EXISTS" in statement:
+            barrier.wait()
+
+    sa.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+
+    try:
+        with assert_dict_value_errors({"email": [gb.Error("already_exists")]}):
+            schema({"code": "b", "email": "a@example.com"}, context=context)
+    finally:
+        sa.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_limits_concurrency(context, check_threads):
+    concurrent_checks = ConcurrentChecks(max_workers=4, max_concurrency=1)
+    schema = Mapped(
+        Dummy, column_names=["code", "email"], concurrent_checks=concurrent_checks
+    )
+
+    try:
+        with assert_dict_value_errors({"code": [gb.Error("already_exists")]}):
+            schema({"code": "a", "email": "b@example.com"}, context=context)
+    finally:
+        concurrent_checks.shutdown()
+
+    assert len(check_threads) == 2
+
+
+def test_checks_pending_objects_without_queries(
+    schema, context, session, check_threads
+):
+    session.add(Dummy(code="b", email="b@example.com"))
+
+    with assert_dict_value_errors(
+        {"code": [gb.Error("already_exists")], "email": [gb.Error("already_exists")]}
+    ):
+        schema({"code": "b", "email": "b@example.com"}, context=context)
+
+    assert check_threads == []
+
+
+def test_excludes_validated_instance(schema, session):
+    instance = session.get(Dummy, 1)
+    context = {"session": session, "mapped_instance": instance}
+
+    assert schema({"code": "a", "email": "a@example.com"}, context=context) == {
+        "code": "a",
+        "email": "a@example.com",
+    }
+
+
+def test_fail_fast_checks_with_session(concurrent_checks, context, check_threads):
+    schema = Mapped(
+        Dummy,
+        column_names=["code", "email"],
+        fail_fast=True,
+        concurrent_checks=concurrent_checks,
+    )
+
+    with assert_dict_value_errors({"code": [gb.Error("already_exists")]}):
+        schema({"code": "a", "email": "a@example.com"}, context=context)
+
+    assert check_threads == [threading.current_thread().name]
@@ -0,0 +1,162 @@
+import goodboy as gb
+import pytest
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy.concurrent_checks import ConcurrentChecks
+from goodboy_sqlalchemy.mapped import Mapped
+from tests.conftest import assert_dict_value_errors
+
+# Use in-memory SQLite
+engine = sa.create_engine("sqlite://")
+Session = sa.orm.sessionmaker(engine)
+Base = sa.orm.declarative_base()
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String, nullable=False, unique=True)
+    email = sa.Column(sa.String, unique=True)
+
+
+Base.metadata.create_all(engine)
+
+
+@pytest.fixture()
+def session():
+    try:
+        session = Session()
+        session.add_all(
+            [
+                User(id=1, name="alice", email="alice@example.com"),
+                User(id=2, name="bob", email="bob@example.com"),
+            ]
+        )
+        session.commit()
+        yield session
+    finally:
+        session.rollback()
+        session.execute(sa.delete(User))
+        session.commit()
+
+
+@pytest.fixture()
+def context(session):
+    return {"session": session}
+
+
+@pytest.fixture()
+def statements():
+    result = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        result.append(statement)
+
+    sa.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield result
+    sa.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture()
+def schema():
+    return Mapped(User, column_names=["name", "email"], report_conflicts=True)
+
+
+def test_reports_pk_of_conflicting_row(schema, context, session, statements):
+    session.expunge_all()
+
+    with assert_dict_value_errors(
+        {
+            "name": [gb.Error("already_exists", {"pk": 1})],
+            "email": [gb.Error("already_exists", {"pk": 2})],
+        }
+    ):
+        schema({"name": "alice", "email": "bob@example.com"}, context=context)
+
+    assert len(statements) == 2
+
+    # conflicting rows are loaded by the checks
+    assert session.get(User, 1).name == "alice"
+    assert session.get(User, 2).name == "bob"
+    assert len(statements) == 2
+
+
+def test_passes_unique_values(schema, context):
+    assert schema({"name": "carol", "email": None}, context=context) == {
+        "name": "carol",
+        "email": None,
+    }
+
+
+def test_excludes_validated_instance(schema, session):
+    context = {"session": session, "mapped_instance": session.get(User, 1)}
+
+    assert schema({"name": "alice"}, context=context) == {"name": "alice"}
+
+    with assert_dict_value_errors({"name": [gb.Error("already_exists", {"pk": 2})]}):
+        schema({"name": "bob"}, context=context)
+
+
+def test_pending_conflict_has_no_pk(schema, context, session):
+    session.add(User(name="carol"))
+
+    with assert_dict_value_errors({"name": [gb.Error("already_exists")]}):
+        schema({"name": "carol"}, context=context)
+
+
+def test_no_pk_without_option(context):
+    schema = Mapped(User, column_names=["name"])
+
+    with assert_dict_value_errors({"name": [gb.Error("already_exists")]}):
+        schema({"name": "alice"}, context=context)
+
+
+def test_insert_reports_pk(context):
+    schema = Mapped(
+        User,
+        column_names=["name", "email"],
+        optimistic_unique=True,
+        report_conflicts=True,
+    )
+
+    with assert_dict_value_errors({"name": [gb.Error("already_exists", {"pk": 1})]}):
+        schema.insert({"name": "alice", "email": "carol@example.com"}, context=context)
+
+
+def test_concurrent_checks_report_pk(tmp_path):
+    file_engine = sa.create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    Base.metadata.create_all(file_engine)
+    concurrent_checks = ConcurrentChecks(max_workers=2)
+    schema = Mapped(
+        User,
+        column_names=["name", "email"],
+        concurrent_checks=concurrent_checks,
+        report_conflicts=True,
+    )
+
+    try:
+        with sa.orm.Session(file_engine) as session:
+            session.add(User(id=1, name="alice", email="alice@example.com"))
+            session.commit()
+
+            with assert_dict_value_errors(
+                {
+                    "name": [gb.Error("already_exists", {"pk": 1})],
+                    "email": [gb.Error("already_exists", {"pk": 1})],
+                }
+            ):
+                schema(
+                    {"name": "alice", "email": "alice@example.com"},
+                    context={"session": session},
+                )
+    finally:
+        concurrent_checks.shutdown()
+        file_engine.dispose()
+
+
+def test_ignores_conflicts_with_stale_rows(schema, context, session):
+    session.get(User, 1).name = "alicia"
+    session.delete(session.get(User, 2))
+
+    assert schema({"name": "alice", "email": "bob@example.com"}, context=context)
@@ -0,0 +1,218 @@
+import time
+from types import SimpleNamespace
+
+import goodboy as gb
+import pytest
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy import deadline
+from goodboy_sqlalchemy.column import Column
+from goodboy_sqlalchemy.deadline import (
+    DeadlineExceeded,
+    _before_cursor_execute,
+    _end_transaction,
+    deadline_scope,
+    install_statement_timeouts,
+)
+from goodboy_sqlalchemy.mapped import Mapped
+from tests.conftest import assert_errors
+
+# Use in-memory SQLite
+engine = sa.create_engine("sqlite://")
+install_statement_timeouts(engine)
+Session = sa.orm.sessionmaker(engine)
+Base = sa.orm.declarative_base()
+
+
+class Dummy(Base):
+    __tablename__ = "dummies"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    code = sa.Column(sa.String, unique=True)
+    name = sa.Column(sa.String)
+
+
+Base.metadata.create_all(engine)
+
+SLOW_QUERY = sa.text(
+    "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) "
+    "SELECT count(*) FROM n"
+)
+
+
+@pytest.fixture()
+def session():
+    try:
+        session = Session()
+        session.add(Dummy(id=1, code="a", name="A"))
+        session.flush()
+        yield session
+    finally:
+        session.rollback()
+
+
+@pytest.fixture()
+def statements():
+    result = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        result.append(statement)
+
+    sa.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield result
+    sa.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def sleep(seconds):
+    def rule(schema, value, typecast, context):
+        time.sleep(seconds)
+        return value, []
+
+    return rule
+
+
+def test_passes_within_deadline(session):
+    schema = Mapped(Dummy, column_names=["code", "name"])
+    context = {"session": session, "deadline": time.monotonic() + 60}
+
+    assert schema({"code": "b", "name": "B"}, context=context) == {
+        "code": "b",
+        "name": "B",
+    }
+
+
+def test_fails_with_timeout_after_deadline(session, statements):
+    schema = Mapped(Dummy, column_names=["code", "name"])
+    context = {"session": session, "deadline": time.monotonic() - 1}
+
+    with assert_errors([gb.Error("timeout")]):
+        schema({"code": "a", "name": "A"}, context=context)
+
+    assert statements == []
+
+
+def test_stops_validation_between_keys(session, statements):
+    schema = Mapped(
+        Dummy,
+        keys=[Column("name", gb.Str(rules=[sleep(0.05)]))],
+        column_names=["code"],
+    )
+    context = {"session": session, "deadline": time.monotonic() + 0.01}
+
+    with assert_errors([gb.Error("timeout")]):
+        schema({"name": "B", "code": "b"}, context=context)
+
+    # uniqueness of code is not checked
+    assert statements == []
+
+
+def test_interrupts_running_statement(session):
+    def slow_rule(schema, value, typecast, context):
+        context["session"].execute(SLOW_QUERY)
+        return value, []
+
+    schema = Mapped(Dummy, column_names=["code"], rules=[slow_rule])
+    context = {"session": session, "deadline": time.monotonic() + 0.1}
+    started = time.monotonic()
+
+    with assert_errors([gb.Error("timeout")]):
+        schema({"code": "b"}, context=context)
+
+    assert time.monotonic() - started < 5
+
+    # progress handler is removed after the statement
+    assert session.execute(sa.text("SELECT 1")).scalar() == 1
+
+
+def test_nested_scope_cannot_extend_deadline(session):
+    with deadline_scope(time.monotonic() - 1):
+        with deadline_scope(time.monotonic() + 60):
+            with pytest.raises(DeadlineExceeded):
+                session.execute(sa.text("SELECT 1"))
+
+
+class TimeoutCursor:
+    def __init__(self, executed):
+        self.executed = executed
+
+    def execute(self, statement):
+        self.executed.append(statement)
+
+    def fetchone(self):
+        return ("5s",)
+
+    def close(self):
+        pass
+
+
+def postgresql_connection(executed, *, autocommit=False):
+    import sqlalchemy.dialects.postgresql.psycopg2 as sa_pg_psycopg2
+
+    return SimpleNamespace(
+        dialect=sa_pg_psycopg2.dialect(),
+        info={},
+        invalidated=False,
+        connection=SimpleNamespace(
+            cursor=lambda: TimeoutCursor(executed),
+            dbapi_connection=SimpleNamespace(autocommit=autocommit),
+        ),
+    )
+
+
+def test_sets_postgresql_statement_timeout_once_per_scope():
+    executed = []
+    conn = postgresql_connection(executed)
+
+    def execute():
+        _before_cursor_execute(conn, None, "SELECT 1", {}, None, False)
+
+    with deadline_scope(time.monotonic() + 60):
+        execute()
+        execute()
+
+    assert len(executed) == 1
+    assert "current_setting" in executed[0]
+
+    # previous setting is restored by the first statement outside of the scope
+    execute()
+    execute()
+
+    assert len(executed) == 2
+    # values are rendered into statements, whatever the driver paramstyle
+    assert executed[1] == "SELECT set_config('statement_timeout', '5s', true)"
+
+    with deadline_scope(time.monotonic() + 60):
+        execute()
+        _end_transaction(conn)
+        execute()
+
+    assert len(executed) == 4
+
+
+def test_sets_postgresql_statement_timeout_again_when_time_left_dropped(
+    monkeypatch,
+):
+    executed = []
+    conn = postgresql_connection(executed)
+    monkeypatch.setattr(deadline, "POSTGRESQL_TIMEOUT_TOLERANCE", 0.0)
+
+    with deadline_scope(time.monotonic() + 60):
+        _before_cursor_execute(conn, None, "SELECT 1", {}, None, False)
+        time.sleep(0.01)
+        _before_cursor_execute(conn, None, "SELECT 1", {}, None, False)
+
+    assert len(executed) == 2
+    assert "current_setting" not in executed[1]
+    assert int(executed[1].split("'")[3]) < int(executed[0].split("'")[5])
+
+
+def test_skips_postgresql_statement_timeout_in_autocommit_mode():
+    executed = []
+    conn = postgresql_connection(executed, autocommit=True)
+
+    with deadline_scope(time.monotonic() + 60):
+        _before_cursor_execute(conn, None, "SELECT 1", {}, None, False)
+
+    _before_cursor_execute(conn, None, "SELECT 1", {}, None, False)
+
+    assert executed == []
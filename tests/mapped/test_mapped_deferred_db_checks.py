@@ -0,0 +1,172 @@
+import goodboy as gb
+import pytest
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy.mapped import Mapped
+from tests.conftest import assert_dict_value_errors, assert_errors
+
+# Use in-memory SQLite
+engine = sa.create_engine("sqlite://")
+Session = sa.orm.sessionmaker(engine)
+Base = sa.orm.declarative_base()
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String, nullable=False)
+    email = sa.Column(sa.String, unique=True)
+    phone = sa.Column(sa.String, unique=True)
+    age = sa.Column(sa.Integer)
+
+
+Base.metadata.create_all(engine)
+
+
+@pytest.fixture()
+def session():
+    try:
+        session = Session()
+        session.add(User(name="Alice", email="alice@example.com", phone="1"))
+        session.flush()
+        yield session
+    finally:
+        session.rollback()
+
+
+@pytest.fixture()
+def context(session):
+    return {"session": session}
+
+
+@pytest.fixture()
+def statements():
+    result = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        result.append(statement)
+
+    sa.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield result
+    sa.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def rule_calls(calls):
+    def rule(schema, value, typecast, context):
+        calls.append(value)
+        return value, []
+
+    return rule
+
+
+COLUMN_NAMES = ["name", "email", "phone", "age"]
+
+
+def test_skips_db_checks_for_invalid_payload(context, statements):
+    rule_calls_log = []
+    schema = Mapped(
+        User,
+        column_names=COLUMN_NAMES,
+        rules=[rule_calls(rule_calls_log)],
+        defer_db_checks=True,
+    )
+
+    with assert_errors(
+        [
+            gb.Error("key_errors", nested_errors={"name": [gb.Error("required_key")]}),
+            gb.Error(
+                "value_errors",
+                nested_errors={
+                    "age": [
+                        gb.Error(
+                            "unexpected_type", {"expected_type": gb.type_name("int")}
+                        )
+                    ]
+                },
+            ),
+        ]
+    ):
+        schema(
+            {"email": "alice@example.com", "phone": "2", "age": "old"},
+            context=context,
+        )
+
+    assert statements == []
+    assert rule_calls_log == []
+    assert schema.stats.as_dict() == {
+        "validations": 1,
+        "db_checks": 0,
+        "db_checks_skipped": 2,
+        "rules_skipped": 1,
+    }
+
+
+def test_runs_db_checks_for_valid_payload(context):
+    rule_calls_log = []
+    schema = Mapped(
+        User,
+        column_names=COLUMN_NAMES,
+        rules=[rule_calls(rule_calls_log)],
+        defer_db_checks=True,
+    )
+
+    with assert_dict_value_errors(
+        {
+            "email": [gb.Error("already_exists")],
+            "phone": [gb.Error("already_exists")],
+        }
+    ):
+        schema(
+            {"name": "Bob", "email": "alice@example.com", "phone": "1"},
+            context=context,
+        )
+
+    assert rule_calls_log == []
+
+    value = {"name": "Bob", "email": "bob@example.com", "phone": "2"}
+
+    assert schema(value, context=context) == value
+    assert rule_calls_log == [value]
+    assert schema.stats["db_checks"] == 4
+    assert schema.stats["db_checks_skipped"] == 0
+
+
+def test_fail_fast_stops_at_first_error(context, statements):
+    schema = Mapped(
+        User, column_names=COLUMN_NAMES, defer_db_checks=True, fail_fast=True
+    )
+
+    with assert_dict_value_errors(
+        {"name": [gb.Error("unexpected_type", {"expected_type": gb.type_name("str")})]}
+    ):
+        schema(
+            {"name": 1, "email": "alice@example.com", "age": "old", "x": 1},
+            context=context,
+        )
+
+    with assert_dict_value_errors({"email": [gb.Error("already_exists")]}):
+        schema(
+            {"name": "Bob", "email": "alice@example.com", "phone": "1"},
+            context=context,
+        )
+
+    assert len(statements) == 1
+    assert schema.stats["db_checks"] == 1
+    assert schema.stats["db_checks_skipped"] == 2
+
+
+def test_reports_all_errors_by_default(context):
+    schema = Mapped(User, column_names=COLUMN_NAMES)
+
+    with assert_errors(
+        [
+            gb.Error("key_errors", nested_errors={"name": [gb.Error("required_key")]}),
+            gb.Error(
+                "value_errors", nested_errors={"email": [gb.Error("already_exists")]}
+            ),
+        ]
+    ):
+        schema({"email": "alice@example.com"}, context=context)
+
+    assert schema.stats["validations"] == 1
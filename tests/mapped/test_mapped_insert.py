@@ -0,0 +1,127 @@
+import goodboy as gb
+import pytest
+import sqlalchemy as sa
+import sqlalchemy.exc as sa_exc
+
+from goodboy_sqlalchemy.mapped import Mapped, MappedError
+from tests.conftest import assert_dict_value_errors, assert_errors
+
+# Use in-memory SQLite
+engine = sa.create_engine("sqlite://")
+
+
+# Make pysqlite emit BEGIN itself, so savepoints work
+# See "Serializable isolation / Savepoints / Transactional DDL" in SQLAlchemy
+# SQLite dialect documentation.
+@sa.event.listens_for(engine, "connect")
+def do_connect(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@sa.event.listens_for(engine, "begin")
+def do_begin(connection):
+    connection.exec_driver_sql("BEGIN")
+
+
+Session = sa.orm.sessionmaker(engine)
+Base = sa.orm.declarative_base()
+
+
+class User(Base):
+    __tablename__ = "users"
+    __table_args__ = (sa.UniqueConstraint("first_name", "last_name"),)
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String, nullable=False, unique=True)
+    email = sa.Column("email_address", sa.String, unique=True)
+    first_name = sa.Column(sa.String)
+    last_name = sa.Column(sa.String)
+
+
+Base.metadata.create_all(engine)
+
+
+@pytest.fixture()
+def session():
+    try:
+        session = Session()
+        yield session
+    finally:
+        session.rollback()
+
+
+@pytest.fixture()
+def context(session):
+    return {"session": session}
+
+
+@pytest.fixture()
+def user_mapped():
+    return Mapped(
+        User,
+        column_names=["name", "email", "first_name", "last_name"],
+        optimistic_unique=True,
+    )
+
+
+@pytest.fixture(params=["sqlite", "other"])
+def dialect_name(request, session, monkeypatch):
+    if request.param != "sqlite":
+        monkeypatch.setattr(session.get_bind().dialect, "name", request.param)
+
+    return request.param
+
+
+def test_does_not_query_unique_columns_on_validation(user_mapped, session, context):
+    session.add(User(name="Marty"))
+    session.flush()
+
+    assert user_mapped({"name": "Marty"}, context=context) == {"name": "Marty"}
+
+
+def test_inserts_valid_value(user_mapped, session, context, dialect_name):
+    pk = user_mapped.insert({"name": "Marty", "email": "marty@hv.com"}, context=context)
+
+    user = session.get(User, pk)
+
+    assert user.name == "Marty"
+    assert user.email == "marty@hv.com"
+
+
+def test_rejects_conflicting_value(user_mapped, session, context, dialect_name):
+    session.add(User(name="Marty", email="marty@hv.com"))
+    session.flush()
+
+    with assert_dict_value_errors({"email": [gb.Error("already_exists")]}):
+        user_mapped.insert({"name": "Doc", "email": "marty@hv.com"}, context=context)
+
+    assert session.query(User).count() == 1
+
+
+def test_rejects_value_conflicting_with_composite_constraint(
+    user_mapped, session, context, dialect_name
+):
+    session.add(User(name="Marty", first_name="Marty", last_name="McFly"))
+    session.flush()
+
+    with assert_errors([gb.Error("already_exists")]):
+        user_mapped.insert(
+            {"name": "Doc", "first_name": "Marty", "last_name": "McFly"},
+            context=context,
+        )
+
+
+def test_reraises_unrelated_integrity_errors(user_mapped, session, monkeypatch):
+    monkeypatch.setattr(session.get_bind().dialect, "name", "other")
+
+    schema = Mapped(User, keys=[gb.Key("name")], optimistic_unique=True)
+
+    with pytest.raises(sa_exc.IntegrityError):
+        schema.insert({}, context={"session": session})
+
+
+def test_rejects_insert_for_existing_instance(user_mapped, session):
+    user = User(name="Marty")
+
+    with pytest.raises(MappedError):
+        user_mapped.insert({}, context={"session": session, "mapped_instance": user})
@@ -182,3 +182,19 @@ def test_conditional_validation_when_no_instance_specified(
         user_conditional_mapped(
             {"name": "Doc", "marty_stuff": "woo-hoo"}, context=context
         )
+
+
+def test_warmup_executes_no_statements(user_mapped):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    sa.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+
+    try:
+        user_mapped.warmup(engine)
+    finally:
+        sa.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert statements == []
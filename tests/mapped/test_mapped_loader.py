@@ -0,0 +1,249 @@
+import goodboy as gb
+import pytest
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy import loader
+from goodboy_sqlalchemy.batch import ListErrorSink
+from goodboy_sqlalchemy.column import Column
+from goodboy_sqlalchemy.mapped import Mapped
+from goodboy_sqlalchemy.relationship import Relationship
+from tests.conftest import assert_dict_value_errors, assert_errors
+
+# Use in-memory SQLite
+engine = sa.create_engine("sqlite://")
+Session = sa.orm.sessionmaker(engine)
+Base = sa.orm.declarative_base()
+
+
+class Category(Base):
+    __tablename__ = "categories"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String, nullable=False)
+    is_archived = sa.Column(sa.Boolean, nullable=False, default=False)
+
+
+class Product(Base):
+    __tablename__ = "products"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String, nullable=False)
+    category_id = sa.Column(sa.Integer)
+    parts = sa.orm.relationship("Part")
+
+
+class Part(Base):
+    __tablename__ = "parts"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    product_id = sa.Column(sa.ForeignKey("products.id"))
+    category_id = sa.Column(sa.Integer)
+
+
+Base.metadata.create_all(engine)
+
+
+@pytest.fixture()
+def session():
+    try:
+        session = Session()
+        session.add_all(
+            [
+                Category(id=1, name="Books"),
+                Category(id=2, name="Music", is_archived=True),
+            ]
+        )
+        session.flush()
+        yield session
+    finally:
+        session.rollback()
+
+
+@pytest.fixture()
+def context(session):
+    return {"session": session}
+
+
+@pytest.fixture()
+def statements():
+    result = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        result.append(statement)
+
+    sa.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield result
+    sa.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def category_exists(schema, value, typecast, context):
+    context["loader"].load(
+        Category.id,
+        value,
+        lambda category: [] if category else [schema._error("no_category")],
+    )
+
+    return value, []
+
+
+def category_is_active(schema, value, typecast, context):
+    def callback(category):
+        if category and category.is_archived:
+            return [
+                schema._error(
+                    "value_errors",
+                    nested_errors={"category_id": [schema._error("archived")]},
+                )
+            ]
+
+        return []
+
+    context["loader"].load(Category.id, value.get("category_id"), callback)
+
+    return value, []
+
+
+def category_column(name="category_id"):
+    return Column(name, gb.Int(rules=[category_exists]))
+
+
+@pytest.fixture()
+def schema():
+    return Mapped(
+        Product,
+        keys=[category_column()],
+        column_names=["name"],
+        rules=[category_is_active],
+    )
+
+
+def test_resolves_loads_of_keys_and_rules(schema, context, statements):
+    assert schema({"name": "Book", "category_id": 1}, context=context) == {
+        "name": "Book",
+        "category_id": 1,
+    }
+
+    with assert_dict_value_errors({"category_id": [gb.Error("no_category")]}):
+        schema({"name": "Book", "category_id": 3}, context=context)
+
+    with assert_dict_value_errors({"category_id": [gb.Error("archived")]}):
+        schema({"name": "Album", "category_id": 2}, context=context)
+
+    # both lookups of a payload are done with a single query
+    assert len(statements) == 3
+
+
+def test_memoizes_instances_per_session(schema, context, session, statements):
+    schema({"name": "Book", "category_id": 1}, context=context)
+    schema({"name": "Book", "category_id": 1}, context=context)
+
+    assert len(statements) == 1
+
+    with assert_dict_value_errors({"category_id": [gb.Error("no_category")]}):
+        schema({"name": "Game", "category_id": 3}, context=context)
+
+    # memo is reset on flush
+    session.add(Category(id=3, name="Games"))
+    session.flush()
+
+    assert schema({"name": "Game", "category_id": 3}, context=context) == {
+        "name": "Game",
+        "category_id": 3,
+    }
+
+
+def test_batches_loads_of_many_rows(schema, context, statements):
+    values = [
+        {"name": "Book", "category_id": 1},
+        {"name": "Album", "category_id": 2},
+        {"name": "Game", "category_id": 3},
+        {"name": 4, "category_id": 4},
+    ]
+    sink = ListErrorSink()
+
+    results = list(schema.validate_many(values, context=context, errors=sink))
+
+    assert results == [(0, {"name": "Book", "category_id": 1})]
+    assert [s for s in statements if "categories" in s] == [statements[0]]
+    assert sink.errors[1] == [
+        gb.Error("value_errors", nested_errors={"category_id": [gb.Error("archived")]})
+    ]
+    assert sink.errors[2] == [
+        gb.Error(
+            "value_errors", nested_errors={"category_id": [gb.Error("no_category")]}
+        )
+    ]
+
+
+def test_splits_loads_into_bounded_queries(schema, context, statements, monkeypatch):
+    monkeypatch.setattr(loader, "LOAD_BATCH_SIZE", 2)
+    values = [{"name": "Book", "category_id": i} for i in [1, 3, 4, 1]]
+    sink = ListErrorSink()
+
+    results = list(schema.validate_many(values, context=context, errors=sink))
+
+    assert [index for index, _ in results] == [0, 3]
+    assert list(sink.errors) == [1, 2]
+    assert len([s for s in statements if "categories" in s]) == 2
+
+
+def test_caps_memo_size(schema, context, session, monkeypatch):
+    monkeypatch.setattr(loader, "MEMO_MAX_SIZE", 1)
+    values = [{"name": "Book", "category_id": i} for i in [1, 3, 2]]
+    sink = ListErrorSink()
+
+    results = list(schema.validate_many(values, context=context, errors=sink))
+
+    assert [index for index, _ in results] == [0]
+    assert list(sink.errors) == [1, 2]
+    assert sum(len(m) for m in session.info[loader._MEMO_INFO_KEY].values()) <= 1
+
+
+def test_does_not_autoflush_session(schema, context, session):
+    category = Category(id=3, name="Games")
+    session.add(category)
+
+    with assert_dict_value_errors({"category_id": [gb.Error("no_category")]}):
+        schema({"name": "Game", "category_id": 3}, context=context)
+
+    assert category in session.new
+
+
+def test_nests_errors_of_relationship_children(context, statements):
+    part_schema = Mapped(Part, keys=[category_column()])
+    schema = Mapped(
+        Product,
+        keys=[Relationship("parts", part_schema)],
+        column_names=["name"],
+    )
+
+    with assert_errors(
+        [
+            gb.Error(
+                "value_errors",
+                nested_errors={
+                    "parts": [
+                        gb.Error(
+                            "value_errors",
+                            nested_errors={
+                                1: [
+                                    gb.Error(
+                                        "value_errors",
+                                        nested_errors={
+                                            "category_id": [gb.Error("no_category")]
+                                        },
+                                    )
+                                ]
+                            },
+                        )
+                    ]
+                },
+            )
+        ]
+    ):
+        schema(
+            {"name": "Kit", "parts": [{"category_id": 1}, {"category_id": 5}]},
+            context=context,
+        )
+
+    assert len(statements) == 1
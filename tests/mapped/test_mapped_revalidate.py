@@ -0,0 +1,165 @@
+import goodboy as gb
+import pytest
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy.column import Column
+from goodboy_sqlalchemy.mapped import Mapped
+from tests.conftest import assert_dict_key_errors, assert_dict_value_errors
+
+# Use in-memory SQLite
+engine = sa.create_engine("sqlite://")
+Session = sa.orm.sessionmaker(engine)
+Base = sa.orm.declarative_base()
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String, nullable=False)
+    email = sa.Column(sa.String, unique=True)
+    is_company = sa.Column(sa.Boolean, nullable=False)
+    company_name = sa.Column(sa.String)
+
+
+Base.metadata.create_all(engine)
+
+
+@pytest.fixture()
+def session():
+    try:
+        session = Session()
+        session.add(User(name="Alice", email="alice@example.com", is_company=False))
+        session.flush()
+        yield session
+    finally:
+        session.rollback()
+
+
+@pytest.fixture()
+def context(session):
+    return {"session": session}
+
+
+@pytest.fixture()
+def statements():
+    result = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        result.append(statement)
+
+    sa.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield result
+    sa.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def upper_name(schema, value, typecast, context):
+    value["name"] = value["name"].upper()
+    return value, []
+
+
+def test_revalidates_changed_keys_only(context, statements):
+    schema = Mapped(User, column_names=["name", "email", "is_company"])
+    payload = {"name": "Bob", "email": "bob@example.com", "is_company": False}
+    previous = schema(payload, context=context)
+    statements.clear()
+
+    assert schema.revalidate(payload, previous, {"name": "Bobby"}, context=context) == {
+        "name": "Bobby",
+        "email": "bob@example.com",
+        "is_company": False,
+    }
+    assert statements == []
+
+    with assert_dict_value_errors({"email": [gb.Error("already_exists")]}):
+        schema.revalidate(
+            payload, previous, {"email": "alice@example.com"}, context=context
+        )
+
+    assert len(statements) == 1
+
+
+def test_reevaluates_predicates(context):
+    schema = Mapped(
+        User,
+        keys=[
+            Column(
+                "company_name",
+                gb.Str(),
+                required=True,
+                predicate=lambda values: values.get("is_company"),
+            )
+        ],
+        column_names=["name", "is_company"],
+    )
+    payload = {"name": "Bob", "is_company": False}
+    previous = schema(payload, context=context)
+
+    with assert_dict_key_errors({"company_name": [gb.Error("required_key")]}):
+        schema.revalidate(payload, previous, {"is_company": True}, context=context)
+
+    assert schema.revalidate(
+        payload, previous, {"is_company": True, "company_name": "Acme"}, context=context
+    ) == {"name": "Bob", "is_company": True, "company_name": "Acme"}
+
+
+def test_skips_rules_not_depending_on_changed_keys(context):
+    calls = []
+
+    def email_rule(schema, value, typecast, context):
+        calls.append(value)
+        return value, []
+
+    email_rule.depends_on = ["email"]
+
+    schema = Mapped(
+        User, column_names=["name", "email"], rules=[upper_name, email_rule]
+    )
+    payload = {"name": "Bob", "email": "bob@example.com"}
+    previous = schema(payload, context=context)
+
+    assert previous == {"name": "BOB", "email": "bob@example.com"}
+    assert len(calls) == 1
+
+    assert schema.revalidate(payload, previous, {"name": "Carl"}, context=context) == {
+        "name": "CARL",
+        "email": "bob@example.com",
+    }
+    assert len(calls) == 1
+
+    schema.revalidate(payload, previous, {"email": "carl@example.com"}, context=context)
+    assert len(calls) == 2
+
+
+def test_rejects_unknown_keys(context):
+    schema = Mapped(User, column_names=["name"])
+    payload = {"name": "Bob"}
+    previous = schema(payload, context=context)
+
+    with assert_dict_key_errors({"password": [gb.Error("unknown_key")]}):
+        schema.revalidate(payload, previous, {"password": "secret"}, context=context)
+
+
+def test_applies_defaults_again(context):
+    schema = Mapped(
+        User,
+        keys=[
+            Column(
+                "company_name",
+                gb.Str(),
+                default="Acme",
+                predicate=lambda values: values.get("is_company"),
+            )
+        ],
+        column_names=["name", "is_company"],
+    )
+    payload = {"name": "Bob", "is_company": True}
+    previous = schema(payload, context=context)
+
+    assert previous == {"name": "Bob", "is_company": True, "company_name": "Acme"}
+
+    delta = {"is_company": False}
+    expected = schema({**payload, **delta}, context=context)
+
+    assert expected == {"name": "Bob", "is_company": False}
+    assert schema.revalidate(payload, previous, delta, context=context) == expected
@@ -0,0 +1,110 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import goodboy as gb
+import pytest
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy.mapped import Mapped
+
+# Use in-memory SQLite
+engine = sa.create_engine("sqlite://")
+Session = sa.orm.sessionmaker(engine)
+Base = sa.orm.declarative_base()
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String, nullable=False)
+    age = sa.Column(sa.Integer)
+
+
+Base.metadata.create_all(engine)
+
+
+def test_schema_is_immutable():
+    schema = Mapped(User, column_names=["name"])
+
+    with pytest.raises(AttributeError):
+        schema._rules = []
+
+    with pytest.raises(AttributeError):
+        del schema._keys
+
+    with pytest.raises(AttributeError):
+        schema._mapped_keys[0]._column = None
+
+    with pytest.raises(AttributeError):
+        schema._mapped_keys[0]._column.unique = True
+
+
+def test_copies_arguments():
+    keys = [gb.Key("nickname", gb.Str())]
+    column_names = ["name"]
+    rules = []
+
+    schema = Mapped(User, keys=keys, column_names=column_names, rules=rules)
+
+    keys.append(gb.Key("other"))
+    column_names.append("age")
+    rules.append(lambda schema, value, typecast, context: (value, [gb.Error("x")]))
+
+    session = Session()
+
+    try:
+        assert schema({"name": "Bob"}, context={"session": session}) == {"name": "Bob"}
+
+        with pytest.raises(gb.SchemaError):
+            schema({"name": "Bob", "age": 1}, context={"session": session})
+    finally:
+        session.close()
+
+
+@pytest.fixture()
+def thread_sessions():
+    sessions = []
+    lock = threading.Lock()
+    local = threading.local()
+
+    def get_session():
+        if not hasattr(local, "session"):
+            local.session = Session()
+
+            with lock:
+                sessions.append(local.session)
+
+        return local.session
+
+    try:
+        yield get_session
+    finally:
+        for session in sessions:
+            session.close()
+
+
+def test_shared_schema_validates_in_threads(thread_sessions):
+    schema = Mapped(User, column_names=["name", "age"])
+
+    def validate(i):
+
+        value = {"name": f"user{i}", "age": str(i)} if i % 2 else {"age": i}
+
+        try:
+            return schema(value, typecast=True, context={"session": thread_sessions()})
+        except gb.SchemaError as e:
+            return e.errors
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(validate, range(1000)))
+
+    for i, result in enumerate(results):
+        if i % 2:
+            assert result == {"name": f"user{i}", "age": i}
+        else:
+            assert result == [
+                gb.Error(
+                    "key_errors", nested_errors={"name": [gb.Error("required_key")]}
+                )
+            ]
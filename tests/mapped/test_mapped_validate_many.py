@@ -0,0 +1,276 @@
+import goodboy as gb
+import pytest
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy.batch import (
+    BatchAbortedError,
+    CompactErrorSink,
+    Deduplicator,
+    ListErrorSink,
+    SummaryErrorSink,
+)
+from goodboy_sqlalchemy.mapped import Mapped, MappedError
+from tests.conftest import assert_dict_value_errors
+
+# Use in-memory SQLite
+engine = sa.create_engine("sqlite://")
+Session = sa.orm.sessionmaker(engine)
+Base = sa.orm.declarative_base()
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String(8), nullable=False)
+    email = sa.Column(sa.String, unique=True)
+
+
+class Pet(Base):
+    __tablename__ = "pets"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    owner_id = sa.Column(sa.ForeignKey("users.id"))
+
+
+Base.metadata.create_all(engine)
+
+
+@pytest.fixture()
+def session():
+    try:
+        session = Session()
+        session.add(User(name="Alice", email="alice@example.com"))
+        session.flush()
+        yield session
+    finally:
+        session.rollback()
+
+
+@pytest.fixture()
+def context(session):
+    return {"session": session}
+
+
+@pytest.fixture()
+def statements():
+    result = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        result.append(statement)
+
+    sa.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield result
+    sa.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture()
+def schema():
+    return Mapped(User, column_names=["name", "email"])
+
+
+VALUES = [
+    {"name": "Bob", "email": "bob@example.com"},
+    {"name": "Alice", "email": "alice@example.com"},
+    {"name": "too long name"},
+    "oops",
+    {"name": "Carol", "email": "bob@example.com"},
+    {"name": "Dave"},
+]
+
+
+def test_yields_valid_rows_and_sinks_errors(schema, context, statements):
+    sink = ListErrorSink()
+
+    assert list(schema.validate_many(VALUES, context=context, errors=sink)) == [
+        (0, {"name": "Bob", "email": "bob@example.com"}),
+        (5, {"name": "Dave"}),
+    ]
+
+    assert len(statements) == 1
+    assert sink.error_count == 4
+    assert sink.errors == {
+        1: [
+            gb.Error(
+                "value_errors", nested_errors={"email": [gb.Error("already_exists")]}
+            )
+        ],
+        2: [
+            gb.Error(
+                "value_errors",
+                nested_errors={"name": [gb.Error("string_too_long", {"value": 8})]},
+            )
+        ],
+        3: [gb.Error("unexpected_type", {"expected_type": gb.type_name("dict")})],
+        4: [
+            gb.Error(
+                "value_errors", nested_errors={"email": [gb.Error("already_exists")]}
+            )
+        ],
+    }
+
+
+def test_checks_database_by_chunks(schema, context, statements):
+    sink = ListErrorSink()
+
+    results = list(
+        schema.validate_many(VALUES, context=context, errors=sink, chunk_size=2)
+    )
+
+    # row 4 duplicates row 0 of the previous chunk
+    assert [index for index, _ in results] == [0, 5]
+    assert list(sink.errors) == [1, 2, 3, 4]
+    assert len(statements) == 2
+
+
+def test_aborts_on_max_errors(schema, context):
+    sink = ListErrorSink()
+    results = []
+
+    with pytest.raises(BatchAbortedError):
+        for result in schema.validate_many(
+            VALUES, context=context, errors=sink, max_errors=1, chunk_size=1
+        ):
+            results.append(result)
+
+    assert [index for index, _ in results] == [0]
+    assert list(sink.errors) == [1, 2]
+
+
+def test_summary_error_sink(schema, context):
+    sink = SummaryErrorSink(max_samples=1)
+    list(schema.validate_many(VALUES, context=context, errors=sink))
+
+    assert sink.counts == {
+        (("email",), "already_exists"): 2,
+        (("name",), "string_too_long"): 1,
+        ((), "unexpected_type"): 1,
+    }
+    assert sink.samples == {
+        (("email",), "already_exists"): [1],
+        (("name",), "string_too_long"): [2],
+        ((), "unexpected_type"): [3],
+    }
+
+
+def test_compact_error_sink(schema, context):
+    sink = CompactErrorSink()
+    list(schema.validate_many(VALUES, context=context, errors=sink))
+
+    assert sorted(sink) == [
+        (1, ("email",), "already_exists"),
+        (2, ("name",), "string_too_long"),
+        (3, (), "unexpected_type"),
+        (4, ("email",), "already_exists"),
+    ]
+    assert len(sink.error_keys) == 3
+
+
+def test_validates_identical_payloads_once(schema, context, statements):
+    sink = ListErrorSink()
+    values = [
+        {"name": "Bob", "email": "bob@example.com"},
+        {"name": "too long name"},
+        {"email": "bob@example.com", "name": "Bob"},
+        {"name": "too long name"},
+        {"name": "Dave"},
+        {"name": "Dave"},
+        {"name": "Carol", "email": "alice@example.com"},
+        {"name": "Carol", "email": "alice@example.com"},
+    ]
+
+    deduplicator = Deduplicator(schema)
+    results = list(
+        deduplicator.validate_many(values, context=context, errors=sink, chunk_size=2)
+    )
+
+    assert results == [
+        (0, {"name": "Bob", "email": "bob@example.com"}),
+        (4, {"name": "Dave"}),
+        (5, {"name": "Dave"}),
+    ]
+    assert results[1][1] is not results[2][1]
+    assert len(statements) == 2
+    assert deduplicator.stats["duplicate_rows"] == 4
+
+    already_exists = [
+        gb.Error("value_errors", nested_errors={"email": [gb.Error("already_exists")]})
+    ]
+
+    assert sink.errors == {
+        1: [
+            gb.Error(
+                "value_errors",
+                nested_errors={"name": [gb.Error("string_too_long", {"value": 8})]},
+            )
+        ],
+        2: already_exists,
+        3: sink.errors[1],
+        6: already_exists,
+        7: already_exists,
+    }
+
+
+def test_counts_duplicates_towards_max_errors(schema, context):
+    sink = ListErrorSink()
+    values = [{"name": "too long name"}] * 3 + [{"name": "Dave"}]
+
+    with pytest.raises(BatchAbortedError):
+        list(
+            Deduplicator(schema).validate_many(
+                values, context=context, errors=sink, max_errors=1
+            )
+        )
+
+    assert list(sink.errors) == [0, 1]
+
+
+def test_checks_references_of_single_and_many_payloads(context):
+    schema = Mapped(Pet, column_names=["owner_id"], check_references=True)
+    sink = ListErrorSink()
+
+    with assert_dict_value_errors({"owner_id": [gb.Error("does_not_exist")]}):
+        schema({"owner_id": 42}, context=context)
+
+    assert (
+        list(schema.validate_many([{"owner_id": 42}], context=context, errors=sink))
+        == []
+    )
+    assert sink.errors == {
+        0: [
+            gb.Error(
+                "value_errors", nested_errors={"owner_id": [gb.Error("does_not_exist")]}
+            )
+        ]
+    }
+
+
+def test_skips_references_of_single_and_many_payloads_by_default(context):
+    schema = Mapped(Pet, column_names=["owner_id"])
+    sink = ListErrorSink()
+
+    assert schema({"owner_id": 42}, context=context) == {"owner_id": 42}
+    assert list(
+        schema.validate_many([{"owner_id": 42}], context=context, errors=sink)
+    ) == [(0, {"owner_id": 42})]
+
+
+def test_checks_references_without_autoflush(session, context, statements):
+    schema = Mapped(Pet, column_names=["owner_id"], check_references=True)
+    owner_id = session.scalars(sa.select(User.id)).one()
+    session.add(User(name="Doc"))
+    statements.clear()
+    sink = ListErrorSink()
+
+    results = list(
+        schema.validate_many([{"owner_id": owner_id}], context=context, errors=sink)
+    )
+
+    assert results == [(0, {"owner_id": owner_id})]
+    assert len(statements) == 1
+    assert statements[0].startswith("SELECT")
+
+
+def test_requires_session(schema):
+    with pytest.raises(MappedError):
+        list(schema.validate_many(VALUES, errors=ListErrorSink()))
@@ -0,0 +1,130 @@
+import goodboy as gb
+import pytest
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy.column import Column
+from goodboy_sqlalchemy.mapped import Mapped, MappedError
+from tests.conftest import assert_dict_key_errors, assert_dict_value_errors
+
+# Use in-memory SQLite
+engine = sa.create_engine("sqlite://")
+Session = sa.orm.sessionmaker(engine)
+Base = sa.orm.declarative_base()
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String, nullable=False)
+    email = sa.Column(sa.String, unique=True)
+    role = sa.Column(sa.String, nullable=False, default="user")
+
+
+Base.metadata.create_all(engine)
+
+
+@pytest.fixture()
+def session():
+    try:
+        session = Session()
+        session.add(User(name="Alice", email="alice@example.com"))
+        session.flush()
+        yield session
+    finally:
+        session.rollback()
+
+
+@pytest.fixture()
+def context(session):
+    return {"session": session}
+
+
+@pytest.fixture()
+def schema():
+    return Mapped(User, column_names=["name", "email", "role"])
+
+
+def test_partial(schema, context):
+    patch_schema = schema.partial()
+
+    assert patch_schema({}, context=context) == {}
+    assert patch_schema({"email": "bob@example.com"}, context=context) == {
+        "email": "bob@example.com"
+    }
+
+    with assert_dict_value_errors({"email": [gb.Error("already_exists")]}):
+        patch_schema({"email": "alice@example.com"}, context=context)
+
+    with assert_dict_key_errors({"name": [gb.Error("required_key")]}):
+        schema({}, context=context)
+
+
+def test_only(schema, context):
+    name_schema = schema.only("name")
+
+    assert name_schema({"name": "Bob"}, context=context) == {"name": "Bob"}
+
+    with assert_dict_key_errors({"email": [gb.Error("unknown_key")]}):
+        name_schema({"name": "Bob", "email": "bob@example.com"}, context=context)
+
+
+def test_exclude(schema, context):
+    update_schema = schema.exclude("role")
+
+    assert update_schema({"name": "Bob"}, context=context) == {"name": "Bob"}
+
+    with assert_dict_key_errors({"role": [gb.Error("unknown_key")]}):
+        update_schema({"name": "Bob", "role": "admin"}, context=context)
+
+
+def test_raises_for_unknown_key_names(schema):
+    with pytest.raises(MappedError):
+        schema.only("name", "password")
+
+    with pytest.raises(MappedError):
+        schema.exclude("password")
+
+
+def test_extend(schema, context):
+    extended_schema = schema.extend(
+        [
+            Column("role", gb.Str(allowed=["user", "admin"])),
+            gb.Key("password", gb.Str(), required=True),
+        ]
+    )
+
+    assert extended_schema(
+        {"name": "Bob", "role": "admin", "password": "secret"}, context=context
+    ) == {"name": "Bob", "role": "admin", "password": "secret"}
+
+    with assert_dict_value_errors(
+        {"role": [gb.Error("not_allowed", {"allowed": ["user", "admin"]})]}
+    ):
+        extended_schema({"name": "Bob", "role": "x", "password": "a"}, context=context)
+
+    assert [mk.name for mk in extended_schema._mapped_keys] == [
+        "name",
+        "email",
+        "role",
+        "password",
+    ]
+
+
+def test_shares_built_keys(schema):
+    derived_schemas = [
+        schema.partial(),
+        schema.exclude("role"),
+        schema.only("email", "name"),
+        schema.extend([gb.Key("password")]),
+    ]
+
+    for derived_schema in derived_schemas:
+        for mapped_key in derived_schema._mapped_keys:
+            if mapped_key.name != "password":
+                assert any(mapped_key is mk for mk in schema._mapped_keys)
+
+        assert derived_schema.stats is not schema.stats
+
+        with pytest.raises(AttributeError):
+            derived_schema._keys = ()
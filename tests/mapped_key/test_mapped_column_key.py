@@ -1,6 +1,7 @@
 import pytest
 import sqlalchemy as sa
 from goodboy import Error, Str
+from sqlalchemy.engine.default import CACHE_HIT
 
 from goodboy_sqlalchemy.column import Column
 from goodboy_sqlalchemy.mapped_key import MappedColumnKey
@@ -84,3 +85,82 @@ def test_accepts_non_unique_value_of_old_mapped_instance(session):
     mapped_column = MappedColumnKey(Dummy, Dummy.name, Dummy.id, "id", column)
 
     assert mapped_column.validate("old", False, {}, session, dummy) == "old"
+
+
+@pytest.fixture()
+def cache_hits():
+    result = []
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, *args):
+        result.append(context.cache_hit == CACHE_HIT)
+
+    warm_engine = sa.create_engine("sqlite://")
+    Base.metadata.create_all(warm_engine)
+    sa.event.listen(warm_engine, "after_cursor_execute", after_cursor_execute)
+
+    yield warm_engine, result
+
+    warm_engine.dispose()
+
+
+def test_reuses_compiled_statements(cache_hits):
+    warm_engine, hits = cache_hits
+    column = Column("name", Str(), required=True, unique=True)
+    mapped_column = MappedColumnKey(Dummy, Dummy.name, Dummy.id, "id", column)
+
+    with sa.orm.Session(warm_engine) as session:
+        for name in ["one", "two", "three"]:
+            mapped_column.validate(name, False, {}, session)
+
+    assert hits == [False, True, True]
+
+
+def test_warmup_compiles_statements(cache_hits):
+    warm_engine, hits = cache_hits
+    column = Column("name", Str(), required=True, unique=True)
+    mapped_column = MappedColumnKey(Dummy, Dummy.name, Dummy.id, "id", column)
+
+    with warm_engine.connect() as connection:
+        mapped_column.warmup(connection)
+
+    hits.clear()
+
+    with sa.orm.Session(warm_engine) as session:
+        dummy = Dummy(name="old")
+        session.add(dummy)
+        session.flush()
+        hits.clear()
+
+        mapped_column.validate("new", False, {}, session)
+        mapped_column.validate("old", False, {}, session, dummy)
+
+    assert hits == [True, True]
+
+
+def test_warmup_compiles_conflict_statements(cache_hits):
+    warm_engine, hits = cache_hits
+    column = Column("name", Str(), required=True, unique=True)
+    mapped_column = MappedColumnKey(
+        Dummy, Dummy.name, Dummy.id, "id", column, report_conflicts=True
+    )
+
+    with warm_engine.connect() as connection:
+        mapped_column.warmup(connection)
+
+    assert hits == []
+
+    with sa.orm.Session(warm_engine) as session:
+        mapped_column.validate("new", False, {}, session)
+
+    assert hits == [True]
+
+
+def test_builds_no_statements_for_columns_without_checks():
+    column = Column("name", Str(), required=True)
+    mapped_column = MappedColumnKey(
+        Dummy, Dummy.name, Dummy.id, "id", column, report_conflicts=True
+    )
+
+    assert mapped_column._db_checks._exists_statements == {}
+    assert mapped_column._conflict_statements == {}
+    assert mapped_column._pending_attribute_key is None
@@ -0,0 +1,159 @@
+import goodboy as gb
+import pytest
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy.batch import ListErrorSink
+from goodboy_sqlalchemy.mapped import Mapped
+from goodboy_sqlalchemy.pending import pending_index
+from tests.conftest import assert_dict_value_errors
+
+# Use in-memory SQLite
+engine = sa.create_engine("sqlite://")
+Session = sa.orm.sessionmaker(engine)
+Base = sa.orm.declarative_base()
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    email = sa.Column(sa.String, unique=True)
+
+
+Base.metadata.create_all(engine)
+
+
+@pytest.fixture(params=[True, False], ids=["autoflush", "no_autoflush"])
+def session(request):
+    try:
+        session = Session(autoflush=request.param)
+        yield session
+    finally:
+        session.rollback()
+
+
+@pytest.fixture()
+def context(session):
+    return {"session": session}
+
+
+@pytest.fixture()
+def schema():
+    return Mapped(User, column_names=["email"])
+
+
+def test_does_not_flush_session(schema, session, context):
+    user = User(email="marty@hv.com")
+    session.add(user)
+
+    assert schema({"email": "doc@hv.com"}, context=context) == {"email": "doc@hv.com"}
+    assert user in session.new
+
+
+def test_finds_values_of_pending_objects(schema, session, context):
+    # index is built from objects added before the first check
+    session.add(User(email="marty@hv.com"))
+    schema({"email": "doc@hv.com"}, context=context)
+
+    # and maintained when objects are added, changed or expunged
+    user = User(email="biff@hv.com")
+    session.add(user)
+
+    for email in ["marty@hv.com", "biff@hv.com"]:
+        with assert_dict_value_errors({"email": [gb.Error("already_exists")]}):
+            schema({"email": email}, context=context)
+
+    user.email = "george@hv.com"
+    assert schema({"email": "biff@hv.com"}, context=context)
+
+    session.expunge(user)
+    assert schema({"email": "george@hv.com"}, context=context)
+
+
+def test_finds_values_of_modified_objects(schema, session, context):
+    user = User(email="marty@hv.com")
+    session.add(user)
+    session.flush()
+    schema({"email": "doc@hv.com"}, context=context)
+
+    user.email = "doc@hv.com"
+
+    with assert_dict_value_errors({"email": [gb.Error("already_exists")]}):
+        schema({"email": "doc@hv.com"}, context=context)
+
+    instance_context = {"session": session, "mapped_instance": user}
+    assert schema({"email": "doc@hv.com"}, context=instance_context)
+
+
+def test_batch_finds_values_of_pending_objects(schema, session, context):
+    session.add(User(email="marty@hv.com"))
+    sink = ListErrorSink()
+
+    values = [{"email": "marty@hv.com"}, {"email": "doc@hv.com"}]
+    results = list(schema.validate_many(values, context=context, errors=sink))
+
+    assert results == [(1, {"email": "doc@hv.com"})]
+    assert list(sink.errors) == [0]
+
+
+def test_ignores_stored_values_of_modified_objects(schema, session, context):
+    user = User(email="marty@hv.com")
+    session.add(user)
+    session.flush()
+
+    user.email = "doc@hv.com"
+    assert schema({"email": "marty@hv.com"}, context=context)
+
+    # the index is maintained after it is built too
+    user.email = "biff@hv.com"
+    assert schema({"email": "doc@hv.com"}, context=context)
+    assert schema({"email": "marty@hv.com"}, context=context)
+
+    user.email = "marty@hv.com"
+
+    with assert_dict_value_errors({"email": [gb.Error("already_exists")]}):
+        schema({"email": "marty@hv.com"}, context=context)
+
+
+def test_ignores_stored_values_of_deleted_objects(schema, session, context):
+    user = User(email="marty@hv.com")
+    session.add(user)
+    session.flush()
+
+    session.delete(user)
+    assert schema({"email": "marty@hv.com"}, context=context)
+
+    sink = ListErrorSink()
+    values = [{"email": "marty@hv.com"}]
+
+    assert list(schema.validate_many(values, context=context, errors=sink)) == [
+        (0, {"email": "marty@hv.com"})
+    ]
+
+
+def test_tracks_attribute_once():
+    Mapped(User, column_names=["email"])
+    listeners = len(User.email.dispatch.set)
+    Mapped(User, column_names=["email"])
+
+    assert len(User.email.dispatch.set) == listeners
+
+
+def test_updates_index_on_flush(schema, session, context):
+    user = User(email="marty@hv.com")
+    session.add(user)
+    schema({"email": "doc@hv.com"}, context=context)
+    index = pending_index(session)
+    attribute_key = (User, "email")
+
+    session.flush()
+
+    assert pending_index(session) is index
+    assert not index.contains(attribute_key, "marty@hv.com")
+
+    user.email = "biff@hv.com"
+    assert index.contains(attribute_key, "biff@hv.com")
+
+    session.flush()
+    assert not index.contains(attribute_key, "biff@hv.com")
+    assert index.stale_values(attribute_key, ["marty@hv.com"], session) == set()
@@ -0,0 +1,210 @@
+import threading
+import time
+
+import goodboy as gb
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.horizontal_shard import ShardedSession
+
+from goodboy_sqlalchemy.mapped import Mapped
+from goodboy_sqlalchemy.relationship import Relationship
+from goodboy_sqlalchemy.sharding import ShardedChecks
+from tests.conftest import assert_dict_value_errors
+
+SHARD_IDS = ["eu", "us", "asia"]
+
+Base = sa.orm.declarative_base()
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    email = sa.Column(sa.String, unique=True)
+    region = sa.Column(sa.String)
+    photos = sa.orm.relationship("Photo")
+
+
+class Photo(Base):
+    __tablename__ = "photos"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    user_id = sa.Column(sa.ForeignKey("users.id"))
+    url = sa.Column(sa.String, unique=True)
+    region = sa.Column(sa.String)
+
+
+@pytest.fixture(scope="module")
+def engines(tmp_path_factory):
+    path = tmp_path_factory.mktemp("shards")
+    result = {}
+
+    for shard_id in SHARD_IDS:
+        engine = sa.create_engine(
+            f"sqlite:///{path / shard_id}.db",
+            connect_args={"check_same_thread": False},
+        )
+        Base.metadata.create_all(engine)
+        result[shard_id] = engine
+
+    yield result
+
+    for engine in result.values():
+        engine.dispose()
+
+
+@pytest.fixture()
+def session(engines):
+    session = ShardedSession(
+        shard_chooser=lambda mapper, instance, **kw: instance.region,
+        identity_chooser=lambda *args, **kw: SHARD_IDS,
+        execute_chooser=lambda orm_context: SHARD_IDS,
+        shards=engines,
+    )
+
+    try:
+        session.add_all(
+            [
+                User(id=1, email="eu@example.com", region="eu"),
+                User(id=2, email="asia@example.com", region="asia"),
+            ]
+        )
+        session.flush()
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
+@pytest.fixture()
+def context(session):
+    return {"session": session}
+
+
+@pytest.fixture()
+def sharded_checks():
+    result = ShardedChecks(SHARD_IDS)
+    yield result
+    result.shutdown()
+
+
+@pytest.fixture()
+def statements(engines):
+    result = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        result.append((conn.engine.url.database, threading.get_ident()))
+
+    for engine in engines.values():
+        sa.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+
+    yield result
+
+    for engine in engines.values():
+        sa.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_checks_uniqueness_in_all_shards(context, sharded_checks, statements):
+    schema = Mapped(User, column_names=["email"], sharded_checks=sharded_checks)
+
+    assert schema({"email": "us@example.com"}, context=context) == {
+        "email": "us@example.com"
+    }
+
+    assert len({database for database, _ in statements}) == len(SHARD_IDS)
+    assert threading.get_ident() not in {thread for _, thread in statements}
+
+    for email in ["eu@example.com", "asia@example.com"]:
+        with assert_dict_value_errors({"email": [gb.Error("already_exists")]}):
+            schema({"email": email}, context=context)
+
+
+def test_queries_shards_chosen_by_shard_chooser(context, statements):
+    sharded_checks = ShardedChecks(
+        SHARD_IDS, shard_chooser=lambda sa_column, value: [value.split("@")[0]]
+    )
+    schema = Mapped(User, column_names=["email"], sharded_checks=sharded_checks)
+
+    with assert_dict_value_errors({"email": [gb.Error("already_exists")]}):
+        schema({"email": "asia@example.com"}, context=context)
+
+    assert [database.rsplit("/")[-1] for database, _ in statements] == ["asia.db"]
+
+
+def test_stops_at_first_hit(session):
+    sharded_checks = ShardedChecks(SHARD_IDS, max_workers=1)
+    started = []
+
+    def query(connection):
+        started.append(connection)
+        time.sleep(0.05)
+        return True
+
+    assert sharded_checks.run(session, SHARD_IDS, query, stop=bool) == [True]
+    # the last query is cancelled before the single worker gets to it
+    assert len(started) < len(SHARD_IDS)
+
+    sharded_checks.shutdown()
+
+
+def test_returns_at_first_hit_outside_of_transaction(engines, sharded_checks):
+    session = ShardedSession(
+        shard_chooser=lambda mapper, instance, **kw: instance.region,
+        identity_chooser=lambda *args, **kw: SHARD_IDS,
+        execute_chooser=lambda orm_context: SHARD_IDS,
+        shards=engines,
+    )
+    released = threading.Event()
+
+    def query(connection):
+        if connection.engine is engines["us"]:
+            return True
+
+        # slower shards finish in background, on connections of their own
+        released.wait(5)
+        return False
+
+    started = time.monotonic()
+
+    try:
+        assert sharded_checks.run(session, SHARD_IDS, query, stop=bool) == [True]
+        assert time.monotonic() - started < 1
+        assert not session.in_transaction()
+    finally:
+        released.set()
+        session.close()
+
+
+def test_batches_child_checks_in_all_shards(context, sharded_checks, session):
+    session.add(Photo(id=1, user_id=2, url="a", region="asia"))
+    session.flush()
+
+    photo_mapped = Mapped(Photo, column_names=["url"], sharded_checks=sharded_checks)
+    schema = Mapped(
+        User,
+        keys=[Relationship("photos", photo_mapped)],
+        column_names=["email"],
+        sharded_checks=sharded_checks,
+    )
+
+    with assert_dict_value_errors(
+        {
+            "photos": [
+                gb.Error(
+                    "value_errors",
+                    nested_errors={
+                        0: [
+                            gb.Error(
+                                "value_errors",
+                                nested_errors={"url": [gb.Error("already_exists")]},
+                            )
+                        ]
+                    },
+                )
+            ]
+        }
+    ):
+        schema(
+            {"email": "us@example.com", "photos": [{"url": "a"}, {"url": "b"}]},
+            context=context,
+        )
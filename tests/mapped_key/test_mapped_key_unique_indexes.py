@@ -0,0 +1,157 @@
+from datetime import datetime
+
+import goodboy as gb
+import pytest
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy.batch import ListErrorSink
+from goodboy_sqlalchemy.column import column_builder
+from goodboy_sqlalchemy.mapped import Mapped
+from tests.conftest import assert_dict_value_errors
+
+# Use in-memory SQLite
+engine = sa.create_engine("sqlite://")
+Session = sa.orm.sessionmaker(engine)
+Base = sa.orm.declarative_base()
+
+
+class Account(Base):
+    __tablename__ = "accounts"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    email = sa.Column(sa.String, nullable=False)
+    login = sa.Column(sa.String, nullable=False)
+    code = sa.Column(sa.String)
+    deleted_at = sa.Column(sa.DateTime)
+
+    __table_args__ = (
+        sa.Index("ix_accounts_email", sa.func.lower(email), unique=True),
+        sa.Index(
+            "ix_accounts_login",
+            login,
+            unique=True,
+            sqlite_where=deleted_at.is_(None),
+        ),
+        sa.UniqueConstraint("code"),
+    )
+
+
+Base.metadata.create_all(engine)
+
+
+@pytest.fixture()
+def session():
+    try:
+        session = Session()
+        yield session
+    finally:
+        session.rollback()
+
+
+@pytest.fixture()
+def context(session):
+    return {"session": session}
+
+
+@pytest.fixture()
+def account_mapped():
+    return Mapped(Account, column_names=["email", "login", "code"])
+
+
+def test_builds_unique_columns_from_indexes_and_constraints():
+    columns = column_builder.build(Account, ["email", "login", "code", "deleted_at"])
+
+    assert [c.unique for c in columns] == [True, True, True, False]
+
+
+def test_functional_unique_index(account_mapped, session, context):
+    session.add(Account(email="Marty@HV.com", login="marty"))
+    session.flush()
+
+    with assert_dict_value_errors({"email": [gb.Error("already_exists")]}):
+        account_mapped({"email": "marty@hv.com", "login": "doc"}, context=context)
+
+    assert account_mapped({"email": "doc@hv.com", "login": "doc"}, context=context)
+
+
+def test_validates_many_values_against_each_other_with_functional_unique_index(
+    account_mapped, context
+):
+    values = [
+        {"email": "Marty@HV.com", "login": "marty"},
+        {"email": "marty@hv.com", "login": "doc"},
+    ]
+    sink = ListErrorSink()
+
+    assert list(account_mapped.validate_many(values, context=context, errors=sink)) == [
+        (0, values[0])
+    ]
+    assert sink.errors == {
+        1: [
+            gb.Error(
+                "value_errors", nested_errors={"email": [gb.Error("already_exists")]}
+            )
+        ]
+    }
+
+
+def test_partial_unique_index(account_mapped, session, context):
+    session.add(Account(email="old@hv.com", login="marty", deleted_at=datetime.now()))
+    session.flush()
+
+    value = {"email": "marty@hv.com", "login": "marty"}
+    assert account_mapped(value, context=context) == value
+
+    session.add(Account(email="marty@hv.com", login="marty"))
+    session.flush()
+
+    with assert_dict_value_errors({"login": [gb.Error("already_exists")]}):
+        account_mapped({"email": "doc@hv.com", "login": "marty"}, context=context)
+
+
+def test_unique_constraint(account_mapped, session, context):
+    session.add(Account(email="marty@hv.com", login="marty", code="M"))
+    session.flush()
+
+    with assert_dict_value_errors({"code": [gb.Error("already_exists")]}):
+        account_mapped(
+            {"email": "doc@hv.com", "login": "doc", "code": "M"}, context=context
+        )
+
+
+def test_excludes_instance_with_functional_unique_index(account_mapped, session):
+    account = Account(email="Marty@HV.com", login="marty")
+    session.add(account)
+    session.flush()
+
+    context = {"session": session, "mapped_instance": account}
+    value = {"email": "marty@hv.com"}
+
+    assert account_mapped(value, context=context) == value
+
+
+@pytest.mark.parametrize(
+    "key_name,index_name",
+    [("email", "ix_accounts_email"), ("login", "ix_accounts_login")],
+)
+def test_existence_queries_use_indexes(account_mapped, session, key_name, index_name):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, *args):
+        statements.append((statement, parameters))
+
+    sa.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+
+    try:
+        account_mapped({key_name: "marty"}, context={"session": session})
+    except gb.SchemaError:
+        pass
+    finally:
+        sa.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    ((statement, parameters),) = statements
+    plan = session.connection().exec_driver_sql(
+        "EXPLAIN QUERY PLAN " + statement, parameters
+    )
+
+    assert any(f"USING INDEX {index_name}" in row[-1] for row in plan)
@@ -0,0 +1,256 @@
+import goodboy as gb
+import pytest
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy.column import Column
+from goodboy_sqlalchemy.mapped import Mapped, MappedError
+from goodboy_sqlalchemy.mapped_key import MappedKeyBuilderError
+from goodboy_sqlalchemy.relationship import Relationship
+from tests.conftest import assert_dict_value_errors
+
+# Use in-memory SQLite
+engine = sa.create_engine("sqlite://")
+Session = sa.orm.sessionmaker(engine)
+Base = sa.orm.declarative_base()
+
+
+class Product(Base):
+    __tablename__ = "products"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+
+
+class Order(Base):
+    __tablename__ = "orders"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    number = sa.Column(sa.String, nullable=False, unique=True)
+    items = sa.orm.relationship("OrderItem")
+    product = sa.orm.relationship(Product, uselist=False)
+    product_id = sa.Column(sa.ForeignKey("products.id"))
+
+
+class OrderItem(Base):
+    __tablename__ = "order_items"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    order_id = sa.Column(sa.ForeignKey("orders.id"))
+    product_id = sa.Column(sa.ForeignKey("products.id"), nullable=False)
+    serial = sa.Column(sa.String, unique=True)
+
+
+Base.metadata.create_all(engine)
+
+
+@pytest.fixture()
+def session():
+    try:
+        session = Session()
+        session.add_all([Product(id=1), Product(id=2)])
+        session.add(Order(number="1", items=[OrderItem(product_id=1, serial="S1")]))
+        session.flush()
+        yield session
+    finally:
+        session.rollback()
+
+
+@pytest.fixture()
+def context(session):
+    return {"session": session}
+
+
+@pytest.fixture()
+def order_mapped():
+    item_mapped = Mapped(
+        OrderItem, column_names=["product_id", "serial"], check_references=True
+    )
+
+    return Mapped(
+        Order,
+        keys=[Relationship("items", item_mapped, required=True)],
+        column_names=["number"],
+    )
+
+
+@pytest.fixture()
+def statements():
+    result = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        result.append(statement)
+
+    sa.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield result
+    sa.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_accepts_nested_payloads(order_mapped, context):
+    value = {
+        "number": "2",
+        "items": [
+            {"product_id": 1, "serial": "S2"},
+            {"product_id": 2, "serial": "S3"},
+            {"product_id": 2},
+        ],
+    }
+
+    assert order_mapped(value, context=context) == {
+        "number": "2",
+        "items": [
+            {"product_id": 1, "serial": "S2"},
+            {"product_id": 2, "serial": "S3"},
+            {"product_id": 2},
+        ],
+    }
+
+
+def test_rejects_nested_payloads_by_index(order_mapped, context):
+    value = {
+        "number": "2",
+        "items": [
+            {"product_id": 1, "serial": "S1"},
+            {"product_id": 3, "serial": "S2"},
+            {"product_id": 2, "serial": "S2"},
+            {"serial": "S4"},
+            42,
+        ],
+    }
+
+    with assert_dict_value_errors(
+        {
+            "items": [
+                gb.Error(
+                    "value_errors",
+                    nested_errors={
+                        0: [
+                            gb.Error(
+                                "value_errors",
+                                nested_errors={"serial": [gb.Error("already_exists")]},
+                            )
+                        ],
+                        1: [
+                            gb.Error(
+                                "value_errors",
+                                nested_errors={
+                                    "product_id": [gb.Error("does_not_exist")]
+                                },
+                            )
+                        ],
+                        2: [
+                            gb.Error(
+                                "value_errors",
+                                nested_errors={"serial": [gb.Error("already_exists")]},
+                            )
+                        ],
+                        3: [
+                            gb.Error(
+                                "key_errors",
+                                nested_errors={
+                                    "product_id": [gb.Error("required_key")]
+                                },
+                            )
+                        ],
+                        4: [
+                            gb.Error(
+                                "unexpected_type",
+                                {"expected_type": gb.type_name("dict")},
+                            )
+                        ],
+                    },
+                )
+            ]
+        }
+    ):
+        order_mapped(value, context=context)
+
+
+def test_batches_child_queries(order_mapped, context, statements):
+    value = {
+        "number": "2",
+        "items": [{"product_id": i % 2 + 1, "serial": f"S{i + 10}"} for i in range(50)],
+    }
+
+    order_mapped(value, context=context)
+
+    # order number uniqueness, then serials and product ids for all items
+    assert len(statements) == 3
+
+
+def test_rejects_non_list_value(order_mapped, context):
+    with assert_dict_value_errors(
+        {
+            "items": [
+                gb.Error("unexpected_type", {"expected_type": gb.type_name("list")})
+            ]
+        }
+    ):
+        order_mapped({"number": "2", "items": {}}, context=context)
+
+
+def test_rejects_invalid_relationships():
+    item_mapped = Mapped(
+        OrderItem, column_names=["product_id", "serial"], check_references=True
+    )
+    order_mapped = Mapped(
+        Order, keys=[Relationship("items", item_mapped), Column("number", gb.Str())]
+    )
+
+    with pytest.raises(MappedKeyBuilderError):
+        Mapped(Order, keys=[Relationship("orders", order_mapped)])
+
+    with pytest.raises(MappedKeyBuilderError):
+        Mapped(Order, keys=[Relationship("product", order_mapped)])
+
+    with pytest.raises(MappedKeyBuilderError):
+        Mapped(Order, keys=[Relationship("items", order_mapped)])
+
+
+def test_insert_is_not_supported(order_mapped, context):
+    with pytest.raises(MappedError):
+        order_mapped.insert(
+            {"number": "2", "items": [{"product_id": 1}]}, context=context
+        )
+
+
+def test_defers_child_checks(context, statements):
+    item_mapped = Mapped(
+        OrderItem, column_names=["product_id", "serial"], check_references=True
+    )
+    order_mapped = Mapped(
+        Order,
+        keys=[Relationship("items", item_mapped, required=True)],
+        column_names=["number"],
+        defer_db_checks=True,
+    )
+
+    with assert_dict_value_errors(
+        {
+            "number": [
+                gb.Error("unexpected_type", {"expected_type": gb.type_name("str")})
+            ]
+        }
+    ):
+        order_mapped({"number": 2, "items": [{"product_id": 3}]}, context=context)
+
+    assert statements == []
+
+    with assert_dict_value_errors(
+        {
+            "items": [
+                gb.Error(
+                    "value_errors",
+                    nested_errors={
+                        0: [
+                            gb.Error(
+                                "value_errors",
+                                nested_errors={
+                                    "product_id": [gb.Error("does_not_exist")]
+                                },
+                            )
+                        ]
+                    },
+                )
+            ]
+        }
+    ):
+        order_mapped({"number": "2", "items": [{"product_id": 3}]}, context=context)
@@ -0,0 +1,134 @@
+import hashlib
+import io
+
+import goodboy as gb
+import pytest
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy.binary import Binary
+from goodboy_sqlalchemy.column_schemas import column_schema_builder
+from goodboy_sqlalchemy.mapped import Mapped
+from tests.conftest import assert_errors
+
+DATA = bytes(range(256)) * 1000
+
+
+class Stream:
+    """
+    File-like object without seek and readinto support.
+    """
+
+    def __init__(self, data):
+        self._file = io.BytesIO(data)
+        self.reads = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+        return self._file.read(size)
+
+
+@pytest.mark.parametrize("value", [DATA, bytearray(DATA), memoryview(DATA)])
+def test_returns_buffers_without_copying(value):
+    assert Binary()(value) is value
+
+
+def test_returns_view_of_bytes_io_buffer():
+    file = io.BytesIO(DATA)
+    file.seek(10)
+
+    result = Binary()(file)
+
+    assert isinstance(result, memoryview)
+    assert result == DATA[10:]
+
+
+@pytest.mark.parametrize(
+    "make_file", [lambda: io.BufferedReader(io.BytesIO(DATA)), lambda: Stream(DATA)]
+)
+def test_reads_files(make_file):
+    result = Binary(max_length=len(DATA))(make_file())
+
+    assert isinstance(result, memoryview)
+    assert result == DATA
+
+
+def test_rejects_too_long_data():
+    schema = Binary(max_length=len(DATA) - 1)
+    error = gb.Error("binary_too_long", {"value": len(DATA) - 1})
+
+    for value in [DATA, memoryview(DATA), io.BytesIO(DATA)]:
+        with assert_errors([error]):
+            schema(value)
+
+    file = io.BufferedReader(io.BytesIO(DATA))
+
+    with assert_errors([error]):
+        schema(file)
+
+    # size of seekable file is checked without reading it
+    assert file.tell() == 0
+
+    stream = Stream(DATA)
+    schema = Binary(max_length=10)
+
+    with assert_errors([gb.Error("binary_too_long", {"value": 10})]):
+        schema(stream)
+
+    assert stream.reads == 1
+
+
+def test_rejects_other_types():
+    for value in ["text", io.StringIO("text"), 42]:
+        with assert_errors([gb.Error("unexpected_type", {"expected_type": "bytes"})]):
+            Binary()(value)
+
+
+def test_computes_digest():
+    digests = []
+    schema = Binary(
+        digest="sha256",
+        on_digest=lambda value, digest, context: digests.append((digest, context)),
+    )
+
+    for value in [
+        DATA,
+        io.BytesIO(DATA),
+        io.BufferedReader(io.BytesIO(DATA)),
+        Stream(DATA),
+    ]:
+        schema(value, context={"x": 1})
+
+    assert digests == [(hashlib.sha256(DATA).hexdigest(), {"x": 1})] * 4
+
+
+def test_on_digest_requires_digest_algorithm():
+    with pytest.raises(ValueError):
+        Binary(on_digest=lambda value, digest, context: None)
+
+
+def test_large_binary_columns_are_mapped():
+    column = sa.Column("dummy", sa.LargeBinary(length=100), nullable=True)
+
+    assert column_schema_builder.build(column) == Binary(
+        allow_none=True, max_length=100
+    )
+
+
+def test_validated_files_can_be_inserted():
+    Base = sa.orm.declarative_base()
+
+    class Attachment(Base):
+        __tablename__ = "attachments"
+
+        id = sa.Column(sa.Integer, primary_key=True)
+        content = sa.Column(sa.LargeBinary, nullable=False)
+
+    engine = sa.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    schema = Mapped(Attachment, column_names=["content"])
+
+    with sa.orm.Session(engine) as session:
+        result = schema({"content": io.BytesIO(DATA)}, context={"session": session})
+        session.execute(sa.insert(Attachment).values(result))
+
+        assert session.scalar(sa.select(Attachment.content)) == DATA
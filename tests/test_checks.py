@@ -0,0 +1,155 @@
+from decimal import Decimal
+
+import goodboy as gb
+import pytest
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy.checks import CheckRule, check_constraint_rules
+from goodboy_sqlalchemy.column import Column
+from goodboy_sqlalchemy.column_schemas import column_schema_builder
+from goodboy_sqlalchemy.mapped import Mapped
+from tests.conftest import assert_dict_value_errors, assert_errors
+
+metadata = sa.MetaData()
+
+products = sa.Table(
+    "products",
+    metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("price", sa.Numeric(10, 2), sa.CheckConstraint("price > 0")),
+    sa.Column("discount", sa.Integer),
+    sa.Column("status", sa.String),
+    sa.Column("rating", sa.Integer),
+    sa.Column("code", sa.String),
+    sa.CheckConstraint("discount BETWEEN 0 AND 100 AND discount <> 50"),
+    sa.CheckConstraint("(status IN ('draft', 'active')) AND (price < 1000.5)"),
+    sa.CheckConstraint("rating >= 1 OR rating IS NULL"),
+    sa.CheckConstraint("code <> '' AND length(code) < 10"),
+    sa.CheckConstraint("0 <= rating"),
+)
+
+
+def comparisons(column_name):
+    return [
+        rule.comparisons for rule in check_constraint_rules(products.c[column_name])
+    ]
+
+
+def test_parses_text_constraints():
+    assert comparisons("price") == [[("lt", Decimal("1000.5"))], [("gt", 0)]]
+    assert comparisons("discount") == [[("ge", 0), ("le", 100), ("ne", 50)]]
+    assert comparisons("status") == [[("in", ("draft", "active"))]]
+    assert comparisons("code") == [[("ne", "")]]
+    assert comparisons("rating") == [[("ge", 0)]]
+
+
+def test_parses_expression_constraints():
+    table = sa.Table(
+        "items",
+        sa.MetaData(),
+        sa.Column("quantity", sa.Integer),
+        sa.Column("kind", sa.String),
+    )
+    table.append_constraint(
+        sa.CheckConstraint(
+            sa.and_(table.c.quantity.between(1, 10), 3 != table.c.quantity)
+        )
+    )
+    table.append_constraint(sa.CheckConstraint(table.c.kind.in_(["a", "b"])))
+    table.append_constraint(
+        sa.CheckConstraint(sa.or_(table.c.quantity > 5, table.c.kind == "a"))
+    )
+
+    assert [r.comparisons for r in check_constraint_rules(table.c.quantity)] == [
+        [("ge", 1), ("le", 10), ("ne", 3)]
+    ]
+    assert [r.comparisons for r in check_constraint_rules(table.c.kind)] == [
+        [("in", ("a", "b"))]
+    ]
+
+
+def test_skips_comparisons_of_other_types():
+    table = sa.Table(
+        "events",
+        sa.MetaData(),
+        sa.Column("name", sa.String),
+        sa.Column("count", sa.Integer),
+        sa.Column("enabled", sa.Boolean),
+        sa.CheckConstraint("name > 5 AND count > 'a' AND enabled = 1"),
+    )
+
+    assert check_constraint_rules(table.c.name) == []
+    assert check_constraint_rules(table.c.count) == []
+    assert check_constraint_rules(table.c.enabled) == []
+
+
+def test_schemas_enforce_constraints():
+    discount_schema = column_schema_builder.build(products.c.discount)
+
+    assert discount_schema(0) == 0
+    assert discount_schema(None) is None
+
+    with assert_errors([gb.Error("greater_than", {"value": 100})]):
+        discount_schema(101)
+
+    with assert_errors([gb.Error("not_allowed")]):
+        discount_schema(50)
+
+    status_schema = column_schema_builder.build(products.c.status)
+
+    with assert_errors([gb.Error("not_allowed", {"allowed": ["draft", "active"]})]):
+        status_schema("archived")
+
+    price_schema = column_schema_builder.build(products.c.price)
+
+    with assert_errors([gb.Error("less_or_equal_to", {"value": 0})]):
+        price_schema(0)
+
+
+def test_check_rules_do_not_disable_validation_cache():
+    schema = column_schema_builder.build(products.c.discount)
+    column = Column("discount", schema, cache_size=10)
+
+    column.validate(1, False, {})
+    column.validate(1, False, {})
+
+    assert column.cache_stats.as_dict() == {"hits": 1, "misses": 1}
+
+
+def test_mapped_rejects_rows_before_flush():
+    Base = sa.orm.declarative_base()
+
+    class Product(Base):
+        __table__ = products
+
+    engine = sa.create_engine("sqlite://")
+    metadata.create_all(engine)
+    schema = Mapped(Product, column_names=["discount", "rating"])
+
+    with sa.orm.Session(engine) as session:
+        with assert_dict_value_errors(
+            {
+                "discount": [gb.Error("less_than", {"value": 0})],
+                "rating": [gb.Error("less_than", {"value": 0})],
+            }
+        ):
+            schema({"discount": -1, "rating": -1}, context={"session": session})
+
+
+@pytest.mark.parametrize(
+    "comparisons, value, valid",
+    [
+        ([("eq", 1)], 1, True),
+        ([("eq", 1)], 2, False),
+        ([("lt", 1), ("ge", -1)], 0, True),
+        ([("lt", 1), ("ge", -1)], 1, False),
+    ],
+)
+def test_check_rule(comparisons, value, valid):
+    schema = gb.Int(rules=[CheckRule(comparisons)])
+
+    if valid:
+        assert schema(value) == value
+    else:
+        with pytest.raises(gb.SchemaError):
+            schema(value)
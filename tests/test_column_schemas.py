@@ -1,3 +1,4 @@
+from decimal import Decimal
 from unittest.mock import Mock
 
 import goodboy as gb
@@ -7,9 +8,13 @@ import sqlalchemy as sa
 from goodboy_sqlalchemy.column_schemas import (
     ColumnSchemaBuilder,
     ColumnSchemaBuilderError,
+    IntegerColumnSchemaFactory,
+    NumericColumnSchemaFactory,
     SimpleColumnSchemaFactory,
     StringColumnSchemaFactory,
+    column_schema_builder,
 )
+from tests.conftest import assert_errors
 
 
 @pytest.mark.parametrize("nullable", [True, False])
@@ -55,3 +60,96 @@ def test_schema_builder_when_type_unmapped():
 
     with pytest.raises(ColumnSchemaBuilderError):
         assert builder.build(column)
+
+
+def test_schema_builder_resolves_dotted_type_names():
+    import sqlalchemy.dialects.postgresql as sa_pg
+
+    column = sa.Column("dummy", sa_pg.JSONB, nullable=False)
+    schema_factory = Mock()
+
+    builder = ColumnSchemaBuilder(
+        {"sqlalchemy.dialects.postgresql.JSON": schema_factory}
+    )
+    builder.build(column)
+
+    schema_factory.build.assert_called_once_with(column)
+
+
+def test_schema_builder_skips_dotted_type_names_of_unloaded_modules():
+    column = sa.Column("dummy", sa.Integer, nullable=False)
+    builder = ColumnSchemaBuilder({"not_imported_module.Integer": Mock()})
+
+    with pytest.raises(ColumnSchemaBuilderError):
+        builder.build(column)
+
+
+def test_integer_column_schema_factory():
+    column = sa.Column("dummy", sa.Integer, nullable=True)
+
+    assert IntegerColumnSchemaFactory(16).build(column) == gb.Int(
+        allow_none=True, greater_or_equal_to=-32768, less_or_equal_to=32767
+    )
+
+
+def test_integer_width_from_column_info():
+    column = sa.Column("dummy", sa.Integer, info={"integer_bits": 64})
+    schema = column_schema_builder.build(column)
+
+    assert schema(2**63 - 1) == 2**63 - 1
+
+    with assert_errors([gb.Error("greater_than", {"value": 2**63 - 1})]):
+        schema(2**63)
+
+
+@pytest.mark.parametrize(
+    "sa_type, max_value",
+    [(sa.SmallInteger, 2**15 - 1), (sa.Integer, 2**31 - 1), (sa.BigInteger, 2**63 - 1)],
+)
+def test_integer_schemas_limited_by_type_width(sa_type, max_value):
+    schema = column_schema_builder.build(sa.Column("dummy", sa_type))
+
+    assert schema(max_value) == max_value
+    assert schema(-max_value - 1) == -max_value - 1
+
+    with assert_errors([gb.Error("greater_than", {"value": max_value})]):
+        schema(max_value + 1)
+
+    with assert_errors([gb.Error("less_than", {"value": -max_value - 1})]):
+        schema(-max_value - 2)
+
+
+def test_numeric_column_schema_factory():
+    column = sa.Column("dummy", sa.Numeric(4, 2), nullable=False)
+    schema = NumericColumnSchemaFactory().build(column)
+
+    assert schema(Decimal("99.99")) == Decimal("99.99")
+    assert schema("-99.994", typecast=True) == Decimal("-99.994")
+
+    with assert_errors([gb.Error("greater_or_equal_to", {"value": Decimal("99.995")})]):
+        schema(Decimal("99.995"))
+
+    with assert_errors([gb.Error("less_or_equal_to", {"value": Decimal("-99.995")})]):
+        schema(-100)
+
+
+def test_numeric_column_schema_factory_without_precision():
+    column = sa.Column("dummy", sa.Numeric, nullable=True)
+
+    assert NumericColumnSchemaFactory().build(column) == gb.DecimalSchema(
+        allow_none=True
+    )
+
+
+def test_numeric_column_schema_factory_for_floats():
+    column = sa.Column("dummy", sa.Numeric(3, 0, asdecimal=False), nullable=True)
+
+    assert NumericColumnSchemaFactory().build(column) == gb.Float(
+        allow_none=True, less_than=999.5, greater_than=-999.5
+    )
+
+
+def test_float_columns_are_not_numeric_columns():
+    column = sa.Column("dummy", sa.Float(precision=2), nullable=True)
+
+    assert column_schema_builder.build(column) == gb.Float(allow_none=True)
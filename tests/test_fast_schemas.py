@@ -0,0 +1,117 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+import goodboy as gb
+import pytest
+
+from goodboy_sqlalchemy.fast_schemas import (
+    FastDate,
+    FastDateTime,
+    FastDecimal,
+    FastFloat,
+    FastInt,
+)
+
+
+def result(schema, value, **kwargs):
+    try:
+        return "value", schema(value, **kwargs)
+    except gb.SchemaError as e:
+        return "errors", e.errors
+
+
+CASES = [
+    (
+        FastInt,
+        gb.Int,
+        {"greater_or_equal_to": -128, "less_or_equal_to": 127, "allow_none": True},
+        [0, 127, 128, -129, True, None, "12", "x", 1.5],
+    ),
+    (
+        FastFloat,
+        gb.Float,
+        {"greater_than": -1.0, "less_than": 1.0},
+        [0.5, 1.0, -1.0, 0, "0.5", None],
+    ),
+    (
+        FastDecimal,
+        gb.DecimalSchema,
+        {"greater_than": Decimal("-9.995"), "less_than": Decimal("9.995")},
+        [Decimal("1.5"), Decimal("9.995"), 1, 1.5, "1.5", "x"],
+    ),
+    (
+        FastDate,
+        gb.Date,
+        {"later_or_equal_to": date(2000, 1, 1)},
+        [date(2020, 1, 1), date(1999, 1, 1), "2020-01-01", "1999-01-01", "x"],
+    ),
+    (
+        FastDateTime,
+        gb.DateTime,
+        {"earlier_than": datetime(2030, 1, 1), "allowed": [datetime(2020, 1, 1)]},
+        [datetime(2020, 1, 1), datetime(2021, 1, 1), "2020-01-01T00:00:00"],
+    ),
+    (
+        FastDateTime,
+        gb.DateTime,
+        {"earlier_than": datetime(2030, 1, 1)},
+        [datetime(2020, 1, 1), datetime(2031, 1, 1), "2020-01-01 10:00", "1/1/2020"],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "fast_schema,schema,value",
+    [
+        (fast_class(**options), schema_class(**options), value)
+        for fast_class, schema_class, options, values in CASES
+        for value in values
+    ],
+)
+@pytest.mark.parametrize("typecast", [False, True])
+def test_same_result_as_goodboy_schema(fast_schema, schema, value, typecast):
+    assert result(fast_schema, value, typecast=typecast) == result(
+        schema, value, typecast=typecast
+    )
+
+
+def test_date_format_disables_iso_parsing():
+    schema = FastDate(format="%d.%m.%Y")
+
+    assert schema("01.02.2020", typecast=True) == date(2020, 2, 1)
+    assert schema("01.02.2020", typecast=True, context={"date_format": None}) == date(
+        2020, 2, 1
+    )
+    assert FastDate()("01.02.2020", typecast=True, context={"date_format": "%d.%m.%Y"})
+
+
+def test_calls_rules():
+    calls = []
+
+    def rule(schema, value, typecast, context):
+        calls.append(value)
+        return value * 2, []
+
+    assert FastInt(rules=[rule])(21) == 42
+    assert calls == [21]
+
+
+def test_does_not_share_default_context_between_calls():
+    contexts = []
+
+    def rule(schema, value, typecast, context):
+        context["calls"] = context.get("calls", 0) + 1
+        contexts.append(context)
+        return value, []
+
+    schema = FastInt(rules=[rule])
+    schema(1)
+    schema(2)
+
+    assert contexts[0] is not contexts[1]
+    assert contexts[1] == {"calls": 1}
+
+
+def test_equals_goodboy_schema():
+    assert FastInt(less_than=10) == gb.Int(less_than=10)
+    assert gb.Int(less_than=10) == FastInt(less_than=10)
@@ -0,0 +1,153 @@
+import json
+
+import goodboy as gb
+import pytest
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy.column_schemas import (
+    JSONColumnSchemaFactory,
+    column_schema_builder,
+)
+from goodboy_sqlalchemy.json_value import JSONValue
+from goodboy_sqlalchemy.mapped import Mapped
+from tests.conftest import assert_errors
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {},
+        [],
+        {"a": [1, 2.5, None, True, False, "xé\n"], "b": {"c": {}}},
+        [[[]], {"k": -1e100}, float("nan"), float("-inf")],
+        "text",
+        42,
+        None,
+    ],
+)
+def test_measures_serialized_size(value):
+    assert JSONValue(allow_none=True).measure(value) == len(json.dumps(value))
+
+
+@pytest.mark.parametrize("value", [{"a": [1, "é"]}, [{}, None]])
+def test_returns_serialized_size(value):
+    result = JSONValue()(value)
+
+    assert result == value
+    assert result.serialized_size == len(json.dumps(value))
+
+
+def test_returns_serialized_size_of_nested_schema_result():
+    schema = JSONValue(schema=gb.Dict(keys=[gb.Key("a", gb.Int())]))
+    result = schema({"a": "12"}, typecast=True)
+
+    assert result == {"a": 12}
+    assert result.serialized_size == len(json.dumps({"a": 12}))
+
+
+def test_rejects_too_large_documents():
+    schema = JSONValue(max_size=12)
+
+    assert schema({"a": "123"}) == {"a": "123"}
+
+    with assert_errors([gb.Error("json_too_large", {"value": 12})]):
+        schema({"a": "1234567890" * 100000})
+
+
+def test_rejects_too_deep_documents():
+    value = []
+
+    for _ in range(10000):
+        value = [value]
+
+    with assert_errors([gb.Error("json_too_deep", {"value": 32})]):
+        JSONValue(max_depth=32)(value)
+
+    assert JSONValue(max_depth=2)([{"a": 1}]) == [{"a": 1}]
+
+
+def test_rejects_documents_with_too_many_keys():
+    schema = JSONValue(max_keys=3)
+
+    assert schema([{"a": 1}, {"b": 2, "c": 3}]) == [{"a": 1}, {"b": 2, "c": 3}]
+
+    with assert_errors([gb.Error("json_too_many_keys", {"value": 3})]):
+        schema([{"a": 1}, {"b": 2, "c": 3, "d": 4}])
+
+
+def test_rejects_non_json_values():
+    with assert_errors([gb.Error("unexpected_type", {"expected_type": "json"})]):
+        JSONValue()({"a": {1, 2}})
+
+    with assert_errors(
+        [gb.Error("unexpected_type", {"expected_type": gb.type_name("str")})]
+    ):
+        JSONValue()({1: "a"})
+
+
+def test_validates_by_nested_schema():
+    schema = JSONValue(schema=gb.Dict(keys=[gb.Key("a", gb.Int(), required=True)]))
+
+    assert schema({"a": 1}) == {"a": 1}
+
+    with assert_errors(
+        [gb.Error("key_errors", nested_errors={"a": [gb.Error("required_key")]})]
+    ):
+        schema({})
+
+
+def test_column_schema_factory_uses_column_info():
+    column = sa.Column(
+        "dummy",
+        sa.JSON,
+        nullable=True,
+        info={"json_max_depth": 2, "json_schema": gb.Dict()},
+    )
+
+    assert JSONColumnSchemaFactory(max_size=100).build(column) == JSONValue(
+        allow_none=True, max_size=100, max_depth=2, schema=gb.Dict()
+    )
+
+
+def test_json_columns_accept_any_documents():
+    schema = column_schema_builder.build(sa.Column("dummy", sa.JSON))
+
+    assert isinstance(schema, JSONValue)
+    assert schema([1, "a"]) == [1, "a"]
+    assert schema("a") == "a"
+
+
+def test_postgresql_json_columns_accept_only_objects():
+    import sqlalchemy.dialects.postgresql as sa_pg
+
+    for sa_type in [sa_pg.JSON, sa_pg.JSONB]:
+        schema = column_schema_builder.build(sa.Column("dummy", sa_type))
+
+        assert isinstance(schema, JSONValue)
+        assert schema({"a": [1]}) == {"a": [1]}
+
+        with assert_errors(
+            [gb.Error("unexpected_type", {"expected_type": gb.type_name("dict")})]
+        ):
+            schema([1])
+
+
+def test_validated_documents_can_be_inserted():
+    Base = sa.orm.declarative_base()
+
+    class Document(Base):
+        __tablename__ = "documents"
+
+        id = sa.Column(sa.Integer, primary_key=True)
+        body = sa.Column(sa.JSON, nullable=False, info={"json_max_depth": 3})
+
+    engine = sa.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    schema = Mapped(Document, column_names=["body"])
+
+    with sa.orm.Session(engine) as session:
+        result = schema({"body": {"a": [1]}}, context={"session": session})
+        session.add(Document(**result))
+        session.flush()
+
+        assert session.scalar(sa.select(Document.body)) == {"a": [1]}
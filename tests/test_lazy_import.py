@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+
+import goodboy_sqlalchemy
+
+
+def run_python(code: str) -> str:
+    package_path = os.path.dirname(os.path.dirname(goodboy_sqlalchemy.__file__))
+    env = {**os.environ, "PYTHONPATH": package_path}
+
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def test_package_import_does_not_load_submodules():
+    output = run_python(
+        "import sys, goodboy_sqlalchemy\n"
+        "print(sorted(m for m in sys.modules if m.startswith('goodboy_sqlalchemy.')))\n"
+        "print('sqlalchemy' in sys.modules)\n"
+    )
+
+    assert output.split("\n")[:2] == ["[]", "False"]
+
+
+def test_schema_usage_does_not_load_dialect_packages():
+    output = run_python(
+        "import sys, goodboy_sqlalchemy as gs, sqlalchemy as sa, sqlalchemy.orm\n"
+        "Base = sa.orm.declarative_base()\n"
+        "class User(Base):\n"
+        "    __tablename__ = 'users'\n"
+        "    id = sa.Column(sa.Integer, primary_key=True)\n"
+        "    name = sa.Column(sa.String)\n"
+        "gs.Mapped(User, column_names=['name'])\n"
+        "print('sqlalchemy.dialects.postgresql' in sys.modules)\n"
+    )
+
+    assert output.strip() == "False"
+
+
+def test_lazy_attributes():
+    from goodboy_sqlalchemy.mapped import Mapped, MappedInstanceProxy
+
+    assert goodboy_sqlalchemy.Mapped is Mapped
+    assert goodboy_sqlalchemy.MappedInstanceProxy is MappedInstanceProxy
+    assert set(goodboy_sqlalchemy.__all__) <= set(dir(goodboy_sqlalchemy))
+
+    for name in goodboy_sqlalchemy.__all__:
+        getattr(goodboy_sqlalchemy, name)
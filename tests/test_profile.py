@@ -0,0 +1,97 @@
+import io
+import json
+import sys
+import textwrap
+
+import pytest
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy.column import ColumnBuilder
+from goodboy_sqlalchemy.mapped import Mapped
+from goodboy_sqlalchemy.profile import PHASES, Profiler, format_table, main
+
+SCHEMAS_MODULE = """
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy.mapped import Mapped
+
+Base = sa.orm.declarative_base()
+
+
+class Author(Base):
+    __tablename__ = "authors"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String(100), nullable=False, unique=True)
+
+
+class Book(Base):
+    __tablename__ = "books"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    title = sa.Column(sa.String(100), nullable=False)
+    price = sa.Column(sa.Numeric(10, 2))
+
+
+author_schema = Mapped(Author, column_names=["name"])
+book_schema = Mapped(Book, column_names=["title", "price"])
+book_update_schema = Mapped(Book, column_names=["title"])
+"""
+
+
+@pytest.fixture()
+def schemas_module(tmp_path, monkeypatch):
+    (tmp_path / "profiled_schemas.py").write_text(textwrap.dedent(SCHEMAS_MODULE))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "profiled_schemas"
+    sys.modules.pop("profiled_schemas", None)
+
+
+def test_profiles_schema_construction(schemas_module):
+    profiler = Profiler()
+
+    with profiler.profiling():
+        __import__(schemas_module)
+
+    assert [p.model for p in profiler.profiles] == ["Author", "Book", "Book"]
+    assert "profiled_schemas.py:" in profiler.profiles[0].location
+
+    for profile in profiler.profiles:
+        assert profile.seconds > 0
+        assert set(profile.phases) == set(PHASES)
+        assert profile.phases["columns"] > 0
+        assert profile.phases["keys"] > 0
+        assert sum(profile.phases.values()) == pytest.approx(profile.seconds)
+        assert profile.memory > 0
+
+    models = profiler.slowest_models()
+
+    assert {m["model"]: m["schemas"] for m in models} == {"Author": 1, "Book": 2}
+    assert models[0]["seconds"] >= models[1]["seconds"]
+    assert "slowest models" in format_table(profiler)
+
+
+def test_restores_patched_methods():
+    init = Mapped.__init__
+    build = ColumnBuilder.build
+    inspect = sa.inspect
+
+    with pytest.raises(ZeroDivisionError):
+        with Profiler().profiling():
+            1 / 0
+
+    assert Mapped.__init__ is init
+    assert ColumnBuilder.build is build
+    assert sa.inspect is inspect
+
+
+def test_prints_json_report(schemas_module):
+    stdout = io.StringIO()
+
+    assert main([schemas_module, "--json", "--top", "1"], stdout) == 0
+
+    report = json.loads(stdout.getvalue())
+
+    assert len(report["schemas"]) == 1
+    assert len(report["models"]) == 1
+    assert report["seconds"] >= report["schemas"][0]["seconds"]
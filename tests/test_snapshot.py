@@ -0,0 +1,158 @@
+import goodboy as gb
+import pytest
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy import mapped_key
+from goodboy_sqlalchemy import snapshot as snapshot_module
+from goodboy_sqlalchemy.column import Column
+from goodboy_sqlalchemy.mapped import Mapped
+from goodboy_sqlalchemy.snapshot import SchemaSnapshot, SnapshotError
+from tests.conftest import assert_dict_value_errors
+
+engine = sa.create_engine("sqlite://")
+Session = sa.orm.sessionmaker(engine)
+Base = sa.orm.declarative_base()
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String(32), nullable=False, unique=True)
+    nickname = sa.Column("nick", sa.String, default="anon")
+    interval = sa.Column(sa.Interval)
+    settings = sa.Column(sa.JSON, info={"json_max_size": 1024})
+
+
+Base.metadata.create_all(engine)
+
+
+@pytest.fixture()
+def session():
+    try:
+        session = Session()
+        yield session
+    finally:
+        session.rollback()
+
+
+@pytest.fixture()
+def snapshot():
+    snapshot = SchemaSnapshot()
+    snapshot.add(User)
+
+    return SchemaSnapshot.loads(snapshot.dumps())
+
+
+def test_snapshot_columns_equal_built_columns(snapshot):
+    built = Mapped(User, column_names=["name", "nickname"])
+    loaded = Mapped(User, column_names=["name", "nickname"], snapshot=snapshot)
+
+    assert loaded._keys == built._keys
+    assert loaded._keys == (
+        Column("name", gb.Str(max_length=32), required=True, unique=True),
+        Column("nickname", gb.Str(allow_none=True), required=False, default="anon"),
+    )
+
+
+def test_snapshot_raises_for_columns_of_unmapped_types(snapshot):
+    with pytest.raises(SnapshotError):
+        Mapped(User, column_names=["interval"], snapshot=snapshot)
+
+
+def test_schema_loaded_from_snapshot_validates(snapshot, session):
+    schema = Mapped(User, column_names=["name", "nickname"], snapshot=snapshot)
+
+    session.add(User(name="Marty"))
+    session.flush()
+
+    assert schema({"name": "Doc"}, context={"session": session}) == {
+        "name": "Doc",
+        "nickname": "anon",
+    }
+
+    with assert_dict_value_errors({"name": [gb.Error("already_exists")]}):
+        schema({"name": "Marty"}, context={"session": session})
+
+
+def test_snapshot_file_roundtrip(tmp_path):
+    snapshot = SchemaSnapshot()
+    snapshot.add(User, ["name"])
+    snapshot.dump(str(tmp_path / "schemas.snapshot"))
+
+    loaded = SchemaSnapshot.load(str(tmp_path / "schemas.snapshot"))
+
+    assert loaded.get(User).columns == {
+        "name": Column("name", gb.Str(max_length=32), required=True, unique=True)
+    }
+
+
+def test_stale_snapshot_is_rejected(snapshot):
+    metadata = sa.MetaData()
+    changed_table = sa.Table(
+        "users",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("name", sa.String(64), nullable=False, unique=True),
+    )
+
+    class ChangedUser:
+        pass
+
+    ChangedUser.__module__ = User.__module__
+    ChangedUser.__qualname__ = User.__qualname__
+    sa.orm.registry().map_imperatively(ChangedUser, changed_table)
+
+    with pytest.raises(SnapshotError):
+        Mapped(ChangedUser, column_names=["name"], snapshot=snapshot)
+
+
+def test_snapshot_with_changed_column_info_is_rejected(snapshot):
+    metadata = sa.MetaData()
+    changed_table = sa.Table(
+        "users",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("name", sa.String(32), nullable=False, unique=True),
+        sa.Column("nick", sa.String, default="anon"),
+        sa.Column("interval", sa.Interval),
+        sa.Column("settings", sa.JSON, info={"json_max_size": 2048}),
+    )
+
+    class ChangedUser:
+        pass
+
+    ChangedUser.__module__ = User.__module__
+    ChangedUser.__qualname__ = User.__qualname__
+    sa.orm.registry().map_imperatively(ChangedUser, changed_table)
+
+    with pytest.raises(SnapshotError):
+        Mapped(ChangedUser, column_names=["settings"], snapshot=snapshot)
+
+
+def test_snapshot_keys_are_restored_without_introspection(snapshot, monkeypatch):
+    built = Mapped(User, column_names=["name", "nickname"])
+
+    def column_unique_criteria(sa_column):
+        raise AssertionError("unique criteria are introspected")
+
+    monkeypatch.setattr(mapped_key, "column_unique_criteria", column_unique_criteria)
+    loaded = Mapped(User, column_names=["name", "nickname"], snapshot=snapshot)
+
+    assert loaded._mapped_keys == built._mapped_keys
+
+
+def test_fingerprint_is_computed_once_per_class(snapshot, monkeypatch):
+    Mapped(User, column_names=["name"], snapshot=snapshot)
+
+    def table_fingerprint(table):
+        raise AssertionError("fingerprint is computed again")
+
+    monkeypatch.setattr(snapshot_module, "_table_fingerprint", table_fingerprint)
+
+    Mapped(User, column_names=["name"], snapshot=snapshot)
+
+
+def test_invalid_snapshot_is_rejected():
+    with pytest.raises(SnapshotError):
+        SchemaSnapshot.loads(b"oops")
@@ -0,0 +1,195 @@
+import goodboy as gb
+import pytest
+import sqlalchemy as sa
+
+from goodboy_sqlalchemy.batch import ListErrorSink
+from goodboy_sqlalchemy.column import Column
+from goodboy_sqlalchemy.table import TableSchema, TableSchemaError
+from tests.conftest import assert_dict_key_errors, assert_dict_value_errors
+
+# Use in-memory SQLite
+engine = sa.create_engine("sqlite://")
+metadata = sa.MetaData()
+
+categories = sa.Table(
+    "categories",
+    metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("name", sa.String(50), nullable=False),
+)
+
+products = sa.Table(
+    "products",
+    metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("sku", sa.String(20), nullable=False, unique=True),
+    sa.Column("name", sa.String(100), nullable=False),
+    sa.Column("category_id", sa.ForeignKey("categories.id")),
+    sa.Column("price", sa.Numeric(10, 2)),
+    sa.Column("status", sa.String(10), nullable=False, default="draft"),
+    sa.Column("created_at", sa.DateTime, server_default=sa.func.now()),
+)
+
+vendors = sa.Table(
+    "vendors",
+    metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("email", sa.String(100), nullable=False),
+)
+
+sa.Index("ix_vendors_email", sa.func.lower(vendors.c.email), unique=True)
+
+metadata.create_all(engine)
+
+
+@pytest.fixture()
+def connection():
+    with engine.connect() as connection:
+        with connection.begin() as transaction:
+            connection.execute(categories.insert(), [{"id": 1, "name": "Books"}])
+            connection.execute(
+                products.insert(), [{"sku": "B-1", "name": "Book", "category_id": 1}]
+            )
+            yield connection
+            transaction.rollback()
+
+
+@pytest.fixture()
+def context(connection):
+    return {"connection": connection}
+
+
+@pytest.fixture()
+def statements():
+    result = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        result.append(statement)
+
+    sa.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield result
+    sa.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture()
+def schema():
+    return TableSchema(
+        products,
+        column_names=["sku", "name", "category_id", "price", "status", "created_at"],
+    )
+
+
+def test_returns_insert_parameters(schema, context):
+    assert schema({"sku": "B-2", "name": "Album"}, context=context) == {
+        "sku": "B-2",
+        "name": "Album",
+        "category_id": None,
+        "price": None,
+        "status": "draft",
+    }
+
+
+def test_validates_keys(schema, context):
+    with assert_dict_key_errors(
+        {"name": [gb.Error("required_key")], "color": [gb.Error("unknown_key")]}
+    ):
+        schema({"sku": "B-2", "color": "red"}, context=context)
+
+    with assert_dict_value_errors(
+        {
+            "sku": [gb.Error("already_exists")],
+            "category_id": [gb.Error("does_not_exist")],
+        }
+    ):
+        schema({"sku": "B-1", "name": "Book", "category_id": 2}, context=context)
+
+
+def test_supports_custom_keys(context):
+    schema = TableSchema(
+        products,
+        keys=[Column("code", gb.Str(), mapped_column_name="sku", unique=True)],
+        column_names=["name"],
+    )
+
+    assert schema({"code": "B-2", "name": "Album"}, context=context) == {
+        "sku": "B-2",
+        "name": "Album",
+    }
+
+    with assert_dict_value_errors({"code": [gb.Error("already_exists")]}):
+        schema({"code": "B-1", "name": "Album"}, context=context)
+
+
+def test_requires_connection(schema):
+    with pytest.raises(TableSchemaError):
+        schema({"sku": "B-2", "name": "Album"}, context={})
+
+
+def test_validates_many_rows_for_executemany(schema, context, connection, statements):
+    values = [
+        {"sku": "B-2", "name": "Album", "category_id": 1},
+        {"sku": "B-1", "name": "Book"},
+        {"sku": "B-3", "name": "Game", "price": "9.99"},
+        {"sku": "B-3", "name": "Game"},
+        {"sku": "B-4", "name": "Toy", "category_id": 2},
+        {"sku": "B-5"},
+    ]
+    sink = ListErrorSink()
+
+    rows = [
+        row
+        for _, row in schema.validate_many(
+            values, typecast=True, context=context, errors=sink, chunk_size=5
+        )
+    ]
+
+    assert [row["sku"] for row in rows] == ["B-2", "B-3"]
+    assert set(sink.errors) == {1, 3, 4, 5}
+    # one query per column and check for the chunk of valid rows
+    assert len(statements) == 2
+
+    connection.execute(products.insert(), rows)
+
+    assert connection.execute(
+        sa.select(products.c.sku, products.c.status).order_by(products.c.sku)
+    ).all() == [("B-1", "draft"), ("B-2", "draft"), ("B-3", "draft")]
+
+
+def test_validates_many_rows_against_rows_of_previous_chunks(context):
+    schema = TableSchema(vendors, column_names=["email"])
+    values = [
+        {"email": "marty@hv.com"},
+        {"email": "doc@hv.com"},
+        {"email": "MARTY@hv.com"},
+    ]
+    sink = ListErrorSink()
+
+    rows = list(
+        schema.validate_many(values, context=context, errors=sink, chunk_size=2)
+    )
+
+    assert [index for index, _ in rows] == [0, 1]
+    assert sink.errors == {
+        2: [
+            gb.Error(
+                "value_errors", nested_errors={"email": [gb.Error("already_exists")]}
+            )
+        ]
+    }
+
+
+def test_validates_many_rows_against_each_other_with_functional_index(context):
+    schema = TableSchema(vendors, column_names=["email"])
+    values = [{"email": "Marty@HV.com"}, {"email": "marty@hv.com"}]
+    sink = ListErrorSink()
+
+    assert list(schema.validate_many(values, context=context, errors=sink)) == [
+        (0, {"email": "Marty@HV.com"})
+    ]
+    assert sink.errors == {
+        1: [
+            gb.Error(
+                "value_errors", nested_errors={"email": [gb.Error("already_exists")]}
+            )
+        ]
+    }